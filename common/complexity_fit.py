@@ -0,0 +1,218 @@
+"""Модуль эмпирической оценки асимптотической сложности по замерам.
+
+Ряд замеров (n, t) приближается методом наименьших квадратов моделями
+t ~ a * f(n) + b для f из COMPLEXITY_MODELS. Невязка считается
+в относительных единицах: замеры на малых и больших n различаются
+на порядки, и абсолютные отклонения больших n иначе подавили бы
+остальные. Лучшей считается самая простая модель, невязка которой
+близка к наименьшей: при шуме в замерах модель с лишним ростом
+(например, O(n^2) с ничтожным коэффициентом для O(1)) может
+оказаться чуть точнее истинной.
+"""
+
+import math
+import warnings
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Показатель 2^n переполняет float64 уже при n > 1023.
+MAX_EXPONENTIAL_N = 1000
+
+COMPLEXITY_MODELS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'O(1)': np.ones_like,
+    'O(log n)': np.log2,
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * np.log2(n),
+    'O(n^2)': lambda n: n * n,
+    'O(2^n)': np.exp2,
+}
+
+# Модель считается не хуже лучшей, если ее невязка превышает
+# наименьшую не более чем в SIMPLICITY_MARGIN раз.
+SIMPLICITY_MARGIN = 1.25
+
+# Во сколько раз невязка заявленной модели может превышать
+# невязку лучшей, прежде чем выдается предупреждение.
+DEFAULT_TOLERANCE = 2.0
+
+
+class ComplexityWarning(UserWarning):
+    """Замеры не согласуются с заявленной сложностью."""
+
+
+@dataclass
+class ComplexityFit:
+    """Результат приближения ряда замеров одной моделью."""
+
+    model: str
+    coefficient: float
+    intercept: float
+    residual: float
+
+    def predict(self, n: float) -> float:
+        """Значение модели в точке n."""
+        f = COMPLEXITY_MODELS[self.model](np.array([float(n)]))[0]
+        return self.coefficient * f + self.intercept
+
+    def __str__(self) -> str:
+        term = self.model[2:-1]
+        if self.model == 'O(1)':
+            formula = f'{self.intercept:.3g}'
+        else:
+            formula = (f'{self.coefficient:.3g} * {term} '
+                       f'{"+" if self.intercept >= 0 else "-"} '
+                       f'{abs(self.intercept):.3g}')
+        return (f'{self.model:<11} t ~ {formula} '
+                f'(отклонение {self.residual:.1%})')
+
+
+def fit_model(
+    sizes: Sequence[float], times: Sequence[float], model: str
+) -> ComplexityFit:
+    """
+    Приближение замеров моделью t ~ a * f(n) + b.
+
+    Решается взвешенная задача наименьших квадратов с весами 1 / t,
+    то есть минимизируются относительные отклонения. Модель роста
+    с неположительным коэффициентом a считается неподходящей
+    (невязка - бесконечность). Относительные отклонения не определены
+    для нулевых замеров (например, нулевого числа обменов), поэтому
+    замеры должны быть положительными.
+
+    Args:
+        sizes: Размеры входа n (положительные).
+        times: Время (или число операций) для каждого размера,
+            положительное.
+        model: Ключ COMPLEXITY_MODELS.
+
+    Returns:
+        Коэффициенты и относительная среднеквадратичная невязка.
+
+    Raises:
+        ValueError: Если есть неположительные или бесконечные замеры.
+    """
+    n = np.asarray(sizes, dtype=np.float64)
+    t = np.asarray(times, dtype=np.float64)
+    if not np.all(np.isfinite(t)) or np.any(t <= 0):
+        raise ValueError("Measurements must be positive and finite")
+
+    # Задача решается для t / max(t), чтобы веса не переполнялись
+    # на очень малых замерах; коэффициенты затем масштабируются обратно.
+    scale = float(t.max())
+    t = t / scale
+    weights = 1.0 / np.maximum(t, np.finfo(np.float64).eps)
+
+    if model == 'O(1)':
+        intercept = float(np.sum(t * weights ** 2) / np.sum(weights ** 2))
+        coefficient = 0.0
+    else:
+        if model == 'O(2^n)' and n.max() > MAX_EXPONENTIAL_N:
+            return ComplexityFit(model, math.nan, math.nan, math.inf)
+
+        f = COMPLEXITY_MODELS[model](n)
+        design = np.column_stack([f, np.ones_like(f)]) * weights[:, None]
+        (coefficient, intercept), *_ = np.linalg.lstsq(
+            design, t * weights, rcond=None
+        )
+        coefficient, intercept = float(coefficient), float(intercept)
+        if coefficient <= 0:
+            return ComplexityFit(
+                model, coefficient * scale, intercept * scale, math.inf
+            )
+
+    fitted = ComplexityFit(model, coefficient, intercept, 0.0)
+    predicted = np.array([fitted.predict(x) for x in n])
+    fitted.residual = float(np.sqrt(np.mean(((predicted - t) * weights) ** 2)))
+    fitted.coefficient *= scale
+    fitted.intercept *= scale
+    return fitted
+
+
+def fit_complexity(
+    sizes: Sequence[float], times: Sequence[float]
+) -> List[ComplexityFit]:
+    """
+    Приближение замеров всеми моделями.
+
+    Returns:
+        Первой идет лучшая модель - самая простая (в порядке
+        COMPLEXITY_MODELS) из тех, чья невязка не больше наименьшей,
+        умноженной на SIMPLICITY_MARGIN; остальные - по возрастанию
+        невязки.
+    """
+    if len(sizes) != len(times):
+        raise ValueError("Sizes and times must have the same length")
+    if len(sizes) < 3:
+        raise ValueError("At least three measurements are required")
+    if min(sizes) <= 0:
+        raise ValueError("Sizes must be positive")
+
+    fits = [fit_model(sizes, times, model) for model in COMPLEXITY_MODELS]
+    smallest = min(fit.residual for fit in fits)
+    best = next(
+        fit for fit in fits if fit.residual <= smallest * SIMPLICITY_MARGIN
+    )
+
+    others = sorted(
+        (fit for fit in fits if fit is not best),
+        key=lambda fit: fit.residual
+    )
+    return [best] + others
+
+
+def check_complexity(
+    sizes: Sequence[float],
+    times: Sequence[float],
+    declared: str,
+    label: Optional[str] = None,
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[ComplexityFit]:
+    """
+    Проверка замеров на соответствие заявленной сложности.
+
+    Если лучшая модель отличается от заявленной и невязка заявленной
+    больше невязки лучшей более чем в tolerance раз, выдается
+    предупреждение ComplexityWarning.
+
+    Args:
+        sizes: Размеры входа.
+        times: Замеры.
+        declared: Заявленная сложность (ключ COMPLEXITY_MODELS).
+        label: Название ряда для сообщения.
+        tolerance: Допустимое отношение невязок.
+
+    Returns:
+        Результат fit_complexity.
+    """
+    if declared not in COMPLEXITY_MODELS:
+        raise ValueError(f"Unknown complexity model: {declared}")
+
+    fits = fit_complexity(sizes, times)
+    best = fits[0]
+    declared_fit = next(fit for fit in fits if fit.model == declared)
+
+    if (best.model != declared and
+            declared_fit.residual > tolerance * best.residual):
+        name = f'{label}: ' if label else ''
+        warnings.warn(
+            f"{name}measurements fit {best.model} "
+            f"(residual {best.residual:.1%}) better than declared "
+            f"{declared} (residual {declared_fit.residual:.1%})",
+            ComplexityWarning, stacklevel=2
+        )
+
+    return fits
+
+
+def format_fit_report(
+    label: str, fits: List[ComplexityFit], declared: Optional[str] = None
+) -> str:
+    """Текстовый отчет: лучшая модель и, если отличается, заявленная."""
+    best = fits[0]
+    lines = [f'{label}: лучшая модель {best}']
+    if declared is not None and declared != best.model:
+        declared_fit = next(fit for fit in fits if fit.model == declared)
+        lines.append(f'{" " * len(label)}  заявлена    {declared_fit}')
+    return '\n'.join(lines)
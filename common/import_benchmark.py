@@ -0,0 +1,148 @@
+"""Модуль контроля времени импорта точек входа лабораторных.
+
+Каждая точка входа импортируется в отдельном интерпретаторе
+с ключом -X importtime, и его отчет разбирается: берется накопленное
+время импорта модуля и список загруженных пакетов. Регрессией
+считается превышение бюджета времени или загрузка тяжелых пакетов
+(HEAVY_MODULES), которые должны подключаться только при построении
+графиков и векторизованных вычислениях.
+
+Запуск: python common/import_benchmark.py [--budget-ms 250] [lab_01 ...]
+Код возврата 1 означает найденную регрессию.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Точка входа -> (каталог относительно корня, имя модуля).
+ENTRY_POINTS = {
+    'lab_00': ('lab_00', 'sum_analysis'),
+    'lab_01': ('lab_01', 'search_comparison'),
+    'lab_03': (os.path.join('lab_03', 'src'), 'main'),
+    'lab_05': (os.path.join('lab_05', 'src'), 'performance_analysis'),
+}
+
+HEAVY_MODULES = ('matplotlib', 'numpy', 'pandas')
+DEFAULT_BUDGET_MS = 250.0
+DEFAULT_REPEATS = 5
+
+
+def parse_importtime(report: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Разбор вывода python -X importtime.
+
+    Строки вида 'import time: self | cumulative | [отступ]пакет';
+    глубина вложенности определяется отступом (два пробела на уровень).
+
+    Returns:
+        Список (пакет, глубина, собственное время, накопленное время)
+        в микросекундах в порядке отчета.
+    """
+    records = []
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|', 2)
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(
+            (name.strip(), depth, int(fields[0]), int(fields[1]))
+        )
+    return records
+
+
+def _run_import(directory: str, module: str) -> str:
+    """Импорт модуля в новом интерпретаторе; возвращает отчет importtime."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=directory, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"Import of {module} failed:\n{process.stderr[-2000:]}"
+        )
+    return process.stderr
+
+
+def measure_import(
+    directory: str, module: str, repeats: int = DEFAULT_REPEATS
+) -> Dict[str, Any]:
+    """
+    Время импорта модуля module из каталога directory.
+
+    Первый запуск может включать компиляцию .pyc, поэтому берется
+    минимум по repeats запускам.
+
+    Returns:
+        Словарь: cumulative_ms - накопленное время импорта модуля,
+        heavy - загруженные тяжелые пакеты, slowest - пять пакетов
+        с наибольшим собственным временем (имя, мс).
+    """
+    best: List[Tuple[str, int, int, int]] = []
+    best_total = None
+    for _ in range(repeats):
+        records = parse_importtime(_run_import(directory, module))
+        total = next(
+            cumulative for name, depth, _, cumulative in reversed(records)
+            if name == module and depth == 0
+        )
+        if best_total is None or total < best_total:
+            best, best_total = records, total
+
+    loaded = {name.split('.')[0] for name, _, _, _ in best}
+    slowest = sorted(best, key=lambda record: record[2], reverse=True)[:5]
+    return {
+        'cumulative_ms': best_total / 1000,
+        'heavy': sorted(loaded.intersection(HEAVY_MODULES)),
+        'slowest': [(name, own / 1000) for name, _, own, _ in slowest],
+    }
+
+
+def main() -> None:
+    """Проверка времени импорта точек входа."""
+    parser = argparse.ArgumentParser(
+        description='Контроль времени импорта точек входа лабораторных'
+    )
+    parser.add_argument(
+        'entries', nargs='*', metavar='ENTRY',
+        help=f"Точки входа: {', '.join(ENTRY_POINTS)} (по умолчанию - все)"
+    )
+    parser.add_argument(
+        '--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+        help='Допустимое время импорта одной точки входа, мс'
+    )
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args()
+    unknown = set(args.entries).difference(ENTRY_POINTS)
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(sorted(unknown))}")
+
+    failed = False
+    print(f"{'Точка входа':<12} {'Импорт (мс)':>12}  Тяжелые пакеты")
+    for entry in args.entries or ENTRY_POINTS:
+        directory, module = ENTRY_POINTS[entry]
+        result = measure_import(
+            os.path.join(ROOT, directory), module, args.repeats
+        )
+        heavy = ', '.join(result['heavy']) or '-'
+        print(f"{entry:<12} {result['cumulative_ms']:>12.1f}  {heavy}")
+
+        if result['heavy'] or result['cumulative_ms'] > args.budget_ms:
+            failed = True
+            slowest = ', '.join(
+                f'{name} {ms:.1f}' for name, ms in result['slowest']
+            )
+            print(f"{'':<12} регрессия; дольше всего: {slowest}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
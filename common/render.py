@@ -0,0 +1,227 @@
+"""Модуль фоновой отрисовки графиков с кешированием.
+
+Графики строятся функциями отрисовки draw(*args, **kwargs), которые
+заполняют текущую фигуру pyplot и ничего не сохраняют и не
+показывают. render_figure передает такую функцию и данные в отдельный
+процесс, где фигура сохраняется в файл на бэкенде Agg, поэтому
+вычисления не ждут отрисовку, а отсутствие дисплея (CI, сервер)
+не приводит к ошибкам и блокировкам в plt.show().
+
+Для каждого файла запоминается хеш входных данных и исходного кода
+функции отрисовки; если они не изменились и файл на месте, повторная
+отрисовка пропускается. Функция отрисовки должна быть определена
+на верхнем уровне модуля, а данные - сериализуемы pickle.
+"""
+
+import atexit
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+RENDER_WORKERS = 2
+DPI = 300
+DEFAULT_MANIFEST = os.path.join(
+    tempfile.gettempdir(), 'lab_plots', 'manifest.json'
+)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_pending: List[Tuple[Future, str, str]] = []
+_manifest: Optional[Dict[str, Dict[str, Any]]] = None
+_manifest_lock = threading.Lock()
+
+
+def has_display() -> bool:
+    """Есть ли дисплей для интерактивного окна matplotlib."""
+    if sys.platform in ('win32', 'darwin'):
+        return True
+    return bool(os.environ.get('DISPLAY') or
+                os.environ.get('WAYLAND_DISPLAY'))
+
+
+def ensure_backend() -> None:
+    """
+    Выбор бэкенда Agg, если дисплея нет и бэкенд не задан явно.
+
+    Пока matplotlib не импортирован, бэкенд задается переменной
+    окружения (ее наследуют и процессы отрисовки), чтобы не загружать
+    matplotlib раньше, чем понадобится график.
+    """
+    if has_display() or 'MPLBACKEND' in os.environ:
+        return
+    if 'matplotlib' in sys.modules:
+        sys.modules['matplotlib'].use('Agg')
+    else:
+        os.environ['MPLBACKEND'] = 'Agg'
+
+
+ensure_backend()
+
+
+def data_hash(draw: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+    """Хеш функции отрисовки и ее аргументов."""
+    try:
+        source = inspect.getsource(draw)
+    except (OSError, TypeError):
+        source = ''
+    payload = pickle.dumps(
+        (draw.__module__, draw.__qualname__, source, DPI, args, kwargs),
+        protocol=4
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _load_manifest() -> Dict[str, Dict[str, Any]]:
+    """Хеши ранее отрисованных файлов (читаются один раз)."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(DEFAULT_MANIFEST, encoding='utf-8') as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _file_state(path: str) -> Optional[Dict[str, int]]:
+    """Размер и время изменения файла (None, если файла нет)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _is_current(path: str, digest: str) -> bool:
+    """Файл отрисован из тех же данных и с тех пор не менялся."""
+    with _manifest_lock:
+        entry = _load_manifest().get(path)
+    if entry is None or entry['hash'] != digest:
+        return False
+    return _file_state(path) == entry['state']
+
+
+def _remember(path: str, digest: str) -> None:
+    """Атомарная запись хеша отрисованного файла в манифест."""
+    state = _file_state(path)
+    if state is None:
+        return
+    with _manifest_lock:
+        manifest = _load_manifest()
+        manifest[path] = {'hash': digest, 'state': state}
+
+        os.makedirs(os.path.dirname(DEFAULT_MANIFEST), exist_ok=True)
+        tmp_path = f'{DEFAULT_MANIFEST}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, DEFAULT_MANIFEST)
+
+
+def _init_worker() -> None:
+    """Процесс отрисовки никогда не открывает окна."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def _draw_and_save(search_path: List[str], task: bytes, path: str) -> str:
+    """
+    Отрисовка и сохранение фигуры (выполняется в процессе).
+
+    Функция отрисовки и данные передаются сериализованными
+    и восстанавливаются после дополнения sys.path путями родителя:
+    модуль с функцией мог быть импортирован уже после запуска пула.
+    """
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    sys.path.extend(p for p in search_path if p not in sys.path)
+    draw, args, kwargs = pickle.loads(task)
+
+    # Стили, заданные функцией отрисовки, не переходят
+    # на следующие графики того же процесса.
+    with matplotlib.rc_context():
+        try:
+            draw(*args, **kwargs)
+            plt.savefig(path, dpi=DPI, bbox_inches='tight')
+        finally:
+            plt.close('all')
+    return path
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Пул процессов отрисовки (создается при первом обращении)."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=RENDER_WORKERS, initializer=_init_worker
+        )
+    return _executor
+
+
+def render_figure(
+    output_path: str,
+    draw: Callable[..., Any],
+    *args: Any,
+    show: bool = False,
+    **kwargs: Any
+) -> Optional[Future]:
+    """
+    Отрисовка графика draw(*args, **kwargs) в файл output_path.
+
+    По умолчанию отрисовка выполняется в фоновом процессе, и функция
+    сразу возвращает Future; дождаться всех графиков можно через
+    wait_for_renders. Если файл уже отрисован из тех же данных,
+    ничего не делается и возвращается None.
+
+    Args:
+        output_path: Файл изображения.
+        draw: Функция отрисовки верхнего уровня модуля.
+        show: Отрисовать в текущем процессе и показать окно
+            (только при наличии дисплея; иначе флаг игнорируется).
+    """
+    path = os.path.abspath(output_path)
+    digest = data_hash(draw, *args, **kwargs)
+
+    if show and has_display():
+        import matplotlib.pyplot as plt
+
+        draw(*args, **kwargs)
+        plt.savefig(path, dpi=DPI, bbox_inches='tight')
+        _remember(path, digest)
+        plt.show()
+        return None
+
+    if _is_current(path, digest):
+        return None
+
+    task = pickle.dumps((draw, args, kwargs))
+    future = _get_executor().submit(_draw_and_save, sys.path, task, path)
+    _pending.append((future, path, digest))
+    return future
+
+
+def wait_for_renders() -> List[str]:
+    """
+    Ожидание всех запущенных отрисовок и запись их хешей в манифест.
+
+    Returns:
+        Пути отрисованных файлов. Ошибка отрисовки пробрасывается
+        после записи хешей успешно отрисованных файлов.
+    """
+    tasks = _pending[:]
+    _pending.clear()
+    wait([future for future, _, _ in tasks])
+
+    for future, path, digest in tasks:
+        if future.exception() is None:
+            _remember(path, digest)
+    return [future.result() for future, _, _ in tasks]
+
+
+atexit.register(wait_for_renders)
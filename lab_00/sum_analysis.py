@@ -1,10 +1,21 @@
 # sum_analysis.py
 
+import argparse
+import os
 import random
+import sys
 import timeit
-from typing import Callable, List
+from typing import Callable, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'common'
+))
+from render import render_figure, wait_for_renders  # noqa: E402
+
+# Размеры массивов и число запусков для усреднения по умолчанию
+DEFAULT_SIZES: List[int] = [1000, 5000, 10000, 50000, 100000, 500000]
+DEFAULT_REPEATS = 10
+DEFAULT_OUTPUT = 'time_complexity_plot.png'
 
 
 # Исходная простая задача
@@ -44,73 +55,150 @@ def measure_execution_time(
     return (end_time - start_time) * 1000  # Конвертация в миллисекунды
 
 
+# Построение графика (выполняется в фоновом процессе render_figure)
+def _draw_time_complexity(sizes: List[int], times: List[float]) -> None:
+    """Рисует график зависимости времени выполнения от размера массива."""
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(sizes, times, 'bo-', label='Измеренное время')
+    plt.xlabel('Размер массива (N)')
+    plt.ylabel('Время выполнения (мс)')
+    plt.title('Зависимость времени выполнения от размера массива\n'
+              'Сложность: O(N)')
+    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
+    plt.legend()
+
+
 # Характеристики ПК
-pc_info: str = """
+PC_INFO: str = """
 Характеристики ПК для тестирования:
 - Процессор: Intel Core i5-13420H (2.10 GHz)
 - Оперативная память: 16 GB DDR5
 - ОС: Windows 11
 - Python: 3.11
 """
-print(pc_info)
+
 
 # Проведение экспериментов
-sizes: List[int] = [
-    1000, 5000, 10000, 50000, 100000, 500000
-]  # Размеры массивов
-times: List[float] = []  # Время выполнения для каждого размера
-time_per_element_values: List[float] = []  # Храним время на элемент
-
-print("Замеры времени выполнения для алгоритма суммирования массива:")
-print("{:>10} {:>12} {:>15}".format(
-    "Размер (N)", "Время (мс)", "Время/N (мкс)"
-))
+def run_experiment(
+    sizes: List[int],
+    repeats: int = DEFAULT_REPEATS
+) -> Tuple[List[float], List[float]]:
+    """Замеряет sum_array на случайных массивах заданных размеров.
 
-for size in sizes:
-    # Генерация случайного массива заданного размера
-    test_data: List[int] = [random.randint(1, 1000) for _ in range(size)]
+    Время усредняется по repeats запускам на каждом размере.
 
-    # Замер времени выполнения (усреднение на 10 запусках)
-    execution_time: float = timeit.timeit(
-        lambda: sum_array(test_data), number=10
-    ) * 1000 / 10
+    Returns:
+        Время выполнения (мс) и время на один элемент (мкс)
+        для каждого размера.
+    """
+    times: List[float] = []  # Время выполнения для каждого размера
+    time_per_element_values: List[float] = []  # Храним время на элемент
 
-    times.append(execution_time)
-    # мкс на элемент
-    time_per_element: float = (
-        (execution_time * 1000) / size if size > 0 else 0
+    print("Замеры времени выполнения для алгоритма суммирования массива:")
+    print("{:>10} {:>12} {:>15}".format(
+        "Размер (N)", "Время (мс)", "Время/N (мкс)"
+    ))
+
+    for size in sizes:
+        # Генерация случайного массива заданного размера
+        test_data: List[int] = [
+            random.randint(1, 1000) for _ in range(size)
+        ]
+
+        # Замер времени выполнения (усреднение на repeats запусках)
+        execution_time: float = timeit.timeit(
+            lambda: sum_array(test_data), number=repeats
+        ) * 1000 / repeats
+
+        times.append(execution_time)
+        # мкс на элемент
+        time_per_element: float = (
+            (execution_time * 1000) / size if size > 0 else 0
+        )
+        time_per_element_values.append(time_per_element)
+
+        print("{:>10} {:>12.4f} {:>15.4f}".format(
+            size, execution_time, time_per_element
+        ))
+
+    return times, time_per_element_values
+
+
+# Дополнительный анализ: сравнение с теоретической оценкой
+def print_analysis(
+    sizes: List[int],
+    times: List[float],
+    time_per_element_values: List[float]
+) -> None:
+    """Выводит анализ замеров и подобранную модель сложности."""
+    print("\nАнализ результатов:")
+    print("1. Теоретическая сложность алгоритма: O(N)")
+    print("2. Практические замеры показывают линейную зависимость "
+          "времени от N")
+
+    # Используем среднее значение time_per_element
+    if time_per_element_values:
+        avg_time_per_element: float = (
+            sum(time_per_element_values) / len(time_per_element_values)
+        )
+        print("3. Среднее время на один элемент: ~{:.4f} мкс".format(
+            avg_time_per_element
+        ))
+        print("4. Время на один элемент примерно постоянно")
+    else:
+        print("3. Нет данных для анализа времени на элемент")
+
+    # Подбор модели сложности (предупреждение при расхождении с O(N));
+    # для приближения нужно не меньше трех размеров
+    if len(sizes) >= 3:
+        from complexity_fit import check_complexity, format_fit_report
+
+        fits = check_complexity(sizes, times, 'O(n)', 'sum_array')
+        print(format_fit_report('sum_array', fits, 'O(n)'))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Запускает эксперимент с параметрами командной строки."""
+    parser = argparse.ArgumentParser(
+        description='Замеры времени суммирования массива'
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+        help='Размеры массивов'
     )
-    time_per_element_values.append(time_per_element)
+    parser.add_argument(
+        '--repeats', type=int, default=DEFAULT_REPEATS,
+        help='Число запусков для усреднения на каждом размере'
+    )
+    parser.add_argument(
+        '--output', default=DEFAULT_OUTPUT,
+        help='Файл для графика'
+    )
+    parser.add_argument(
+        '--show', action='store_true',
+        help='Показать график в окне (иначе только сохранить в файл)'
+    )
+    args = parser.parse_args(argv)
+    if args.repeats < 1:
+        parser.error('--repeats must be at least 1')
 
-    print("{:>10} {:>12.4f} {:>15.4f}".format(
-        size, execution_time, time_per_element
-    ))
+    print(PC_INFO)
+
+    times, time_per_element_values = run_experiment(args.sizes, args.repeats)
 
-# Построение графика
-plt.figure(figsize=(10, 6))
-plt.plot(sizes, times, 'bo-', label='Измеренное время')
-plt.xlabel('Размер массива (N)')
-plt.ylabel('Время выполнения (мс)')
-plt.title('Зависимость времени выполнения от размера массива\n'
-          'Сложность: O(N)')
-plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-plt.legend()
-plt.savefig('time_complexity_plot.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-# Дополнительный анализ: сравнение с теоретической оценка
-print("\nАнализ результатов:")
-print("1. Теоретическая сложность алгоритма: O(N)")
-print("2. Практические замеры показывают линейную зависимость времени от N")
-
-# Используем среднее значение time_per_element
-if time_per_element_values:
-    avg_time_per_element: float = (
-        sum(time_per_element_values) / len(time_per_element_values)
+    # Построение графика (в фоне, пока выводится анализ)
+    render_figure(
+        args.output, _draw_time_complexity, args.sizes, times,
+        show=args.show
     )
-    print("3. Среднее время на один элемент: ~{:.4f} мкс".format(
-        avg_time_per_element
-    ))
-    print("4. Время на один элемент примерно постоянно")
-else:
-    print("3. Нет данных для анализа времени на элемент")
+
+    print_analysis(args.sizes, times, time_per_element_values)
+
+    wait_for_renders()
+    print(f"\nГрафик сохранен в {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,18 @@
 Содержит реализации алгоритмов и функции для тестирования.
 """
 
+import argparse
+import os
 import random
+import sys
 import timeit
+from concurrent.futures import Future
 from typing import Dict, List, Optional, Callable
 
-import matplotlib.pyplot as plt
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'common'
+))
+from render import render_figure, wait_for_renders  # noqa: E402
 
 
 def linear_search(arr: List[int], target: int) -> Optional[int]:
@@ -173,10 +180,13 @@ def print_comparison_table(results_linear: Dict[int, Dict[str, float]],
     return max_speedup
 
 
-def run_experiment() -> None:
+def run_experiment(show: bool = False) -> None:
     """
     Проведение эксперимента по сравнению производительности поиска.
     Генерация данных, замер времени и построение графиков.
+
+    Args:
+        show: Показать окно с графиками (при наличии дисплея)
     """
     # Константы для эксперимента
     sizes = [1000, 2000, 5000, 10000, 20000, 50000, 100000]
@@ -236,22 +246,39 @@ def run_experiment() -> None:
     )
 
     # Построение графиков
-    plot_results(sizes, linear_times_avg, binary_times_avg)
+    plot_results(sizes, linear_times_avg, binary_times_avg, show=show)
 
     # Анализ результатов
+    print_complexity_fit(sizes, linear_times_avg, binary_times_avg)
     print_analysis(max_speedup)
 
+    wait_for_renders()
+
 
 def plot_results(sizes: List[int], linear_times: List[float],
-                 binary_times: List[float]) -> None:
+                 binary_times: List[float],
+                 show: bool = False) -> Optional[Future]:
     """
     Построение графиков результатов эксперимента.
 
+    Графики отрисовываются в фоне в search_performance.png
+    (см. render_figure).
+
     Args:
         sizes: Размеры массивов
         linear_times: Время выполнения линейного поиска
         binary_times: Время выполнения бинарного поиска
+        show: Показать окно с графиками (при наличии дисплея)
     """
+    return render_figure('search_performance.png', _draw_results,
+                         sizes, linear_times, binary_times, show=show)
+
+
+def _draw_results(sizes: List[int], linear_times: List[float],
+                  binary_times: List[float]) -> None:
+    """Отрисовка графиков plot_results."""
+    import matplotlib.pyplot as plt
+
     # Создание области для графиков
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
 
@@ -278,8 +305,30 @@ def plot_results(sizes: List[int], linear_times: List[float],
     ax2.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('search_performance.png', dpi=300, bbox_inches='tight')
-    plt.show()
+
+
+def print_complexity_fit(sizes: List[int], linear_times: List[float],
+                         binary_times: List[float]) -> None:
+    """
+    Подбор модели сложности по усредненным замерам.
+
+    Замеры сверяются с теоретическими оценками O(n) и O(log n);
+    при расхождении выдается ComplexityWarning.
+
+    Args:
+        sizes: Размеры массивов
+        linear_times: Время выполнения линейного поиска
+        binary_times: Время выполнения бинарного поиска
+    """
+    # NumPy нужен только для приближения, не для самого поиска.
+    from complexity_fit import check_complexity, format_fit_report
+
+    print("\nЭмпирическая сложность:")
+    for label, times, declared in (
+            ("linear_search", linear_times, 'O(n)'),
+            ("binary_search", binary_times, 'O(log n)')):
+        fits = check_complexity(sizes, times, declared, label)
+        print(format_fit_report(label, fits, declared))
 
 
 def print_analysis(max_speedup: float) -> None:
@@ -312,6 +361,15 @@ if __name__ == '__main__':
     """
     Основная точка входа в программу.
     """
+    parser = argparse.ArgumentParser(
+        description='Сравнение линейного и бинарного поиска'
+    )
+    parser.add_argument(
+        '--show', action='store_true',
+        help='Показать графики в окне (иначе только сохранить в файлы)'
+    )
+    args = parser.parse_args()
+
     # Характеристики ПК для тестирования
     pc_info = """
 ХАРАКТЕРИСТИКИ ПК ДЛЯ ТЕСТИРОВАНИЯ:
@@ -323,4 +381,4 @@ if __name__ == '__main__':
     print(pc_info)
 
     # Запуск эксперимента
-    run_experiment()
+    run_experiment(show=args.show)
@@ -1,19 +1,29 @@
+import argparse
+import os
+import sys
 import time
-from typing import List, Tuple
-
-import matplotlib.pyplot as plt
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
 
 from recursion import factorial, fibonacci_naive, fast_power
 from memoization import fibonacci_memo, compare_fibonacci_performance
 from recursion_tasks import binary_search_recursive, hanoi_towers
 from recursion_tasks import file_system_traversal
 
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'
+))
+from render import render_figure, wait_for_renders  # noqa: E402
+
 
-def performance_experiment() -> None:
+def performance_experiment(show: bool = False) -> None:
     """
     Эксперимент по сравнению производительности рекурсивных алгоритмов.
 
     Проводит замеры времени выполнения и строит сравнительные графики.
+
+    Args:
+        show: Показать окно с графиками (при наличии дисплея)
     """
     print('\n=== ЭКСПЕРИМЕНТАЛЬНОЕ ИССЛЕДОВАНИЕ ===\n')
 
@@ -21,12 +31,17 @@ def performance_experiment() -> None:
 
     print('\n--- Построение графика времени выполнения ---')
     n_values, naive_times, memo_times = measure_fibonacci_times()
-    plot_performance_comparison(n_values, naive_times, memo_times)
+    plot_performance_comparison(
+        n_values, naive_times, memo_times, show=show
+    )
 
     print_complexity_analysis()
 
     demonstrate_filesystem_traversal()
 
+    wait_for_renders()
+    print('\nГрафик сохранен как fibonacci_performance.png')
+
 
 def measure_fibonacci_times() -> Tuple[List[int], List[float], List[float]]:
     """
@@ -64,16 +79,35 @@ def measure_fibonacci_times() -> Tuple[List[int], List[float], List[float]]:
 def plot_performance_comparison(
     n_values: List[int],
     naive_times: List[float],
-    memo_times: List[float]
-) -> None:
+    memo_times: List[float],
+    show: bool = False
+) -> Optional[Future]:
     """
     Строит графики сравнения производительности.
 
+    Графики отрисовываются в фоне в fibonacci_performance.png
+    (см. render_figure).
+
     Args:
         n_values: Значения n для оси X
         naive_times: Времена наивной реализации
         memo_times: Времена мемоизированной реализации
+        show: Показать окно с графиками (при наличии дисплея)
     """
+    return render_figure(
+        'fibonacci_performance.png', _draw_performance_comparison,
+        n_values, naive_times, memo_times, show=show
+    )
+
+
+def _draw_performance_comparison(
+    n_values: List[int],
+    naive_times: List[float],
+    memo_times: List[float]
+) -> None:
+    """Отрисовка графиков plot_performance_comparison."""
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 8))
 
     plt.subplot(2, 1, 1)
@@ -100,9 +134,6 @@ def plot_performance_comparison(
     plt.yscale('log')
 
     plt.tight_layout()
-    plt.savefig('fibonacci_performance.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    print('График сохранен как fibonacci_performance.png')
 
 
 def print_complexity_analysis() -> None:
@@ -163,6 +194,15 @@ def system_info() -> None:
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Рекурсия и мемоизация: демонстрация и замеры'
+    )
+    parser.add_argument(
+        '--show', action='store_true',
+        help='Показать графики в окне (иначе только сохранить в файлы)'
+    )
+    args = parser.parse_args()
+
     system_info()
     demo_all_functions()
-    performance_experiment()
+    performance_experiment(show=args.show)
@@ -0,0 +1,277 @@
+"""Модуль внешней сортировки слиянием для данных, не помещающихся в память."""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from array import array
+from typing import Any, Dict, IO, Iterator, List
+
+from sorts import merge_k, sort_buffer
+
+ITEM_SIZE = array('q').itemsize
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_FAN_IN = 16
+
+# Пиковая память sort_buffer на части в единицах размера самой части
+# (вместе с ней). Векторизованный путь держит ключи uint64, индексы
+# argsort и переставленную копию (counting_sort - еще массив счетчиков
+# при диапазоне значений порядка размера части); tim_sort добавляет
+# буфер слияния до n/2; intro_sort и insertion_sort работают на месте.
+WORKING_SET_FACTORS = {
+    'counting_sort': 5,
+    'radix_sort': 4,
+    'integer_sort': 4,
+    'tim_sort': 2,
+    'intro_sort': 1,
+    'insertion_sort': 1,
+}
+# Остальные алгоритмы сортируют список Python int: на элемент
+# указатель и объект int, плюс промежуточные списки.
+DEFAULT_WORKING_SET_FACTOR = 12
+
+
+def external_sort(
+    input_path: str,
+    output_path: str,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    fan_in: int = DEFAULT_FAN_IN,
+    file_format: str = 'binary',
+    algorithm: str = 'integer_sort',
+    temp_dir: str = None
+) -> Dict[str, Any]:
+    """
+    Внешняя сортировка слиянием файла целых чисел.
+
+    1. Файл читается частями по memory_budget / k байт, где k -
+       коэффициент рабочей памяти алгоритма (WORKING_SET_FACTORS):
+       пиковая память сортировки части (sort_buffer) укладывается
+       в memory_budget. Каждая часть записывается во временный
+       файл - отсортированную серию.
+    2. Серии сливаются кучей по fan_in штук за проход, пока не останется
+       одна. Каждая серия читается через буфер размером
+       memory_budget / (fan_in + 1). Единственная серия не сливается,
+       а переносится в выходной файл (в текстовом формате -
+       с преобразованием при записи).
+
+    Временная сложность: O(n log n)
+    Количество проходов по данным: 1 + ceil(log_fan_in(число серий))
+
+    Args:
+        input_path: Входной файл.
+        output_path: Выходной файл (в том же формате).
+        memory_budget: Пиковый объем памяти под данные при сортировке
+            части или слиянии, байт.
+        fan_in: Максимальное число серий в одном слиянии.
+        file_format: 'binary' (int64 в порядке байт машины)
+            или 'text' (одно число в строке).
+        algorithm: Алгоритм сортировки частей в памяти.
+        temp_dir: Каталог для временных серий.
+
+    Returns:
+        Статистика: количество серий и проходов, объем ввода-вывода,
+        время и пропускная способность.
+    """
+    if file_format not in ('binary', 'text'):
+        raise ValueError(f"Unknown file format: {file_format}")
+    if fan_in < 2:
+        raise ValueError("Fan-in must be at least 2")
+
+    factor = WORKING_SET_FACTORS.get(algorithm, DEFAULT_WORKING_SET_FACTOR)
+    chunk_items = max(1, memory_budget // (ITEM_SIZE * factor))
+    buffer_items = max(1, memory_budget // ITEM_SIZE // (fan_in + 1))
+
+    stats = {
+        'items': 0,
+        'runs': 0,
+        'passes': 0,
+        'bytes_read': 0,
+        'bytes_written': 0,
+    }
+    start_time = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        runs = _create_runs(
+            input_path, work_dir, chunk_items, file_format, algorithm, stats
+        )
+        stats['runs'] = len(runs)
+        stats['passes'] = 1
+
+        generation = 0
+        while len(runs) > fan_in:
+            generation += 1
+            next_runs = []
+            for group_start in range(0, len(runs), fan_in):
+                group = runs[group_start:group_start + fan_in]
+                path = os.path.join(
+                    work_dir, f'run_{generation}_{len(next_runs)}.bin'
+                )
+                with open(path, 'wb') as out:
+                    _merge_runs(group, out, buffer_items, 'binary', stats)
+                for run_path in group:
+                    os.remove(run_path)
+                next_runs.append(path)
+            runs = next_runs
+            stats['passes'] += 1
+
+        if len(runs) == 1 and file_format == 'binary':
+            shutil.move(runs[0], output_path)
+        else:
+            with open(output_path, 'wb') as out:
+                _merge_runs(runs, out, buffer_items, file_format, stats)
+            if len(runs) > 1:
+                stats['passes'] += 1
+
+    elapsed = time.perf_counter() - start_time
+    total_io = stats['bytes_read'] + stats['bytes_written']
+    stats['seconds'] = elapsed
+    stats['throughput_mb_s'] = total_io / elapsed / 1024 / 1024
+
+    return stats
+
+
+def _read_chunks(
+    input_path: str, chunk_items: int, file_format: str,
+    stats: Dict[str, Any]
+) -> Iterator[array]:
+    """Чтение входного файла частями не более chunk_items чисел."""
+    if file_format == 'binary':
+        with open(input_path, 'rb') as f:
+            while True:
+                # Чтение прямо в память массива: fromfile держал бы
+                # еще и промежуточный bytes того же размера.
+                chunk = array('q', [0]) * chunk_items
+                size = f.readinto(chunk)
+                del chunk[size // ITEM_SIZE:]
+                if not chunk:
+                    return
+                stats['bytes_read'] += len(chunk) * ITEM_SIZE
+                yield chunk
+                del chunk
+    else:
+        # Двоичный режим: прочитанный объем считается в байтах,
+        # а не в символах (важно для CRLF и не-ASCII файлов).
+        with open(input_path, 'rb') as f:
+            chunk = array('q')
+            for line in f:
+                stats['bytes_read'] += len(line)
+                if line.strip():
+                    chunk.append(int(line))
+                if len(chunk) >= chunk_items:
+                    yield chunk
+                    chunk = array('q')
+            if chunk:
+                yield chunk
+
+
+def _create_runs(
+    input_path: str, work_dir: str, chunk_items: int, file_format: str,
+    algorithm: str, stats: Dict[str, Any]
+) -> List[str]:
+    """Первый проход: сортировка частей в памяти и запись серий."""
+    runs = []
+    for chunk in _read_chunks(input_path, chunk_items, file_format, stats):
+        sort_buffer(chunk, algorithm, inplace=True)
+        path = os.path.join(work_dir, f'run_0_{len(runs)}.bin')
+        with open(path, 'wb') as f:
+            chunk.tofile(f)
+        stats['items'] += len(chunk)
+        stats['bytes_written'] += len(chunk) * ITEM_SIZE
+        runs.append(path)
+        # Освобождаем часть до чтения следующей.
+        del chunk
+    return runs
+
+
+def _iter_run(
+    path: str, buffer_items: int, stats: Dict[str, Any]
+) -> Iterator[int]:
+    """Буферизованное чтение серии блоками по buffer_items чисел."""
+    with open(path, 'rb') as f:
+        while True:
+            block = array('q')
+            try:
+                block.fromfile(f, buffer_items)
+            except EOFError:
+                pass
+            if not block:
+                return
+            stats['bytes_read'] += len(block) * ITEM_SIZE
+            yield from block
+
+
+def _merge_runs(
+    runs: List[str], out: IO, buffer_items: int, file_format: str,
+    stats: Dict[str, Any]
+) -> None:
+    """k-путевое слияние серий (merge_k) с буферизованной записью."""
+    merged = merge_k(_iter_run(path, buffer_items, stats) for path in runs)
+
+    block = array('q')
+    for value in merged:
+        block.append(value)
+        if len(block) >= buffer_items:
+            _write_block(block, out, file_format, stats)
+            block = array('q')
+    if block:
+        _write_block(block, out, file_format, stats)
+
+
+def _write_block(
+    block: array, out: IO, file_format: str, stats: Dict[str, Any]
+) -> None:
+    """Запись блока чисел в выходной файл."""
+    if file_format == 'binary':
+        block.tofile(out)
+        stats['bytes_written'] += len(block) * ITEM_SIZE
+    else:
+        text = ('\n'.join(map(str, block)) + '\n').encode('ascii')
+        out.write(text)
+        stats['bytes_written'] += len(text)
+
+
+def write_input_file(
+    path: str, data: List[int], file_format: str = 'binary'
+) -> None:
+    """Запись массива во входной файл для external_sort."""
+    if file_format == 'binary':
+        with open(path, 'wb') as f:
+            array('q', data).tofile(f)
+    else:
+        with open(path, 'w') as f:
+            f.write('\n'.join(map(str, data)) + '\n')
+
+
+def main() -> None:
+    """Сортировка файла из командной строки."""
+    parser = argparse.ArgumentParser(
+        description='Внешняя сортировка слиянием файла целых чисел'
+    )
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument(
+        '--format', choices=['binary', 'text'], default='binary'
+    )
+    parser.add_argument(
+        '--memory', type=int, default=DEFAULT_MEMORY_BUDGET,
+        help='Бюджет памяти, байт'
+    )
+    parser.add_argument('--fan-in', type=int, default=DEFAULT_FAN_IN)
+    parser.add_argument('--temp-dir', default=None)
+    args = parser.parse_args()
+
+    stats = external_sort(
+        args.input, args.output, args.memory, args.fan_in, args.format,
+        temp_dir=args.temp_dir
+    )
+    print(f"Чисел: {stats['items']}, серий: {stats['runs']}, "
+          f"проходов: {stats['passes']}")
+    print(f"Прочитано: {stats['bytes_read'] / 1024 / 1024:.1f} МБ, "
+          f"записано: {stats['bytes_written'] / 1024 / 1024:.1f} МБ")
+    print(f"Время: {stats['seconds']:.2f} сек, "
+          f"ввод-вывод: {stats['throughput_mb_s']:.1f} МБ/с")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,72 +1,304 @@
-"""Модуль для генерации тестовых данных."""
+"""Модуль для генерации тестовых данных.
 
-import random
-from typing import List, Dict
+Генераторы векторизованы на NumPy и принимают явное зерно, поэтому
+наборы данных воспроизводимы. Наборы для бенчмарков кешируются
+на диске в формате .npy и при повторных запусках отображаются
+в память (mmap) вместо повторной генерации.
+"""
 
+import os
+import tempfile
+from typing import Callable, Dict, List, Optional, Union
 
-def generate_random_array(
+import numpy as np
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'lab_04_datasets')
+# Версия генераторов в имени файла кеша: при изменении генератора
+# старые файлы не используются.
+DATASET_VERSION = 2
+
+DEFAULT_DATA_TYPES = ['random', 'sorted', 'reversed', 'almost_sorted']
+
+STRING_DATA_TYPES = ['random_strings', 'shared_prefix', 'variable_length']
+
+ALPHABET = np.frombuffer(b'abcdefghijklmnopqrstuvwxyz', dtype=np.uint8)
+
+
+def _random(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int
+) -> np.ndarray:
+    """Равномерно распределенные числа из [min_val, max_val]."""
+    return rng.integers(min_val, max_val + 1, size, dtype=np.int64)
+
+
+def _sorted(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int
+) -> np.ndarray:
+    """Отсортированный случайный массив."""
+    return np.sort(_random(rng, size, min_val, max_val))
+
+
+def _reversed(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int
+) -> np.ndarray:
+    """Отсортированный по убыванию случайный массив."""
+    return _sorted(rng, size, min_val, max_val)[::-1].copy()
+
+
+def _almost_sorted(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int,
+    sorted_ratio: float = 0.95
+) -> np.ndarray:
+    """
+    Отсортированный массив с (1 - sorted_ratio) * size обменами.
+
+    Обмениваются непересекающиеся пары позиций: при повторяющихся
+    индексах групповое присваивание дублировало бы или теряло
+    значения, а так результат остается перестановкой.
+    """
+    arr = _sorted(rng, size, min_val, max_val)
+    num_swaps = min(int(size * (1 - sorted_ratio)), size // 2)
+    if num_swaps:
+        i, j = rng.choice(size, 2 * num_swaps, replace=False).reshape(2, -1)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def _few_unique(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int,
+    num_unique: int = 10
+) -> np.ndarray:
+    """Массив из num_unique различных значений (много повторов)."""
+    values = _random(rng, num_unique, min_val, max_val)
+    return values[rng.integers(0, num_unique, size)]
+
+
+def _sawtooth(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int,
+    teeth: int = 10
+) -> np.ndarray:
+    """Пила: teeth возрастающих серий."""
+    period = max(1, size // teeth)
+    steps = np.arange(size, dtype=np.int64) % period
+    return min_val + steps * (max_val - min_val) // max(1, period - 1)
+
+
+def _organ_pipe(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int
+) -> np.ndarray:
+    """Органные трубы: возрастание до середины, затем убывание."""
+    index = np.arange(size, dtype=np.int64)
+    steps = np.minimum(index, size - 1 - index)
+    half = max(1, (size - 1) // 2)
+    return min_val + steps * (max_val - min_val) // half
+
+
+def _zipf(
+    rng: np.random.Generator, size: int, min_val: int, max_val: int,
+    exponent: float = 1.5
+) -> np.ndarray:
+    """Распределение Ципфа: малые значения встречаются намного чаще."""
+    ranks = rng.zipf(exponent, size).astype(np.int64)
+    return min_val + np.minimum(ranks - 1, max_val - min_val)
+
+
+DATA_GENERATORS: Dict[
+    str, Callable[[np.random.Generator, int, int, int], np.ndarray]
+] = {
+    'random': _random,
+    'sorted': _sorted,
+    'reversed': _reversed,
+    'almost_sorted': _almost_sorted,
+    'few_unique': _few_unique,
+    'sawtooth': _sawtooth,
+    'organ_pipe': _organ_pipe,
+    'zipf': _zipf,
+}
+
+
+def generate_array(
+    data_type: str,
     size: int,
+    seed: Optional[int] = 0,
     min_val: int = 0,
     max_val: int = 10000
+) -> np.ndarray:
+    """
+    Генерирует массив int64 заданного типа.
+
+    Args:
+        data_type: Ключ DATA_GENERATORS.
+        size: Размер массива.
+        seed: Зерно генератора (None - случайное).
+        min_val: Минимальное значение.
+        max_val: Максимальное значение.
+
+    Returns:
+        Массив NumPy из size элементов.
+    """
+    if data_type not in DATA_GENERATORS:
+        raise ValueError(f"Unknown data type: {data_type}")
+    rng = np.random.default_rng(seed)
+    return DATA_GENERATORS[data_type](rng, size, min_val, max_val)
+
+
+def load_dataset(
+    data_type: str,
+    size: int,
+    seed: int = 0,
+    cache_dir: str = DEFAULT_CACHE_DIR
+) -> np.ndarray:
+    """
+    Набор данных из дискового кеша.
+
+    Ключ кеша - (тип, размер, зерно, DATASET_VERSION). При отсутствии
+    файла массив генерируется и сохраняется в .npy (через временный
+    файл, чтобы прерванная запись не оставила поврежденный кеш). Результат
+    отображается в память только для чтения.
+
+    Returns:
+        Массив NumPy (np.memmap) из size элементов.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(
+        cache_dir, f'{data_type}_{size}_{seed}_v{DATASET_VERSION}.npy'
+    )
+
+    if not os.path.exists(path):
+        arr = generate_array(data_type, size, seed)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.npy')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, arr)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    return np.load(path, mmap_mode='r')
+
+
+def generate_random_array(
+    size: int,
+    min_val: int = 0,
+    max_val: int = 10000,
+    seed: Optional[int] = None
 ) -> List[int]:
     """Генерирует массив случайных чисел."""
-    return [random.randint(min_val, max_val) for _ in range(size)]
+    return generate_array('random', size, seed, min_val, max_val).tolist()
 
 
 def generate_sorted_array(
     size: int,
     min_val: int = 0,
-    max_val: int = 10000
+    max_val: int = 10000,
+    seed: Optional[int] = None
 ) -> List[int]:
     """Генерирует отсортированный массив."""
-    arr = generate_random_array(size, min_val, max_val)
-    arr.sort()
-    return arr
+    return generate_array('sorted', size, seed, min_val, max_val).tolist()
 
 
 def generate_reversed_array(
     size: int,
     min_val: int = 0,
-    max_val: int = 10000
+    max_val: int = 10000,
+    seed: Optional[int] = None
 ) -> List[int]:
     """Генерирует обратно отсортированный массив."""
-    arr = generate_sorted_array(size, min_val, max_val)
-    arr.reverse()
-    return arr
+    return generate_array('reversed', size, seed, min_val, max_val).tolist()
 
 
 def generate_almost_sorted_array(
     size: int,
-    sorted_ratio: float = 0.95
+    sorted_ratio: float = 0.95,
+    seed: Optional[int] = None
 ) -> List[int]:
     """Генерирует почти отсортированный массив."""
-    arr = generate_sorted_array(size)
-    num_to_shuffle = int(size * (1 - sorted_ratio))
+    rng = np.random.default_rng(seed)
+    return _almost_sorted(rng, size, 0, 10000, sorted_ratio).tolist()
 
-    for _ in range(num_to_shuffle):
-        i = random.randint(0, size - 1)
-        j = random.randint(0, size - 1)
-        arr[i], arr[j] = arr[j], arr[i]
 
-    return arr
+def generate_string_array(
+    size: int,
+    data_type: str = 'random_strings',
+    seed: Optional[int] = 0,
+    length: int = 16,
+    as_bytes: bool = False
+) -> Union[List[str], List[bytes]]:
+    """
+    Генерирует массив строк из строчных латинских букв.
+
+    Типы данных:
+    - random_strings: строки длины length;
+    - shared_prefix: один из 8 префиксов длины 2 * length
+      и случайный суффикс длины length (длинные общие префиксы,
+      как у ключей вида 'user:session:...');
+    - variable_length: длины равномерно от 1 до 4 * length.
+
+    Args:
+        size: Количество строк.
+        data_type: Ключ из STRING_DATA_TYPES.
+        seed: Зерно генератора.
+        length: Базовая длина строки.
+        as_bytes: Вернуть bytes вместо str.
+    """
+    if data_type not in STRING_DATA_TYPES:
+        raise ValueError(f"Unknown string data type: {data_type}")
+
+    rng = np.random.default_rng(seed)
+
+    if data_type == 'variable_length':
+        lengths = rng.integers(1, 4 * length + 1, size)
+    else:
+        lengths = np.full(size, length)
+
+    # Все символы генерируются одним вызовом и нарезаются по длинам.
+    chars = ALPHABET[rng.integers(0, len(ALPHABET), int(lengths.sum()))]
+    raw = chars.tobytes()
+    ends = np.cumsum(lengths).tolist()
+    starts = [0] + ends[:-1]
+    items = [raw[start:end] for start, end in zip(starts, ends)]
+
+    if data_type == 'shared_prefix':
+        prefixes = [
+            ALPHABET[rng.integers(0, len(ALPHABET), 2 * length)].tobytes()
+            for _ in range(8)
+        ]
+        choice = rng.integers(0, len(prefixes), size).tolist()
+        items = [prefixes[c] + item for c, item in zip(choice, items)]
+
+    if as_bytes:
+        return items
+    return [item.decode('ascii') for item in items]
 
 
 def generate_test_datasets(
-    sizes: List[int]
+    sizes: List[int],
+    seed: int = 0,
+    data_types: Optional[List[str]] = None,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR
 ) -> Dict[str, Dict[int, List[int]]]:
-    """Генерирует тестовые данные."""
-    data_types = {
-        'random': generate_random_array,
-        'sorted': generate_sorted_array,
-        'reversed': generate_reversed_array,
-        'almost_sorted': generate_almost_sorted_array
-    }
+    """
+    Генерирует тестовые данные.
+
+    Args:
+        sizes: Размеры массивов.
+        seed: Зерно; одинаковое зерно дает одинаковые наборы.
+        data_types: Типы данных (по умолчанию DEFAULT_DATA_TYPES).
+        cache_dir: Каталог кеша (None - генерировать без кеша).
+    """
+    if data_types is None:
+        data_types = DEFAULT_DATA_TYPES
 
     datasets = {}
 
-    for data_type, generator in data_types.items():
+    for data_type in data_types:
         datasets[data_type] = {}
         for size in sizes:
-            datasets[data_type][size] = generator(size)
+            if cache_dir is None:
+                arr = generate_array(data_type, size, seed)
+            else:
+                arr = load_dataset(data_type, size, seed, cache_dir)
+            datasets[data_type][size] = arr.tolist()
 
     return datasets
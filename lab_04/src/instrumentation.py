@@ -0,0 +1,239 @@
+"""Модуль подсчета операций алгоритмов сортировки.
+
+Функции из sorts.py не содержат счетчиков и не замедляются. Для режима
+подсчета строится отдельная копия модуля: его исходный код
+преобразуется на уровне AST так, что каждая запись элемента в массив
+увеличивает счетчик перемещений, а обмен вида
+a[i], a[j] = a[j], a[i] - счетчик обменов. Сравнения считаются
+оберткой CountingItem над элементами.
+"""
+
+import ast
+import inspect
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import sorts
+
+COUNTERS_NAME = '__sort_counters__'
+
+# Сортировки без сравнений элементов: им передаются сами числа.
+NON_COMPARISON_SORTS = {'counting_sort', 'radix_sort', 'integer_sort'}
+
+
+class SortCounters:
+    """Счетчики операций одного запуска сортировки."""
+
+    __slots__ = ('comparisons', 'moves', 'swaps')
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Обнуление счетчиков."""
+        self.comparisons = 0
+        self.moves = 0
+        self.swaps = 0
+
+    def count_moves(self, values: Any) -> Any:
+        """Учет записи последовательности элементов (срез, extend)."""
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        self.moves += len(values)
+        return values
+
+    def count_move(self, value: Any) -> Any:
+        """Учет записи одного элемента (append)."""
+        self.moves += 1
+        return value
+
+    def count_swap(self, width: int) -> None:
+        """Учет обмена (множественного присваивания элементов)."""
+        self.swaps += 1
+        self.moves += width
+
+
+class CountingItem:
+    """Обертка над элементом, считающая сравнения."""
+
+    __slots__ = ('value', 'counters')
+
+    def __init__(self, value: Any, counters: SortCounters) -> None:
+        self.value = value
+        self.counters = counters
+
+    def __lt__(self, other: 'CountingItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: 'CountingItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: 'CountingItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: 'CountingItem') -> bool:
+        self.counters.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: object) -> bool:
+        self.counters.comparisons += 1
+        return self.value == getattr(other, 'value', other)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class _MoveCounter(ast.NodeTransformer):
+    """Вставляет учет перемещений и обменов в исходный код модуля."""
+
+    @staticmethod
+    def _counters(method: str) -> ast.Attribute:
+        return ast.Attribute(
+            value=ast.Name(id=COUNTERS_NAME, ctx=ast.Load()),
+            attr=method, ctx=ast.Load()
+        )
+
+    def _call(self, method: str, *args: ast.expr) -> ast.Call:
+        return ast.Call(func=self._counters(method), args=list(args),
+                        keywords=[])
+
+    def visit_Assign(self, node: ast.Assign) -> Any:
+        self.generic_visit(node)
+        target = node.targets[0]
+
+        # a[i], a[j] = a[j], a[i]
+        if (isinstance(target, ast.Tuple) and
+                all(isinstance(e, ast.Subscript) for e in target.elts)):
+            return [node, ast.Expr(self._call(
+                'count_swap', ast.Constant(len(target.elts))
+            ))]
+
+        if isinstance(target, ast.Subscript):
+            if isinstance(target.slice, ast.Slice):
+                node.value = self._call('count_moves', node.value)
+                return node
+            increment = ast.AugAssign(
+                target=ast.Attribute(
+                    value=ast.Name(id=COUNTERS_NAME, ctx=ast.Load()),
+                    attr='moves', ctx=ast.Store()
+                ),
+                op=ast.Add(), value=ast.Constant(1)
+            )
+            return [node, increment]
+
+        return node
+
+    def visit_Call(self, node: ast.Call) -> Any:
+        self.generic_visit(node)
+        if not isinstance(node.func, ast.Attribute) or len(node.args) != 1:
+            return node
+
+        # Служебные append((lo, hi)) с кортежами не считаются.
+        if (node.func.attr == 'append' and
+                not isinstance(node.args[0], ast.Tuple)):
+            node.args[0] = self._call('count_move', node.args[0])
+        elif node.func.attr == 'extend':
+            node.args[0] = self._call('count_moves', node.args[0])
+        return node
+
+    @staticmethod
+    def _reads_elements(node: ast.ListComp) -> bool:
+        """
+        Зависит ли элемент генератора от перебираемых элементов.
+
+        Генераторы-выделения памяти вроде [[] for _ in range(256)]
+        и перебор индексов range() перемещениями не считаются.
+        """
+        names = set()
+        for comp in node.generators:
+            if (isinstance(comp.iter, ast.Call) and
+                    isinstance(comp.iter.func, ast.Name) and
+                    comp.iter.func.id == 'range'):
+                continue
+            names.update(
+                name.id for name in ast.walk(comp.target)
+                if isinstance(name, ast.Name)
+            )
+        return any(
+            isinstance(name, ast.Name) and name.id in names
+            for name in ast.walk(node.elt)
+        )
+
+    def visit_ListComp(self, node: ast.ListComp) -> Any:
+        self.generic_visit(node)
+        if not self._reads_elements(node):
+            return node
+        return self._call('count_moves', node)
+
+
+_instrumented: Dict[str, Any] = {}
+
+
+def _instrumented_namespace() -> Dict[str, Any]:
+    """Копия модуля sorts с подсчетом перемещений (строится один раз)."""
+    if not _instrumented:
+        tree = _MoveCounter().visit(ast.parse(inspect.getsource(sorts)))
+        ast.fix_missing_locations(tree)
+
+        namespace: Dict[str, Any] = {
+            '__name__': 'sorts_instrumented',
+            COUNTERS_NAME: SortCounters(),
+        }
+        exec(compile(tree, sorts.__file__, 'exec'), namespace)
+
+        # Векторизованные ветки не видны счетчикам.
+        namespace['_numpy_available'] = lambda: False
+        _instrumented.update(namespace)
+    return _instrumented
+
+
+def measure_peak_memory(
+    sort_func: Callable[[List[int]], List[int]],
+    data: List[int]
+) -> int:
+    """Пиковый объем дополнительной памяти сортировки (tracemalloc), байт."""
+    tracemalloc.start()
+    sort_func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def count_operations(algo_name: str, data: List[int]) -> Dict[str, int]:
+    """
+    Подсчет операций сортировки algo_name на данных data.
+
+    Перемещения - записи элементов в массивы (по индексу, срезом,
+    append/extend, генераторы списков); обмен учитывается и как обмен,
+    и как два перемещения. Пиковая память измеряется запуском исходной,
+    неинструментированной функции.
+
+    Returns:
+        Словарь с ключами comparisons, moves, swaps, peak_memory.
+    """
+    namespace = _instrumented_namespace()
+    counters: SortCounters = namespace[COUNTERS_NAME]
+    sort_func = namespace['SORTING_ALGORITHMS'][algo_name]
+
+    if algo_name in NON_COMPARISON_SORTS:
+        items: List[Any] = list(data)
+    else:
+        items = [CountingItem(x, counters) for x in data]
+
+    counters.reset()
+    sort_func(items)
+
+    return {
+        'comparisons': counters.comparisons,
+        'moves': counters.moves,
+        'swaps': counters.swaps,
+        'peak_memory': measure_peak_memory(
+            sorts.SORTING_ALGORITHMS[algo_name], data
+        ),
+    }
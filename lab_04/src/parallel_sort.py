@@ -0,0 +1,218 @@
+"""Модуль параллельной сортировки на пуле процессов."""
+
+import heapq
+import multiprocessing
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sorts import _numpy_available, sort_buffer
+
+PARALLEL_THRESHOLD = 100000
+ITEM_SIZE = array('q').itemsize
+
+
+def create_pool(
+    workers: int, pin_to_cores: bool = False
+) -> ProcessPoolExecutor:
+    """
+    Пул процессов для parallel_sort.
+
+    До Python 3.13 подключение к разделяемой памяти регистрирует блок
+    в resource_tracker. Если трекер запущен до создания пула, процессы
+    пула наследуют его, и блоки не считаются утекшими при их завершении.
+
+    Args:
+        workers: Количество процессов.
+        pin_to_cores: Закрепить каждый процесс за своим ядром
+            (только там, где есть os.sched_setaffinity).
+    """
+    resource_tracker.ensure_running()
+    if pin_to_cores and hasattr(os, 'sched_setaffinity'):
+        counter = multiprocessing.Value('i', 0)
+        return ProcessPoolExecutor(
+            max_workers=workers, initializer=_pin_worker,
+            initargs=(counter,)
+        )
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _pin_worker(counter: Any) -> None:
+    """Закрепление процесса пула за ядром с очередным номером."""
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    cores = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def parallel_sort(
+    arr: Sequence[int],
+    workers: Optional[int] = None,
+    algorithm: str = 'integer_sort',
+    executor: Optional[Executor] = None
+) -> List[int]:
+    """
+    Параллельная сортировка (sample sort) на пуле процессов.
+
+    1. Данные копируются в разделяемую память (int64) и делятся
+       на workers частей, каждая сортируется в своем процессе
+       на месте алгоритмом algorithm (sort_buffer).
+    2. По выборке из отсортированных частей выбираются workers - 1
+       разделителей; каждый процесс сливает свой диапазон значений
+       из всех частей и пишет результат прямо в выходной буфер.
+
+    Между процессами передаются только имена блоков памяти и границы,
+    сами данные не сериализуются.
+
+    Временная сложность: O(n log n / p + n) при p процессах
+    Пространственная сложность: O(n) (два разделяемых буфера)
+
+    Args:
+        arr: Массив целых чисел, помещающихся в int64.
+        workers: Количество процессов (по умолчанию - число ядер).
+        algorithm: Алгоритм сортировки частей (см. sort_buffer).
+        executor: Готовый пул процессов, созданный create_pool.
+    """
+    n = len(arr)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if n < PARALLEL_THRESHOLD or workers == 1:
+        return sort_buffer(array('q', arr), algorithm, inplace=True).tolist()
+
+    src = shared_memory.SharedMemory(create=True, size=n * ITEM_SIZE)
+    dst = shared_memory.SharedMemory(create=True, size=n * ITEM_SIZE)
+    pool = executor or create_pool(workers)
+
+    try:
+        with src.buf.cast('q') as src_view:
+            src_view[:] = array('q', arr)
+
+        bounds = [n * i // workers for i in range(workers + 1)]
+        chunks = list(zip(bounds, bounds[1:]))
+        list(pool.map(
+            _sort_chunk,
+            [(src.name, lo, hi, algorithm) for lo, hi in chunks]
+        ))
+
+        tasks = _plan_partitions(src, chunks, workers)
+        list(pool.map(
+            _merge_partition,
+            [(src.name, dst.name, pieces, offset)
+             for pieces, offset in tasks]
+        ))
+
+        with dst.buf.cast('q') as dst_view:
+            result = dst_view.tolist()
+    finally:
+        if executor is None:
+            pool.shutdown()
+        for block in (src, dst):
+            block.close()
+            block.unlink()
+
+    return result
+
+
+def _plan_partitions(
+    src: shared_memory.SharedMemory,
+    chunks: List[Tuple[int, int]],
+    workers: int
+) -> List[Tuple[List[Tuple[int, int]], int]]:
+    """
+    Выбор разделителей регулярной выборкой и разбиение частей.
+
+    Returns:
+        Для каждого процесса - список отрезков (lo, hi) из всех частей
+        и смещение результата в выходном буфере.
+    """
+    with src.buf.cast('q') as view:
+        samples = sorted(
+            view[lo + (hi - lo) * k // workers]
+            for lo, hi in chunks
+            for k in range(workers)
+        )
+        splitters = [
+            samples[len(samples) * j // workers] for j in range(1, workers)
+        ]
+
+        cuts = [
+            [lo] + [bisect_left(view, s, lo, hi) for s in splitters] + [hi]
+            for lo, hi in chunks
+        ]
+
+    tasks = []
+    offset = 0
+    for j in range(workers):
+        pieces = [(cut[j], cut[j + 1]) for cut in cuts]
+        tasks.append((pieces, offset))
+        offset += sum(hi - lo for lo, hi in pieces)
+    return tasks
+
+
+def attach_shared(name: str) -> shared_memory.SharedMemory:
+    """
+    Подключение к блоку разделяемой памяти по имени (в процессе пула).
+
+    Блок закрывает вызывающий код (close()); удаляет его (unlink())
+    только процесс, который его создал.
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def _sort_chunk(task: Tuple[str, int, int, str]) -> None:
+    """Сортировка части src[lo:hi] на месте (выполняется в процессе)."""
+    name, lo, hi, algorithm = task
+    block = attach_shared(name)
+    try:
+        with block.buf.cast('q') as view, view[lo:hi] as chunk:
+            sort_buffer(chunk, algorithm, inplace=True)
+    finally:
+        block.close()
+
+
+def _merge_partition(
+    task: Tuple[str, str, List[Tuple[int, int]], int]
+) -> None:
+    """k-путевое слияние отрезков src в dst[offset:] (в процессе)."""
+    src_name, dst_name, pieces, offset = task
+    total = sum(hi - lo for lo, hi in pieces)
+    if total == 0:
+        return
+
+    src, dst = attach_shared(src_name), attach_shared(dst_name)
+    try:
+        with src.buf.cast('q') as src_view, \
+                dst.buf.cast('q') as dst_view, \
+                dst_view[offset:offset + total] as target:
+            if _numpy_available():
+                _merge_numpy(src_view, target, pieces)
+            else:
+                target[:] = array('q', heapq.merge(
+                    *(src_view[lo:hi] for lo, hi in pieces)
+                ))
+    finally:
+        src.close()
+        dst.close()
+
+
+def _merge_numpy(
+    src_view: memoryview, target: memoryview, pieces: List[Tuple[int, int]]
+) -> None:
+    """
+    Слияние через NumPy.
+
+    Устойчивая сортировка NumPy находит готовые серии (timsort),
+    поэтому на склеенных отсортированных отрезках она сводится
+    к их слиянию.
+    """
+    import numpy as np
+
+    source = np.asarray(src_view)
+    merged = np.concatenate([source[lo:hi] for lo, hi in pieces])
+    merged.sort(kind='stable')
+    np.asarray(target)[:] = merged
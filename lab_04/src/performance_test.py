@@ -1,9 +1,51 @@
 """Модуль для тестирования производительности алгоритмов сортировки."""
 
+import argparse
+import copy
+import heapq
+import json
+import math
+import os
+import tempfile
 import timeit
-from typing import List, Dict, Any, Callable
-from sorts import SORTING_ALGORITHMS, is_sorted
-from generate_data import generate_test_datasets
+import tracemalloc
+from array import array
+from concurrent.futures import as_completed
+from multiprocessing import shared_memory
+from typing import (
+    List, Dict, Any, Callable, Iterable, Optional, Tuple, Union
+)
+from sorts import (
+    SORTING_ALGORITHMS, apply_permutation, argsort, counting_sort,
+    insertion_sort, integer_sort, intro_sort, is_sorted, merge_k, nsmallest,
+    partial_sort, quickselect, radix_sort, sort_buffer, tim_sort
+)
+from generate_data import (
+    STRING_DATA_TYPES, generate_random_array, generate_string_array,
+    generate_test_datasets
+)
+from parallel_sort import (
+    ITEM_SIZE, attach_shared, create_pool, parallel_sort
+)
+from external_sort import external_sort, write_input_file
+from instrumentation import count_operations
+from string_sorts import STRING_SORTING_ALGORITHMS
+from sorting_networks import network_sort, sort_rows
+
+# Улучшенная реализация -> базовая, с которой она сравнивается.
+IMPROVED_ALGORITHMS = {
+    'intro_sort': 'quick_sort',
+    'bottom_up_merge_sort': 'merge_sort',
+    'tim_sort': 'merge_sort',
+}
+
+# Показатель степени t ~ n^k, если для прогноза есть только одно
+# измерение: квадратичная оценка не дает запустить долгий замер.
+DEFAULT_GROWTH_EXPONENT = 2.0
+
+# Сортировки, для которых стоимость замера без измерений оценивается
+# как n^2, а не n log n (порядок запуска в параллельном режиме).
+QUADRATIC_ALGORITHMS = {'bubble_sort', 'selection_sort', 'insertion_sort'}
 
 
 def system_info() -> None:
@@ -32,45 +74,920 @@ def measure_sorting_time(
     return timer
 
 
+def measure_sorting_run(
+    sort_func: Callable[[List[int]], List[int]],
+    data: List[int]
+) -> Tuple[float, List[int]]:
+    """
+    Измеряет время сортировки и возвращает ее результат.
+
+    Результат замеренного запуска используется для проверки
+    корректности, поэтому каждый массив сортируется один раз.
+    """
+    data_copy = data.copy()
+    start = timeit.default_timer()
+    result = sort_func(data_copy)
+    return timeit.default_timer() - start, result
+
+
+def predict_time(measurements: Dict[int, float], size: int) -> float:
+    """
+    Прогноз времени сортировки массива размера size.
+
+    По двум последним измерениям оценивается показатель k в t ~ n^k
+    (ограниченный отрезком [1, 2]); при одном измерении
+    берется DEFAULT_GROWTH_EXPONENT.
+
+    Args:
+        measurements: Размер -> время для меньших размеров.
+        size: Размер, для которого нужен прогноз.
+    """
+    if not measurements:
+        return 0.0
+
+    known = sorted(measurements)
+    last = known[-1]
+    exponent = DEFAULT_GROWTH_EXPONENT
+    if len(known) >= 2:
+        prev = known[-2]
+        if measurements[prev] > 0 and measurements[last] > 0:
+            exponent = math.log(
+                measurements[last] / measurements[prev]
+            ) / math.log(last / prev)
+            exponent = min(max(exponent, 1.0), 2.0)
+
+    return measurements[last] * (size / last) ** exponent
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Загрузка результатов из файла контрольной точки (если он есть)."""
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+
+    return {
+        algo_name: {
+            data_type: {int(size): time_val
+                        for size, time_val in sizes_data.items()}
+            for data_type, sizes_data in data_types_data.items()
+        }
+        for algo_name, data_types_data in saved.items()
+    }
+
+
+def save_checkpoint(path: str, results_data: Dict[str, Any]) -> None:
+    """
+    Атомарная запись результатов в файл контрольной точки.
+
+    Файл сначала пишется рядом и затем переименовывается, поэтому
+    прерывание во время записи не портит предыдущую точку.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(results_data, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _algorithm_budget(
+    time_budget: Union[float, Dict[str, float], None], algo_name: str
+) -> Optional[float]:
+    """Предел времени замера для алгоритма (см. run_performance_tests)."""
+    if isinstance(time_budget, dict):
+        return time_budget.get(algo_name)
+    return time_budget
+
+
+def _estimate_cost(
+    measurements: Dict[int, float], algo_name: str, size: int
+) -> float:
+    """
+    Оценка длительности замера для планирования.
+
+    По меньшим размерам - predict_time, иначе грубая оценка
+    по асимптотике (около 0.1 мкс на операцию).
+    """
+    if measurements:
+        return predict_time(measurements, size)
+    if algo_name in QUADRATIC_ALGORITHMS:
+        return 1e-7 * size * size
+    return 1e-7 * size * math.log2(max(size, 2))
+
+
+def _share_datasets(
+    datasets: Dict[str, Dict[int, List[int]]]
+) -> Tuple[shared_memory.SharedMemory, Dict[Tuple[str, int], Tuple[int, int]]]:
+    """
+    Копирование всех наборов данных в один блок разделяемой памяти.
+
+    Returns:
+        Блок памяти (int64) и (тип данных, размер) -> (смещение, длина).
+    """
+    locations = {}
+    offset = 0
+    for data_type, size_data in datasets.items():
+        for size, data in size_data.items():
+            locations[(data_type, size)] = (offset, len(data))
+            offset += len(data)
+
+    block = shared_memory.SharedMemory(
+        create=True, size=max(1, offset * ITEM_SIZE)
+    )
+    with block.buf.cast('q') as view:
+        for data_type, size_data in datasets.items():
+            for size, data in size_data.items():
+                start, length = locations[(data_type, size)]
+                view[start:start + length] = array('q', data)
+
+    return block, locations
+
+
+def _measure_cell(task: Tuple[str, int, int, str]) -> Tuple[float, bool]:
+    """
+    Один замер матрицы тестов (выполняется в процессе пула).
+
+    Набор данных читается из разделяемой памяти и превращается
+    в список вне замера, как и в последовательном режиме.
+    """
+    name, offset, length, algo_name = task
+    block = attach_shared(name)
+    try:
+        with block.buf.cast('q') as view, \
+                view[offset:offset + length] as piece:
+            data = piece.tolist()
+    finally:
+        block.close()
+
+    time_taken, sorted_data = measure_sorting_run(
+        SORTING_ALGORITHMS[algo_name], data
+    )
+    return time_taken, is_sorted(sorted_data)
+
+
+def measure_matrix_parallel(
+    datasets: Dict[str, Dict[int, List[int]]],
+    results_data: Dict[str, Any],
+    time_budget: Union[float, Dict[str, float], None],
+    checkpoint_path: Optional[str],
+    workers: int
+) -> Dict[Tuple[str, str, int], Tuple[float, bool]]:
+    """
+    Параллельные замеры матрицы (алгоритм x тип данных x размер).
+
+    Замеры выполняются на пуле процессов, закрепленных за ядрами;
+    наборы данных передаются через разделяемую память, а задачи
+    запускаются в порядке убывания оценки длительности, чтобы самые
+    долгие не оказались в конце. При заданном time_budget размеры
+    обрабатываются волнами по возрастанию: прогноз для следующего
+    размера строится по результатам предыдущей волны, так же как
+    в последовательном режиме.
+
+    Args:
+        datasets: Наборы данных generate_test_datasets.
+        results_data: Уже известные результаты (контрольная точка).
+        time_budget: См. run_performance_tests.
+        checkpoint_path: Файл контрольной точки или None.
+        workers: Количество процессов.
+
+    Returns:
+        (алгоритм, тип данных, размер) -> (время, результат корректен).
+    """
+    measured = copy.deepcopy(results_data)
+    sizes = sorted({size for size_data in datasets.values()
+                    for size in size_data})
+    waves = [[size] for size in sizes] if time_budget is not None else [sizes]
+
+    done: Dict[Tuple[str, str, int], Tuple[float, bool]] = {}
+    block, locations = _share_datasets(datasets)
+
+    try:
+        with create_pool(workers, pin_to_cores=True) as pool:
+            for wave in waves:
+                cells = []
+                for algo_name in SORTING_ALGORITHMS:
+                    budget = _algorithm_budget(time_budget, algo_name)
+                    for data_type in datasets:
+                        series = measured.setdefault(algo_name, {}).setdefault(
+                            data_type, {}
+                        )
+                        for size in wave:
+                            if size in series:
+                                continue
+                            if (budget is not None and
+                                    predict_time(series, size) > budget):
+                                continue
+                            cost = _estimate_cost(series, algo_name, size)
+                            cells.append((cost, algo_name, data_type, size))
+
+                cells.sort(key=lambda cell: cell[0], reverse=True)
+                futures = {
+                    pool.submit(
+                        _measure_cell,
+                        (block.name, *locations[(data_type, size)], algo_name)
+                    ): (algo_name, data_type, size)
+                    for _, algo_name, data_type, size in cells
+                }
+
+                for future in as_completed(futures):
+                    algo_name, data_type, size = futures[future]
+                    time_taken, ok = future.result()
+                    done[(algo_name, data_type, size)] = (time_taken, ok)
+                    if ok:
+                        measured[algo_name][data_type][size] = time_taken
+                        if checkpoint_path:
+                            save_checkpoint(checkpoint_path, measured)
+    finally:
+        block.close()
+        block.unlink()
+
+    return done
+
+
+def measure_time_and_memory(
+    sort_func: Callable[[Any], Any],
+    make_data: Callable[[], Any]
+) -> Tuple[float, int]:
+    """
+    Измеряет время и пиковый объем выделенной памяти.
+
+    Память считается через tracemalloc отдельным запуском, чтобы
+    накладные расходы трассировки не попали в замер времени. Данные
+    для каждого запуска создаются заново вне измерения, поэтому
+    функция подходит и для сортировок на месте.
+
+    Returns:
+        Время (сек) и пик памяти (байт) сверх исходных данных.
+    """
+    data = make_data()
+    time_taken = timeit.timeit(lambda: sort_func(data), number=1)
+
+    data = make_data()
+    tracemalloc.start()
+    sort_func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return time_taken, peak
+
+
 def run_performance_tests(
-    sizes: List[int] = None
+    sizes: List[int] = None,
+    time_budget: Union[float, Dict[str, float], None] = None,
+    checkpoint_path: Optional[str] = None,
+    workers: int = 1
 ) -> Dict[str, Any]:
-    """Запускает тесты производительности."""
+    """
+    Запускает тесты производительности.
+
+    Args:
+        sizes: Размеры массивов.
+        time_budget: Предел времени одного замера, сек (число - для всех
+            алгоритмов, словарь - по алгоритмам). Размер пропускается,
+            если прогноз predict_time по меньшим размерам того же
+            алгоритма и типа данных превышает предел.
+        checkpoint_path: Файл контрольной точки (JSON). Результаты
+            сохраняются после каждого замера, а уже измеренные при
+            повторном запуске пропускаются, поэтому прерванный прогон
+            можно продолжить.
+        workers: Количество процессов. При workers > 1 замеры
+            выполняет measure_matrix_parallel, а вывод и результат
+            формируются тем же циклом, что и в последовательном режиме,
+            в том же порядке и формате.
+    """
     if sizes is None:
         sizes = [100, 1000, 5000, 10000]
+    sizes = sorted(sizes)
 
     system_info()
 
     datasets = generate_test_datasets(sizes)
 
-    results_data = {}
+    results_data = load_checkpoint(checkpoint_path) if checkpoint_path else {}
+
+    precomputed: Dict[Tuple[str, str, int], Tuple[float, bool]] = {}
+    if workers > 1:
+        precomputed = measure_matrix_parallel(
+            datasets, results_data, time_budget, checkpoint_path, workers
+        )
 
     print(f"Запуск тестов для размеров: {sizes}")
 
     for algo_name, sort_func in SORTING_ALGORITHMS.items():
-        results_data[algo_name] = {}
+        results_data.setdefault(algo_name, {})
         print(f"\nТестирование {algo_name}...")
 
+        budget = _algorithm_budget(time_budget, algo_name)
+
         for data_type, size_data in datasets.items():
-            results_data[algo_name][data_type] = {}
+            measured = results_data[algo_name].setdefault(data_type, {})
 
             for size, data in size_data.items():
-                sorted_data = sort_func(data)
-                if not is_sorted(sorted_data):
+                if size in measured:
+                    print(f"{data_type}, размер {size}: "
+                          f"{measured[size]:.6f} сек (из контрольной точки)")
+                    continue
+
+                if budget is not None:
+                    predicted = predict_time(measured, size)
+                    if predicted > budget:
+                        print(f"{data_type}, размер {size}: пропущен "
+                              f"(прогноз {predicted:.1f} сек)")
+                        continue
+
+                cell = (algo_name, data_type, size)
+                if cell in precomputed:
+                    time_taken, ok = precomputed[cell]
+                else:
+                    time_taken, sorted_data = measure_sorting_run(
+                        sort_func, data
+                    )
+                    ok = is_sorted(sorted_data)
+                if not ok:
                     print(f"Ошибка: {algo_name} не отсортировал {data_type}")
                     continue
 
-                time_taken = measure_sorting_time(sort_func, data)
-                results_data[algo_name][data_type][size] = time_taken
+                measured[size] = time_taken
+                if checkpoint_path:
+                    save_checkpoint(checkpoint_path, results_data)
 
                 print(f"{data_type}, размер {size}: {time_taken:.6f} сек")
 
+    print_speedups(results_data)
+
+    return results_data
+
+
+def run_operation_counts(
+    sizes: List[int] = None
+) -> Dict[str, Any]:
+    """
+    Подсчет сравнений, перемещений, обменов и пиковой памяти.
+
+    Запускается отдельно от замеров времени: инструментированные
+    копии сортировок в разы медленнее исходных.
+
+    Returns:
+        Словарь algo -> тип данных -> размер -> счетчики
+        (см. instrumentation.count_operations).
+    """
+    if sizes is None:
+        sizes = [100, 1000, 5000, 10000]
+
+    datasets = generate_test_datasets(sizes)
+    operations_data: Dict[str, Any] = {}
+
+    for algo_name in SORTING_ALGORITHMS:
+        operations_data[algo_name] = {}
+        print(f"\nПодсчет операций {algo_name}...")
+
+        for data_type, size_data in datasets.items():
+            operations_data[algo_name][data_type] = {}
+
+            for size, data in size_data.items():
+                counts = count_operations(algo_name, data)
+                operations_data[algo_name][data_type][size] = counts
+                print(f"{data_type}, размер {size}: "
+                      f"сравнений {counts['comparisons']}, "
+                      f"перемещений {counts['moves']}, "
+                      f"обменов {counts['swaps']}, "
+                      f"пик памяти {counts['peak_memory']} Б")
+
+    return operations_data
+
+
+def print_speedups(results_data: Dict[str, Any]) -> None:
+    """Выводит ускорение улучшенных реализаций относительно базовых."""
+    for improved, baseline in IMPROVED_ALGORITHMS.items():
+        if improved not in results_data or baseline not in results_data:
+            continue
+
+        print(f"\nУскорение {improved} относительно {baseline}:")
+        for data_type, size_data in results_data[improved].items():
+            for size, time_taken in size_data.items():
+                base_time = results_data[baseline][data_type].get(size)
+                if base_time is None or time_taken <= 0:
+                    continue
+                print(f"{data_type}, размер {size}: "
+                      f"{base_time / time_taken:.2f}x")
+
+
+def run_improvement_benchmark(
+    sizes: List[int] = None
+) -> Dict[str, Any]:
+    """
+    Сравнивает улучшенные реализации с базовыми на больших массивах.
+
+    Квадратичные сортировки здесь не запускаются, поэтому размеры
+    можно брать от 10 тысяч элементов.
+    """
+    if sizes is None:
+        sizes = [10000, 50000, 100000]
+
+    datasets = generate_test_datasets(sizes)
+    names = set(IMPROVED_ALGORITHMS) | set(IMPROVED_ALGORITHMS.values())
+
+    results_data = {}
+    for algo_name in SORTING_ALGORITHMS:
+        if algo_name not in names:
+            continue
+        sort_func = SORTING_ALGORITHMS[algo_name]
+        results_data[algo_name] = {}
+
+        for data_type, size_data in datasets.items():
+            results_data[algo_name][data_type] = {}
+            for size, data in size_data.items():
+                results_data[algo_name][data_type][size] = (
+                    measure_sorting_time(sort_func, data)
+                )
+
+    print_speedups(results_data)
+
+    return results_data
+
+
+def run_linear_sort_benchmark(
+    sizes: List[int] = None,
+    comparison_max_size: int = 1000000
+) -> Dict[str, Dict[int, float]]:
+    """
+    Сравнивает линейные сортировки целых чисел с сортировками сравнением.
+
+    Данные - случайные числа из [0, 10000], как в generate_data.
+    Сортировки сравнением запускаются только до comparison_max_size
+    элементов: на 10 млн они работают минуты.
+    """
+    if sizes is None:
+        sizes = [100000, 1000000, 10000000]
+
+    algorithms: Dict[str, Callable[[List[int]], List[int]]] = {
+        'counting_sort (python)': lambda a: counting_sort(a, False),
+        'counting_sort (numpy)': lambda a: counting_sort(a, True),
+        'radix_sort (python)': lambda a: radix_sort(a, False),
+        'radix_sort (numpy)': lambda a: radix_sort(a, True),
+        'integer_sort (auto)': integer_sort,
+        'intro_sort': intro_sort,
+        'tim_sort': tim_sort,
+        'sorted (builtin)': sorted,
+    }
+    comparison_sorts = {'intro_sort', 'tim_sort'}
+
+    results_data: Dict[str, Dict[int, float]] = {
+        name: {} for name in algorithms
+    }
+
+    for size in sizes:
+        data = generate_random_array(size)
+        print(f"\nРазмер {size}:")
+
+        for algo_name, sort_func in algorithms.items():
+            if algo_name in comparison_sorts and size > comparison_max_size:
+                continue
+
+            time_taken = measure_sorting_time(sort_func, data)
+            results_data[algo_name][size] = time_taken
+            print(f"{algo_name:<24} {time_taken:.4f} сек")
+
+    return results_data
+
+
+def run_selection_benchmark(
+    size: int = 200000,
+    ratios: List[float] = None
+) -> Dict[str, Dict[int, float]]:
+    """
+    Сравнивает выбор k наименьших с полной сортировкой
+    для разных отношений k/n.
+
+    Для каждого k все способы дают k наименьших элементов
+    (quickselect - k-й из них), полные сортировки - с последующим
+    срезом [:k].
+    """
+    if ratios is None:
+        ratios = [0.0001, 0.001, 0.01, 0.1, 0.5]
+
+    data = generate_random_array(size, seed=0)
+    algorithms: Dict[str, Callable[[List[int], int], Any]] = {
+        'nsmallest': nsmallest,
+        'quickselect': lambda a, k: quickselect(a, k - 1),
+        'partial_sort': lambda a, k: partial_sort(a, k)[:k],
+        'intro_sort[:k]': lambda a, k: intro_sort(a)[:k],
+        'tim_sort[:k]': lambda a, k: tim_sort(a)[:k],
+    }
+
+    results_data: Dict[str, Dict[int, float]] = {
+        name: {} for name in algorithms
+    }
+
+    print(f"\nВыбор k наименьших из {size} элементов:")
+    for ratio in ratios:
+        k = max(1, int(size * ratio))
+        print(f"\nk = {k} (k/n = {ratio}):")
+
+        for algo_name, select in algorithms.items():
+            time_taken = measure_sorting_time(
+                lambda a: select(a, k), data
+            )
+            results_data[algo_name][k] = time_taken
+            print(f"{algo_name:<16} {time_taken:.4f} сек")
+
+    return results_data
+
+
+def run_string_sort_benchmark(
+    size: int = 100000,
+    data_types: List[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Сравнивает сортировки строк с сортировками сравнением.
+
+    Каждый тип данных из STRING_DATA_TYPES проверяется для str
+    и для bytes.
+    """
+    if data_types is None:
+        data_types = STRING_DATA_TYPES
+
+    algorithms: Dict[str, Callable[[List[Any]], List[Any]]] = dict(
+        STRING_SORTING_ALGORITHMS
+    )
+    algorithms['intro_sort'] = intro_sort
+    algorithms['tim_sort'] = tim_sort
+    algorithms['sorted (builtin)'] = sorted
+
+    results_data: Dict[str, Dict[str, float]] = {
+        name: {} for name in algorithms
+    }
+
+    print(f"\nСортировка {size} строк:")
+    for data_type in data_types:
+        for as_bytes in (False, True):
+            label = f"{data_type} ({'bytes' if as_bytes else 'str'})"
+            data = generate_string_array(
+                size, data_type, seed=0, as_bytes=as_bytes
+            )
+            print(f"\n{label}:")
+
+            for algo_name, sort_func in algorithms.items():
+                time_taken, sorted_data = measure_sorting_run(
+                    sort_func, data
+                )
+                if not is_sorted(sorted_data):
+                    print(f"Ошибка: {algo_name} не отсортировал {label}")
+                    continue
+                results_data[algo_name][label] = time_taken
+                print(f"{algo_name:<20} {time_taken:.4f} сек")
+
+    return results_data
+
+
+def run_argsort_benchmark(
+    size: int = 200000,
+    width: int = 32
+) -> Dict[str, Tuple[float, int]]:
+    """
+    Сортировка широких записей по одному полю: время и пиковая память.
+
+    Записи - списки из width чисел, ключ - первое поле. argsort
+    сортирует только пары (ключ, индекс), apply_permutation
+    переставляет записи на месте.
+    """
+    keys = generate_random_array(size, seed=0)
+    records = [[k] + [0] * (width - 1) for k in keys]
+
+    def first_field(record: List[int]) -> int:
+        return record[0]
+
+    def argsort_inplace(algorithm: str) -> Callable[[List[Any]], None]:
+        def run(rows: List[Any]) -> None:
+            apply_permutation(rows, argsort(rows, first_field, algorithm))
+        return run
+
+    algorithms: Dict[str, Callable[[List[Any]], Any]] = {
+        'sorted(key=...)': lambda rows: sorted(rows, key=first_field),
+        'argsort tim_sort': argsort_inplace('tim_sort'),
+        'argsort intro_sort': argsort_inplace('intro_sort'),
+        'argsort radix_sort': argsort_inplace('radix_sort'),
+    }
+
+    results_data: Dict[str, Tuple[float, int]] = {}
+    print(f"\nСортировка {size} записей по {width} полей:")
+    for algo_name, sort_func in algorithms.items():
+        time_taken, peak = measure_time_and_memory(
+            sort_func, lambda: records.copy()
+        )
+        results_data[algo_name] = (time_taken, peak)
+        print(f"{algo_name:<20} {time_taken:.4f} сек, "
+              f"пик памяти {peak / 1024 / 1024:.1f} МБ")
+
+    return results_data
+
+
+def run_merge_k_benchmark(
+    num_runs: int = 1000,
+    run_length: int = 100000
+) -> Dict[str, Tuple[float, int]]:
+    """
+    Слияние num_runs отсортированных серий по run_length элементов.
+
+    Серии - ленивые range с шагом num_runs, поэтому входные данные
+    не занимают памяти, и пик памяти показывает расход самого
+    слияния. Время измеряется на полном объеме, память - отдельным
+    запуском на сериях из 1000 элементов (она от длины серий
+    не зависит).
+
+    Returns:
+        Имя -> (время, пик памяти в байтах).
+    """
+    total = num_runs * run_length
+
+    def make_runs(length: int) -> List[range]:
+        return [range(i, num_runs * length, num_runs)
+                for i in range(num_runs)]
+
+    def consume(merged: Iterable[int]) -> None:
+        count = 0
+        prev = -1
+        for value in merged:
+            if value < prev:
+                raise AssertionError("Merge output is not sorted")
+            prev = value
+            count += 1
+        if count != prev + 1:
+            raise AssertionError("Merge lost or duplicated elements")
+
+    algorithms: Dict[str, Callable[[List[range]], Iterable[int]]] = {
+        'merge_k': merge_k,
+        'heapq.merge': lambda runs: heapq.merge(*runs),
+    }
+
+    results_data: Dict[str, Tuple[float, int]] = {}
+    print(f"\nСлияние {num_runs} серий по {run_length} "
+          f"({total} элементов):")
+    for algo_name, merge in algorithms.items():
+        time_taken = timeit.timeit(
+            lambda: consume(merge(make_runs(run_length))), number=1
+        )
+
+        tracemalloc.start()
+        consume(merge(make_runs(1000)))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results_data[algo_name] = (time_taken, peak)
+        print(f"{algo_name:<12} {time_taken:.2f} сек, "
+              f"{total / time_taken / 1e6:.2f} млн элементов/с, "
+              f"пик памяти {peak / 1024:.0f} КБ")
+
+    return results_data
+
+
+def run_small_sort_benchmark(
+    num_rows: int = 100000,
+    widths: List[int] = None
+) -> Dict[str, Dict[int, float]]:
+    """
+    Сортировка множества маленьких массивов.
+
+    Сравниваются insertion_sort и network_sort для каждой строки
+    отдельно, пакетная sort_rows по всем строкам сразу и np.sort
+    по оси 1 как эталон. Преобразование в списки выполняется
+    вне замеров.
+    """
+    import numpy as np
+
+    if widths is None:
+        widths = [4, 8, 16, 32]
+
+    rng = np.random.default_rng(0)
+    results_data: Dict[str, Dict[int, float]] = {
+        'insertion_sort (по строкам)': {},
+        'network_sort (по строкам)': {},
+        'sort_rows': {},
+        'np.sort(axis=1)': {},
+    }
+
+    print(f"\nСортировка {num_rows} маленьких массивов:")
+    for width in widths:
+        matrix = rng.integers(0, 10000, (num_rows, width))
+        rows = matrix.tolist()
+        expected = np.sort(matrix, axis=1)
+
+        timings = {
+            'insertion_sort (по строкам)': timeit.timeit(
+                lambda: [insertion_sort(row) for row in rows], number=1
+            ),
+            'network_sort (по строкам)': timeit.timeit(
+                lambda: [network_sort(row) for row in rows], number=1
+            ),
+            'sort_rows': timeit.timeit(
+                lambda: sort_rows(matrix), number=1
+            ),
+            'np.sort(axis=1)': timeit.timeit(
+                lambda: np.sort(matrix, axis=1), number=1
+            ),
+        }
+        if not np.array_equal(sort_rows(matrix), expected):
+            print(f"Ошибка: sort_rows не отсортировал строки длины {width}")
+
+        print(f"\nДлина строки {width}:")
+        for name, time_taken in timings.items():
+            results_data[name][width] = time_taken
+            print(f"{name:<28} {time_taken:.4f} сек")
+
+    return results_data
+
+
+def run_buffer_benchmark(
+    sizes: List[int] = None,
+    algorithms: List[str] = None
+) -> Dict[str, Dict[str, Dict[int, Tuple[float, int]]]]:
+    """
+    Сравнивает время и пиковую память для разных типов входных данных.
+
+    - list: функция из SORTING_ALGORITHMS (копия + список int);
+    - array('q') и numpy: sort_buffer(..., inplace=True) без копии.
+    """
+    if sizes is None:
+        sizes = [100000, 1000000]
+    if algorithms is None:
+        algorithms = ['intro_sort', 'counting_sort', 'radix_sort']
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    results_data: Dict[str, Dict[str, Dict[int, Tuple[float, int]]]] = {}
+
+    for algo_name in algorithms:
+        results_data[algo_name] = {}
+        print(f"\n{algo_name}:")
+
+        for size in sizes:
+            data = generate_random_array(size)
+
+            containers: Dict[str, Callable[[], Any]] = {
+                'list': lambda: data.copy(),
+                "array('q') inplace": lambda: array('q', data),
+            }
+            if np is not None:
+                containers['numpy inplace'] = (
+                    lambda: np.array(data, dtype=np.int64)
+                )
+
+            for container, make in containers.items():
+                if container == 'list':
+                    def run(buf: Any) -> Any:
+                        return SORTING_ALGORITHMS[algo_name](buf)
+                else:
+                    def run(buf: Any) -> Any:
+                        return sort_buffer(buf, algo_name, inplace=True)
+
+                time_taken, peak = measure_time_and_memory(run, make)
+                results_data[algo_name].setdefault(container, {})[size] = (
+                    time_taken, peak
+                )
+                print(f"{container:<20} размер {size}: "
+                      f"{time_taken:.4f} сек, "
+                      f"пик памяти {peak / 1024 / 1024:.1f} МБ")
+
     return results_data
 
 
+def run_parallel_scaling_benchmark(
+    size: int = 5000000,
+    max_workers: int = None,
+    algorithm: str = 'integer_sort'
+) -> Dict[int, float]:
+    """
+    Масштабирование parallel_sort от 1 до max_workers процессов.
+
+    Пул создается заранее и прогревается, чтобы время запуска
+    процессов не попадало в замер.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    data = generate_random_array(size)
+    results_data: Dict[int, float] = {}
+
+    print(f"\nМасштабирование parallel_sort ({algorithm}), размер {size}:")
+    for workers in range(1, max_workers + 1):
+        with create_pool(workers) as pool:
+            list(pool.map(abs, range(workers)))
+            time_taken = measure_sorting_time(
+                lambda a: parallel_sort(a, workers, algorithm, pool), data
+            )
+
+        results_data[workers] = time_taken
+        speedup = results_data[1] / time_taken
+        print(f"процессов {workers}: {time_taken:.4f} сек, "
+              f"ускорение {speedup:.2f}x")
+
+    return results_data
+
+
+def run_external_sort_benchmark(
+    size: int = 2000000,
+    memory_budgets: List[int] = None,
+    fan_ins: List[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Пропускная способность и число проходов внешней сортировки
+    в зависимости от бюджета памяти и коэффициента слияния.
+    """
+    if memory_budgets is None:
+        memory_budgets = [1024 * 1024, 4 * 1024 * 1024]
+    if fan_ins is None:
+        fan_ins = [4, 16]
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, 'input.bin')
+        output_path = os.path.join(work_dir, 'output.bin')
+        write_input_file(input_path, generate_random_array(size))
+
+        print(f"\nВнешняя сортировка, {size} чисел:")
+        for memory_budget in memory_budgets:
+            for fan_in in fan_ins:
+                stats = external_sort(
+                    input_path, output_path, memory_budget, fan_in
+                )
+                stats['memory_budget'] = memory_budget
+                stats['fan_in'] = fan_in
+                results.append(stats)
+
+                print(f"память {memory_budget // 1024} КБ, "
+                      f"fan-in {fan_in}: серий {stats['runs']}, "
+                      f"проходов {stats['passes']}, "
+                      f"{stats['seconds']:.2f} сек, "
+                      f"{stats['throughput_mb_s']:.1f} МБ/с")
+
+    return results
+
+
+# Дополнительные бенчмарки, запускаемые по --benchmarks.
+BENCHMARKS: Dict[str, Callable[[], Any]] = {
+    'improvement': run_improvement_benchmark,
+    'linear': run_linear_sort_benchmark,
+    'selection': run_selection_benchmark,
+    'strings': run_string_sort_benchmark,
+    'argsort': run_argsort_benchmark,
+    'merge_k': run_merge_k_benchmark,
+    'small': run_small_sort_benchmark,
+    'buffer': run_buffer_benchmark,
+    'parallel': run_parallel_scaling_benchmark,
+    'external': run_external_sort_benchmark,
+}
+
+
 def main() -> None:
-    """Основная функция."""
-    run_performance_tests()
+    """
+    Основная функция.
+
+    По умолчанию выполняется только основной прогон (main);
+    дополнительные бенчмарки из BENCHMARKS долгие и требуют много
+    памяти, поэтому запускаются только явно: --benchmarks main linear
+    или --benchmarks all.
+    """
+    parser = argparse.ArgumentParser(
+        description='Тестирование производительности сортировок'
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=None,
+        help='Размеры массивов основного прогона'
+    )
+    parser.add_argument(
+        '--time-budget', type=float, default=None,
+        help='Предел времени одного замера, сек'
+    )
+    parser.add_argument(
+        '--checkpoint', default=None,
+        help='Файл контрольной точки для продолжения прогона'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='Количество процессов для замеров основного прогона'
+    )
+    parser.add_argument(
+        '--benchmarks', nargs='+', default=['main'],
+        choices=['main', 'all'] + list(BENCHMARKS), metavar='NAME',
+        help='Бенчмарки для запуска: main, all, '
+             f"{', '.join(BENCHMARKS)} (по умолчанию - только main)"
+    )
+    args = parser.parse_args()
+
+    selected = set(args.benchmarks)
+    if 'all' in selected:
+        selected = {'main'} | set(BENCHMARKS)
+
+    if 'main' in selected:
+        run_performance_tests(
+            args.sizes, args.time_budget, args.checkpoint, args.workers
+        )
+    for name, benchmark in BENCHMARKS.items():
+        if name in selected:
+            benchmark()
 
 
 if __name__ == '__main__':
@@ -1,22 +1,70 @@
 """Модуль для визуализации результатов тестирования."""
 
-import matplotlib.pyplot as plt
-from typing import Dict, Any
-import numpy as np
+import argparse
+import os
+import sys
+from concurrent.futures import Future
+from typing import Dict, Any, Optional
 import csv
 
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'
+))
+from complexity_fit import (  # noqa: E402
+    check_complexity, fit_complexity, format_fit_report
+)
+from render import render_figure, wait_for_renders  # noqa: E402
+
+OPERATION_METRICS = {
+    'comparisons': 'Количество сравнений',
+    'moves': 'Количество перемещений',
+    'swaps': 'Количество обменов',
+    'peak_memory': 'Пиковая дополнительная память (байт)',
+}
+
+# Заявленная сложность на случайных данных.
+DECLARED_COMPLEXITY = {
+    'bubble_sort': 'O(n^2)',
+    'selection_sort': 'O(n^2)',
+    'insertion_sort': 'O(n^2)',
+    'merge_sort': 'O(n log n)',
+    'bottom_up_merge_sort': 'O(n log n)',
+    'quick_sort': 'O(n log n)',
+    'intro_sort': 'O(n log n)',
+    'tim_sort': 'O(n log n)',
+    'counting_sort': 'O(n)',
+    'radix_sort': 'O(n)',
+    'integer_sort': 'O(n)',
+}
+
 
 def plot_time_vs_size(
     results_data: Dict[str, Any],
-    data_type: str = 'random'
-) -> None:
+    data_type: str = 'random',
+    show: bool = False
+) -> Optional[Future]:
     """
     Строит график зависимости времени выполнения от размера массива.
+
+    График отрисовывается в фоне в time_vs_size_<data_type>.png
+    (см. render_figure).
     """
+    return render_figure(
+        f'time_vs_size_{data_type}.png', _draw_time_vs_size,
+        results_data, data_type, show=show
+    )
+
+
+def _draw_time_vs_size(results_data: Dict[str, Any], data_type: str) -> None:
+    """Отрисовка графика plot_time_vs_size."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     plt.figure(figsize=(12, 8))
 
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-    markers = ['o', 's', '^', 'D', 'v']
+    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+              '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+    markers = ['o', 's', '^', 'D', 'v', 'P', 'X', '*', 'h', '<']
 
     for i, (algo_name, data_types_data) in enumerate(results_data.items()):
         if data_type in data_types_data:
@@ -34,10 +82,10 @@ def plot_time_vs_size(
             plt.plot(
                 sizes_sorted,
                 times_sorted,
-                marker=markers[i],
+                marker=markers[i % len(markers)],
                 label=algo_name,
                 linewidth=2,
-                color=colors[i],
+                color=colors[i % len(colors)],
                 markersize=6
             )
 
@@ -52,23 +100,35 @@ def plot_time_vs_size(
     plt.yscale('log')
 
     plt.tight_layout()
-    plt.savefig(f'time_vs_size_{data_type}.png', dpi=300)
-    plt.show()
 
 
 def plot_time_vs_datatype(
     results_data: Dict[str, Any],
-    size: int = 5000
-) -> None:
+    size: int = 5000,
+    show: bool = False
+) -> Optional[Future]:
     """
     Строит график зависимости времени выполнения от типа данных.
+
+    График отрисовывается в фоне в time_vs_datatype_size_<size>.png.
     """
+    return render_figure(
+        f'time_vs_datatype_size_{size}.png', _draw_time_vs_datatype,
+        results_data, size, show=show
+    )
+
+
+def _draw_time_vs_datatype(results_data: Dict[str, Any], size: int) -> None:
+    """Отрисовка графика plot_time_vs_datatype."""
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 8))
 
     data_types = ['random', 'sorted', 'reversed', 'almost_sorted']
 
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-    markers = ['o', 's', '^', 'D', 'v']
+    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+              '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+    markers = ['o', 's', '^', 'D', 'v', 'P', 'X', '*', 'h', '<']
 
     for i, (algo_name, data_types_data) in enumerate(results_data.items()):
         times = []
@@ -82,10 +142,10 @@ def plot_time_vs_datatype(
             plt.plot(
                 data_types,
                 times,
-                marker=markers[i],
+                marker=markers[i % len(markers)],
                 label=algo_name,
                 linewidth=2,
-                color=colors[i],
+                color=colors[i % len(colors)],
                 markersize=8
             )
 
@@ -100,8 +160,76 @@ def plot_time_vs_datatype(
     plt.yscale('log')
 
     plt.tight_layout()
-    plt.savefig(f'time_vs_datatype_size_{size}.png', dpi=300)
-    plt.show()
+
+
+def plot_operations_vs_size(
+    operations_data: Dict[str, Any],
+    metric: str = 'comparisons',
+    data_type: str = 'random',
+    show: bool = False
+) -> Optional[Future]:
+    """
+    Строит график зависимости счетчика операций от размера массива.
+
+    График отрисовывается в фоне в <metric>_vs_size_<data_type>.png.
+
+    Args:
+        operations_data: Результат run_operation_counts.
+        metric: Ключ из OPERATION_METRICS.
+        data_type: Тип данных.
+        show: Показать окно с графиком (при наличии дисплея).
+    """
+    return render_figure(
+        f'{metric}_vs_size_{data_type}.png', _draw_operations_vs_size,
+        operations_data, metric, data_type, show=show
+    )
+
+
+def _draw_operations_vs_size(
+    operations_data: Dict[str, Any], metric: str, data_type: str
+) -> None:
+    """Отрисовка графика plot_operations_vs_size."""
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 8))
+
+    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+              '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+    markers = ['o', 's', '^', 'D', 'v', 'P', 'X', '*', 'h', '<']
+
+    for i, (algo_name, data_types_data) in enumerate(
+            operations_data.items()):
+        if data_type not in data_types_data:
+            continue
+
+        sizes = sorted(data_types_data[data_type])
+        values = [data_types_data[data_type][size][metric] for size in sizes]
+
+        # Нулевые значения (обмены у сортировок слиянием и т.п.)
+        # не отображаются на логарифмической шкале.
+        if not any(values):
+            continue
+
+        plt.plot(
+            sizes,
+            values,
+            marker=markers[i % len(markers)],
+            label=algo_name,
+            linewidth=2,
+            color=colors[i % len(colors)],
+            markersize=6
+        )
+
+    plt.xlabel('Размер массива')
+    plt.ylabel(OPERATION_METRICS[metric])
+    plt.title(f'{OPERATION_METRICS[metric]} в зависимости от размера массива'
+              f'\n({data_type} данные)')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.xscale('log')
+    plt.yscale('log')
+
+    plt.tight_layout()
 
 
 def create_summary_table(results_data: Dict[str, Any]) -> str:
@@ -136,15 +264,51 @@ def create_summary_table(results_data: Dict[str, Any]) -> str:
     return table
 
 
+def print_complexity_report(
+    results_data: Dict[str, Any],
+    data_type: str = 'random'
+) -> None:
+    """
+    Подбор модели сложности по замерам времени каждого алгоритма.
+
+    Для алгоритмов из DECLARED_COMPLEXITY замеры сверяются с заявленной
+    сложностью; при расхождении выдается ComplexityWarning.
+    """
+    print(f"\nЭмпирическая сложность ({data_type} данные):")
+    for algo_name, data_types_data in results_data.items():
+        sizes_data = data_types_data.get(data_type, {})
+        if len(sizes_data) < 3:
+            continue
+
+        sizes = sorted(sizes_data)
+        times = [sizes_data[size] for size in sizes]
+        declared = DECLARED_COMPLEXITY.get(algo_name)
+        if declared is None:
+            fits = fit_complexity(sizes, times)
+        else:
+            fits = check_complexity(sizes, times, declared, algo_name)
+        print(format_fit_report(algo_name, fits, declared))
+
+
 def save_results_to_csv(
     results_data: Dict[str, Any],
-    filename: str = 'results_detailed.csv'
+    filename: str = 'results_detailed.csv',
+    operations_data: Dict[str, Any] = None
 ) -> None:
-    """Сохраняет детальные результаты в CSV."""
+    """
+    Сохраняет детальные результаты в CSV.
+
+    Если передан operations_data (результат run_operation_counts),
+    добавляются столбцы со счетчиками операций и пиковой памятью.
+    """
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.writer(csvfile)
 
-        writer.writerow(['Алгоритм', 'Тип данных', 'Размер', 'Время (сек)'])
+        header = ['Алгоритм', 'Тип данных', 'Размер', 'Время (сек)']
+        if operations_data is not None:
+            header += ['Сравнения', 'Перемещения', 'Обмены',
+                       'Пик памяти (байт)']
+        writer.writerow(header)
 
         for algo_name, data_types_data in results_data.items():
             for data_type, sizes_data in data_types_data.items():
@@ -152,28 +316,64 @@ def save_results_to_csv(
                     row = [
                         algo_name, data_type, size, f"{time_val:.6f}"
                     ]
+                    if operations_data is not None:
+                        counts = operations_data.get(algo_name, {}).get(
+                            data_type, {}).get(size)
+                        if counts is None:
+                            row += [''] * len(OPERATION_METRICS)
+                        else:
+                            row += [counts[metric]
+                                    for metric in OPERATION_METRICS]
                     writer.writerow(row)
 
 
 def main() -> None:
     """Основная функция."""
-    from performance_test import run_performance_tests
+    from performance_test import run_operation_counts, run_performance_tests
+
+    parser = argparse.ArgumentParser(
+        description='Тестирование и визуализация алгоритмов сортировки'
+    )
+    parser.add_argument(
+        '--count-operations', action='store_true',
+        help='Дополнительно подсчитать сравнения, перемещения, обмены '
+             'и пиковую память'
+    )
+    parser.add_argument(
+        '--show', action='store_true',
+        help='Показать графики в окне (иначе только сохранить в файлы)'
+    )
+    args = parser.parse_args()
 
     test_results = run_performance_tests()
 
-    plot_time_vs_size(test_results, 'random')
+    operations_data = None
+    if args.count_operations:
+        operations_data = run_operation_counts()
+        for metric in OPERATION_METRICS:
+            plot_operations_vs_size(
+                operations_data, metric, 'random', show=args.show
+            )
+
+    plot_time_vs_size(test_results, 'random', show=args.show)
 
-    plot_time_vs_datatype(test_results, 5000)
+    plot_time_vs_datatype(test_results, 5000, show=args.show)
 
     summary_table = create_summary_table(test_results)
     print(summary_table)
 
-    save_results_to_csv(test_results)
+    print_complexity_report(test_results, 'random')
+
+    save_results_to_csv(test_results, operations_data=operations_data)
+    wait_for_renders()
 
     print("Результаты сохранены в файлы:")
     print("- results_detailed.csv")
     print("- time_vs_size_random.png")
     print("- time_vs_datatype_size_5000.png")
+    if operations_data is not None:
+        for metric in OPERATION_METRICS:
+            print(f"- {metric}_vs_size_random.png")
 
 
 if __name__ == '__main__':
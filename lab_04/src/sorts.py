@@ -1,6 +1,12 @@
 """Модуль с реализацией алгоритмов сортировки."""
 
-from typing import List
+import bisect
+import heapq
+from array import array as typed_array
+from typing import (
+    Any, Callable, Iterable, Iterator, List, MutableSequence, Optional,
+    Sequence, Tuple
+)
 
 
 def bubble_sort(arr: List[int]) -> List[int]:
@@ -121,6 +127,62 @@ def _merge(left: List[int], right: List[int]) -> List[int]:
     return result
 
 
+_EXHAUSTED = object()
+
+
+def merge_k(
+    iterables: Iterable[Iterable[Any]],
+    key: Optional[Callable[[Any], Any]] = None
+) -> Iterator[Any]:
+    """
+    Ленивое k-путевое слияние отсортированных последовательностей.
+
+    Обобщение _merge на k входов без материализации результата:
+    в куче хранится по одному текущему элементу каждого входа
+    в виде [ключ, номер входа, элемент, итератор]. Выданный минимум
+    заменяется следующим элементом того же входа (heapreplace).
+    Номер входа разрешает равенство ключей, поэтому слияние устойчиво.
+    Когда остается один вход, его остаток выдается без кучи.
+
+    Временная сложность: O(n log k) для n элементов из k входов
+    Пространственная сложность: O(k)
+
+    Args:
+        iterables: Отсортированные по возрастанию ключа
+            последовательности (итераторы читаются по мере слияния).
+        key: Функция ключа (по умолчанию - сам элемент).
+
+    Yields:
+        Элементы всех входов в порядке возрастания ключа.
+    """
+    heap = []
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        value = next(iterator, _EXHAUSTED)
+        if value is not _EXHAUSTED:
+            heap.append([
+                value if key is None else key(value), index, value, iterator
+            ])
+    heapq.heapify(heap)
+
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+
+        value = next(entry[3], _EXHAUSTED)
+        if value is _EXHAUSTED:
+            heapq.heappop(heap)
+        else:
+            entry[0] = value if key is None else key(value)
+            entry[2] = value
+            heapq.heapreplace(heap, entry)
+
+    if heap:
+        _, _, value, iterator = heap[0]
+        yield value
+        yield from iterator
+
+
 def quick_sort(arr: List[int]) -> List[int]:
     """
     Быстрая сортировка.
@@ -143,6 +205,988 @@ def quick_sort(arr: List[int]) -> List[int]:
     return quick_sort(left) + middle + quick_sort(right)
 
 
+INSERTION_SORT_CUTOFF = 16
+NINTHER_THRESHOLD = 128
+
+
+def intro_sort(arr: List[int]) -> List[int]:
+    """
+    Интроспективная сортировка (introsort).
+
+    Быстрая сортировка на месте с разбиением Хоара и выбором опорного
+    элемента медианой трех (или псевдомедианой девяти для больших
+    отрезков). Короткие отрезки досортировываются вставками, а при
+    превышении глубины рекурсии 2·log n отрезок сортируется кучей.
+
+    Временная сложность:
+    - Худший случай: O(n log n)
+    - Средний случай: O(n log n)
+    - Лучший случай: O(n log n)
+
+    Пространственная сложность: O(log n)
+    """
+    array = arr.copy()
+    n = len(array)
+
+    if n > 1:
+        _intro_sort_range(array, 0, n - 1, 2 * (n.bit_length() - 1))
+
+    return array
+
+
+def _intro_sort_range(
+    array: List[int], lo: int, hi: int, depth: int
+) -> None:
+    """Сортирует array[lo..hi] на месте."""
+    while hi - lo + 1 > INSERTION_SORT_CUTOFF:
+        if depth == 0:
+            _heap_sort_range(array, lo, hi)
+            return
+        depth -= 1
+
+        split = _hoare_partition(array, lo, hi)
+
+        # Рекурсия в меньшую часть, цикл по большей: глубина стека
+        # не превышает O(log n).
+        if split - lo < hi - split:
+            _intro_sort_range(array, lo, split, depth)
+            lo = split + 1
+        else:
+            _intro_sort_range(array, split + 1, hi, depth)
+            hi = split
+
+    _insertion_sort_range(array, lo, hi)
+
+
+def _median_of_three(array: List[int], i: int, j: int, k: int) -> int:
+    """Индекс медианы из элементов array[i], array[j], array[k]."""
+    a, b, c = array[i], array[j], array[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+def _hoare_partition(array: List[int], lo: int, hi: int) -> int:
+    """
+    Разбиение Хоара отрезка array[lo..hi].
+
+    Опорный элемент переносится в середину отрезка, поэтому обе части
+    разбиения непусты.
+
+    Returns:
+        Индекс split: array[lo..split] <= pivot <= array[split+1..hi].
+    """
+    mid = (lo + hi) // 2
+
+    if hi - lo + 1 > NINTHER_THRESHOLD:
+        step = (hi - lo) // 8
+        pivot_index = _median_of_three(
+            array,
+            _median_of_three(array, lo, lo + step, lo + 2 * step),
+            _median_of_three(array, mid - step, mid, mid + step),
+            _median_of_three(array, hi - 2 * step, hi - step, hi)
+        )
+    else:
+        pivot_index = _median_of_three(array, lo, mid, hi)
+
+    array[mid], array[pivot_index] = array[pivot_index], array[mid]
+    pivot = array[mid]
+
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while array[i] < pivot:
+            i += 1
+        j -= 1
+        while array[j] > pivot:
+            j -= 1
+        if i >= j:
+            return j
+        array[i], array[j] = array[j], array[i]
+
+
+def _insertion_sort_range(array: List[int], lo: int, hi: int) -> None:
+    """Сортировка вставками отрезка array[lo..hi] на месте."""
+    for i in range(lo + 1, hi + 1):
+        key = array[i]
+        j = i - 1
+
+        while j >= lo and array[j] > key:
+            array[j + 1] = array[j]
+            j -= 1
+
+        array[j + 1] = key
+
+
+def _heap_sort_range(array: List[int], lo: int, hi: int) -> None:
+    """Пирамидальная сортировка отрезка array[lo..hi] на месте."""
+    n = hi - lo + 1
+
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(array, lo, start, n)
+
+    for end in range(n - 1, 0, -1):
+        array[lo], array[lo + end] = array[lo + end], array[lo]
+        _sift_down(array, lo, 0, end)
+
+
+def _sift_down(array: List[int], lo: int, root: int, size: int) -> None:
+    """Просеивание вниз в куче array[lo..lo+size-1]."""
+    value = array[lo + root]
+
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and array[lo + child + 1] > array[lo + child]:
+            child += 1
+        if array[lo + child] <= value:
+            break
+        array[lo + root] = array[lo + child]
+        root = child
+
+    array[lo + root] = value
+
+
+def bottom_up_merge_sort(arr: List[int]) -> List[int]:
+    """
+    Восходящая (итеративная) сортировка слиянием.
+
+    Один вспомогательный буфер выделяется один раз, и на каждом проходе
+    источник и буфер меняются ролями. Начальные отрезки длиной
+    INSERTION_SORT_CUTOFF сортируются вставками. Если соседние отрезки
+    уже упорядочены (left[-1] <= right[0]), слияние заменяется
+    копированием среза.
+
+    Временная сложность:
+    - Худший случай: O(n log n)
+    - Средний случай: O(n log n)
+    - Лучший случай: O(n) сравнений (на упорядоченных данных проходы
+      сводятся к копированию срезов)
+
+    Пространственная сложность: O(n)
+    """
+    src = arr.copy()
+    n = len(src)
+    if n <= 1:
+        return src
+
+    width = INSERTION_SORT_CUTOFF
+    for lo in range(0, n, width):
+        _insertion_sort_range(src, lo, min(lo + width, n) - 1)
+
+    dst = [0] * n
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+
+            if mid >= hi or src[mid - 1] <= src[mid]:
+                dst[lo:hi] = src[lo:hi]
+            else:
+                _merge_into(src, dst, lo, mid, hi)
+
+        src, dst = dst, src
+        width *= 2
+
+    return src
+
+
+def _merge_into(
+    src: List[int], dst: List[int], lo: int, mid: int, hi: int
+) -> None:
+    """Слияние src[lo:mid] и src[mid:hi] в dst[lo:hi]."""
+    i, j, k = lo, mid, lo
+
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+MIN_MERGE = 32
+MIN_GALLOP = 7
+
+
+def tim_sort(arr: List[int]) -> List[int]:
+    """
+    Адаптивная сортировка естественными сериями (в стиле Timsort).
+
+    Массив разбивается на уже упорядоченные серии: неубывающие берутся
+    как есть, строго убывающие разворачиваются. Короткие серии
+    дополняются бинарными вставками до minrun. Серии хранятся в стеке
+    и сливаются с соблюдением инвариантов Timsort, а при слиянии
+    используется режим галопа для длинных упорядоченных участков.
+
+    Временная сложность:
+    - Худший случай: O(n log n)
+    - Средний случай: O(n log n)
+    - Лучший случай: O(n) (упорядоченные и почти упорядоченные данные)
+
+    Пространственная сложность: O(n)
+    """
+    array = arr.copy()
+    if len(array) > 1:
+        _TimSort(array).sort()
+    return array
+
+
+def _compute_min_run(n: int) -> int:
+    """Минимальная длина серии: от MIN_MERGE / 2 до MIN_MERGE."""
+    remainder = 0
+    while n >= MIN_MERGE:
+        remainder |= n & 1
+        n >>= 1
+    return n + remainder
+
+
+def _count_run_and_make_ascending(
+    array: List[int], lo: int, hi: int
+) -> int:
+    """
+    Длина серии, начинающейся в lo (hi не включается).
+
+    Строго убывающая серия разворачивается на месте; строгость
+    нужна для устойчивости сортировки.
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if array[run_hi] < array[lo]:
+        run_hi += 1
+        while run_hi < hi and array[run_hi] < array[run_hi - 1]:
+            run_hi += 1
+        array[lo:run_hi] = array[lo:run_hi][::-1]
+    else:
+        run_hi += 1
+        while run_hi < hi and array[run_hi] >= array[run_hi - 1]:
+            run_hi += 1
+
+    return run_hi - lo
+
+
+def _binary_insertion_sort(
+    array: List[int], lo: int, hi: int, start: int
+) -> None:
+    """Досортировка array[lo:hi] бинарными вставками (array[lo:start])."""
+    for i in range(start, hi):
+        pivot = array[i]
+        pos = bisect.bisect_right(array, pivot, lo, i)
+        array[pos + 1:i + 1] = array[pos:i]
+        array[pos] = pivot
+
+
+def _gallop_left(
+    key: int, array: List[int], base: int, length: int, hint: int
+) -> int:
+    """
+    Позиция k в array[base:base+length] для вставки key слева от равных.
+
+    Экспоненциальный поиск от base+hint сужает отрезок, затем
+    выполняется бинарный поиск.
+    """
+    last_ofs, ofs = 0, 1
+    if key > array[base + hint]:
+        max_ofs = length - hint
+        while ofs < max_ofs and key > array[base + hint + ofs]:
+            last_ofs, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+    else:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key <= array[base + hint - ofs]:
+            last_ofs, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    return bisect.bisect_left(
+        array, key, base + last_ofs + 1, base + ofs
+    ) - base
+
+
+def _gallop_right(
+    key: int, array: List[int], base: int, length: int, hint: int
+) -> int:
+    """Позиция k в array[base:base+length] для вставки key справа от равных."""
+    last_ofs, ofs = 0, 1
+    if key < array[base + hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < array[base + hint - ofs]:
+            last_ofs, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        max_ofs = length - hint
+        while ofs < max_ofs and key >= array[base + hint + ofs]:
+            last_ofs, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+
+    return bisect.bisect_right(
+        array, key, base + last_ofs + 1, base + ofs
+    ) - base
+
+
+class _TimSort:
+    """Состояние одной сортировки: массив, стек серий и порог галопа."""
+
+    def __init__(self, array: List[int]) -> None:
+        self.array = array
+        self.runs: List[Tuple[int, int]] = []
+        self.min_gallop = MIN_GALLOP
+        # Срез memoryview или ndarray - представление той же памяти,
+        # и временный буфер слияния нужно копировать явно.
+        self.slices_are_views = not isinstance(array, (list, typed_array))
+
+    def _copy_run(self, lo: int, hi: int) -> Any:
+        """Копия array[lo:hi] для временного буфера слияния."""
+        run = self.array[lo:hi]
+        return _copy_buffer(run) if self.slices_are_views else run
+
+    def sort(self) -> None:
+        """Разбиение на серии и их слияние."""
+        array = self.array
+        n = len(array)
+        min_run = _compute_min_run(n)
+
+        lo = 0
+        while lo < n:
+            run_len = _count_run_and_make_ascending(array, lo, n)
+            if run_len < min_run:
+                force = min(n - lo, min_run)
+                _binary_insertion_sort(array, lo, lo + force, lo + run_len)
+                run_len = force
+
+            self.runs.append((lo, run_len))
+            self._merge_collapse()
+            lo += run_len
+
+        self._merge_force_collapse()
+
+    def _merge_collapse(self) -> None:
+        """
+        Восстановление инвариантов стека серий X, Y, Z (сверху вниз):
+        |Z| > |Y| + |X| и |Y| > |X|.
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                    (n > 1 and
+                     runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self._merge_at(n)
+
+    def _merge_force_collapse(self) -> None:
+        """Слияние всех оставшихся серий."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self._merge_at(n)
+
+    def _merge_at(self, i: int) -> None:
+        """Слияние серий i и i + 1 стека."""
+        array = self.array
+        base1, len1 = self.runs[i]
+        base2, len2 = self.runs[i + 1]
+        self.runs[i] = (base1, len1 + len2)
+        del self.runs[i + 1]
+
+        # Начало первой серии и конец второй уже стоят на своих местах.
+        k = _gallop_right(array[base2], array, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        len2 = _gallop_left(
+            array[base1 + len1 - 1], array, base2, len2, len2 - 1
+        )
+        if len2 == 0:
+            return
+
+        if len1 <= len2:
+            self._merge_lo(base1, len1, base2, len2)
+        else:
+            self._merge_hi(base1, len1, base2, len2)
+
+    def _merge_lo(self, base1: int, len1: int, base2: int, len2: int) -> None:
+        """Слияние слева направо; во временный буфер копируется серия 1."""
+        array = self.array
+        tmp = self._copy_run(base1, base1 + len1)
+        c1, c2, dest = 0, base2, base1
+        end2 = base2 + len2
+
+        c1, dest = self._merge_lo_loop(tmp, len1, c1, c2, end2, dest)
+        if c1 < len1:
+            array[dest:dest + len1 - c1] = tmp[c1:len1]
+
+    def _merge_lo_loop(
+        self, tmp: List[int], len1: int, c1: int, c2: int, end2: int,
+        dest: int
+    ) -> Tuple[int, int]:
+        """Основной цикл _merge_lo; возвращает (c1, dest) после выхода."""
+        array = self.array
+        while True:
+            count1 = count2 = 0
+            while True:
+                if array[c2] < tmp[c1]:
+                    array[dest] = array[c2]
+                    dest += 1
+                    c2 += 1
+                    if c2 == end2:
+                        return c1, dest
+                    count2 += 1
+                    count1 = 0
+                    if count2 >= self.min_gallop:
+                        break
+                else:
+                    array[dest] = tmp[c1]
+                    dest += 1
+                    c1 += 1
+                    if c1 == len1:
+                        return c1, dest
+                    count1 += 1
+                    count2 = 0
+                    if count1 >= self.min_gallop:
+                        break
+
+            # Режим галопа: одна из серий долго "выигрывает",
+            # поэтому ее участки копируются целиком.
+            while True:
+                count1 = _gallop_right(array[c2], tmp, c1, len1 - c1, 0)
+                if count1:
+                    array[dest:dest + count1] = tmp[c1:c1 + count1]
+                    dest += count1
+                    c1 += count1
+                    if c1 == len1:
+                        return c1, dest
+                array[dest] = array[c2]
+                dest += 1
+                c2 += 1
+                if c2 == end2:
+                    return c1, dest
+
+                count2 = _gallop_left(tmp[c1], array, c2, end2 - c2, 0)
+                if count2:
+                    array[dest:dest + count2] = array[c2:c2 + count2]
+                    dest += count2
+                    c2 += count2
+                    if c2 == end2:
+                        return c1, dest
+                array[dest] = tmp[c1]
+                dest += 1
+                c1 += 1
+                if c1 == len1:
+                    return c1, dest
+
+                self.min_gallop = max(1, self.min_gallop - 1)
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+
+            self.min_gallop += 2
+
+    def _merge_hi(self, base1: int, len1: int, base2: int, len2: int) -> None:
+        """Слияние справа налево; во временный буфер копируется серия 2."""
+        array = self.array
+        tmp = self._copy_run(base2, base2 + len2)
+        c1, c2, dest = base1 + len1 - 1, len2 - 1, base2 + len2 - 1
+
+        c2, dest = self._merge_hi_loop(tmp, base1, c1, c2, dest)
+        if c2 >= 0:
+            array[dest - c2:dest + 1] = tmp[:c2 + 1]
+
+    def _merge_hi_loop(
+        self, tmp: List[int], base1: int, c1: int, c2: int, dest: int
+    ) -> Tuple[int, int]:
+        """Основной цикл _merge_hi; возвращает (c2, dest) после выхода."""
+        array = self.array
+        while True:
+            count1 = count2 = 0
+            while True:
+                if tmp[c2] < array[c1]:
+                    array[dest] = array[c1]
+                    dest -= 1
+                    c1 -= 1
+                    if c1 < base1:
+                        return c2, dest
+                    count1 += 1
+                    count2 = 0
+                    if count1 >= self.min_gallop:
+                        break
+                else:
+                    array[dest] = tmp[c2]
+                    dest -= 1
+                    c2 -= 1
+                    if c2 < 0:
+                        return c2, dest
+                    count2 += 1
+                    count1 = 0
+                    if count2 >= self.min_gallop:
+                        break
+
+            while True:
+                length1 = c1 - base1 + 1
+                count1 = length1 - _gallop_right(
+                    tmp[c2], array, base1, length1, length1 - 1
+                )
+                if count1:
+                    dest -= count1
+                    c1 -= count1
+                    array[dest + 1:dest + 1 + count1] = (
+                        array[c1 + 1:c1 + 1 + count1]
+                    )
+                    if c1 < base1:
+                        return c2, dest
+                array[dest] = tmp[c2]
+                dest -= 1
+                c2 -= 1
+                if c2 < 0:
+                    return c2, dest
+
+                count2 = c2 + 1 - _gallop_left(array[c1], tmp, 0, c2 + 1, c2)
+                if count2:
+                    dest -= count2
+                    c2 -= count2
+                    array[dest + 1:dest + 1 + count2] = (
+                        tmp[c2 + 1:c2 + 1 + count2]
+                    )
+                    if c2 < 0:
+                        return c2, dest
+                array[dest] = array[c1]
+                dest -= 1
+                c1 -= 1
+                if c1 < base1:
+                    return c2, dest
+
+                self.min_gallop = max(1, self.min_gallop - 1)
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+
+            self.min_gallop += 2
+
+
+COUNTING_SORT_MAX_RANGE = 1 << 16
+NUMPY_THRESHOLD = 10000
+RADIX_BITS = 8
+RADIX_MASK = (1 << RADIX_BITS) - 1
+
+
+def _numpy_available() -> bool:
+    """Проверяет, установлен ли NumPy."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _should_use_numpy(
+    use_numpy: Optional[bool], n: int, lo: int, hi: int
+) -> bool:
+    """
+    Выбор векторизованной ветки: явно или по размеру массива.
+
+    Значения вне диапазона int64 всегда сортируются на чистом Python.
+    """
+    if not -(1 << 63) <= lo <= hi < (1 << 63):
+        return False
+    if use_numpy is None:
+        return n >= NUMPY_THRESHOLD and _numpy_available()
+    return use_numpy
+
+
+def counting_sort(
+    arr: List[int], use_numpy: Optional[bool] = None
+) -> List[int]:
+    """
+    Сортировка подсчетом для целых чисел из небольшого диапазона.
+
+    Временная сложность: O(n + k), где k = max - min + 1
+    Пространственная сложность: O(n + k)
+
+    Args:
+        arr: Массив целых чисел (допускаются отрицательные).
+        use_numpy: True/False - принудительный выбор ветки,
+            None - NumPy для массивов от NUMPY_THRESHOLD элементов.
+    """
+    if len(arr) <= 1:
+        return arr.copy()
+
+    lo, hi = min(arr), max(arr)
+
+    if _should_use_numpy(use_numpy, len(arr), lo, hi):
+        return _counting_sort_numpy(arr, lo, hi)
+
+    counts = [0] * (hi - lo + 1)
+    for x in arr:
+        counts[x - lo] += 1
+
+    result = []
+    for offset, count in enumerate(counts):
+        if count:
+            result.extend([offset + lo] * count)
+    return result
+
+
+def _counting_sort_numpy(arr: List[int], lo: int, hi: int) -> List[int]:
+    """Векторизованная сортировка подсчетом (bincount + repeat)."""
+    import numpy as np
+
+    values = np.asarray(arr, dtype=np.int64)
+    counts = np.bincount(values - lo, minlength=hi - lo + 1)
+    return np.repeat(
+        np.arange(lo, hi + 1, dtype=np.int64), counts
+    ).tolist()
+
+
+def radix_sort(arr: List[int], use_numpy: Optional[bool] = None) -> List[int]:
+    """
+    Поразрядная сортировка LSD по байтам.
+
+    Каждый проход - устойчивое распределение по 256 корзинам
+    по очередному байту значения. Отрицательные числа сдвигаются
+    на минимум массива. Количество проходов определяется разрядностью
+    диапазона max - min.
+
+    Временная сложность: O(n * w / 8), где w - число бит диапазона
+    Пространственная сложность: O(n)
+
+    Args:
+        arr: Массив целых чисел.
+        use_numpy: True/False - принудительный выбор ветки,
+            None - NumPy для массивов от NUMPY_THRESHOLD элементов.
+    """
+    if len(arr) <= 1:
+        return arr.copy()
+
+    lo, hi = min(arr), max(arr)
+    bits = (hi - lo).bit_length()
+
+    if _should_use_numpy(use_numpy, len(arr), lo, hi):
+        return _radix_sort_numpy(arr, lo, bits)
+
+    array = [x - lo for x in arr] if lo else arr.copy()
+    for shift in range(0, bits, RADIX_BITS):
+        buckets: List[List[int]] = [[] for _ in range(RADIX_MASK + 1)]
+        for x in array:
+            buckets[(x >> shift) & RADIX_MASK].append(x)
+        array = [x for bucket in buckets for x in bucket]
+
+    return [x + lo for x in array] if lo else array
+
+
+def _radix_sort_numpy(arr: List[int], lo: int, bits: int) -> List[int]:
+    """
+    Векторизованная поразрядная сортировка.
+
+    Устойчивая сортировка NumPy для массивов uint8 сама является
+    сортировкой подсчетом, поэтому каждый проход - один вызов
+    argsort(kind='stable') по байту и перестановка ключей.
+    """
+    import numpy as np
+
+    keys = np.asarray(arr, dtype=np.int64) - np.int64(lo)
+    keys = keys.astype(np.uint64)
+
+    for shift in range(0, bits, RADIX_BITS):
+        digits = ((keys >> np.uint64(shift)) & np.uint64(RADIX_MASK)).astype(
+            np.uint8
+        )
+        keys = keys[np.argsort(digits, kind='stable')]
+
+    return (keys.astype(np.int64) + np.int64(lo)).tolist()
+
+
+def integer_sort(
+    arr: List[int], use_numpy: Optional[bool] = None
+) -> List[int]:
+    """
+    Линейная сортировка целых чисел с автоматическим выбором стратегии.
+
+    Если диапазон значений не превышает COUNTING_SORT_MAX_RANGE
+    и размера массива, используется сортировка подсчетом,
+    иначе - поразрядная сортировка.
+
+    Временная сложность: O(n + k) или O(n * w / 8)
+    Пространственная сложность: O(n + k)
+    """
+    if len(arr) <= 1:
+        return arr.copy()
+
+    value_range = max(arr) - min(arr) + 1
+    if value_range <= max(COUNTING_SORT_MAX_RANGE, len(arr)):
+        return counting_sort(arr, use_numpy)
+    return radix_sort(arr, use_numpy)
+
+
+def nsmallest(arr: List[int], k: int) -> List[int]:
+    """
+    k наименьших элементов в порядке возрастания.
+
+    Первые k элементов образуют кучу с максимумом в корне; каждый
+    следующий элемент, меньший корня, заменяет его. В конце куча
+    сортируется пирамидальной сортировкой.
+
+    Временная сложность: O(n log k)
+    Пространственная сложность: O(k)
+    """
+    if k <= 0:
+        return []
+    if k >= len(arr):
+        return intro_sort(arr)
+
+    heap = arr[:k]
+    for start in range(k // 2 - 1, -1, -1):
+        _sift_down(heap, 0, start, k)
+
+    for i in range(k, len(arr)):
+        if arr[i] < heap[0]:
+            heap[0] = arr[i]
+            _sift_down(heap, 0, 0, k)
+
+    _heap_sort_range(heap, 0, k - 1)
+    return heap
+
+
+def nlargest(arr: List[int], k: int) -> List[int]:
+    """
+    k наибольших элементов в порядке убывания.
+
+    Симметрично nsmallest, но с кучей с минимумом в корне.
+
+    Временная сложность: O(n log k)
+    Пространственная сложность: O(k)
+    """
+    if k <= 0:
+        return []
+    if k >= len(arr):
+        return intro_sort(arr)[::-1]
+
+    heap = arr[:k]
+    for start in range(k // 2 - 1, -1, -1):
+        _sift_down_min(heap, start, k)
+
+    for i in range(k, len(arr)):
+        if arr[i] > heap[0]:
+            heap[0] = arr[i]
+            _sift_down_min(heap, 0, k)
+
+    # Извлечение минимумов в конец дает порядок по убыванию.
+    for end in range(k - 1, 0, -1):
+        heap[0], heap[end] = heap[end], heap[0]
+        _sift_down_min(heap, 0, end)
+
+    return heap
+
+
+def _sift_down_min(array: List[int], root: int, size: int) -> None:
+    """Просеивание вниз в куче с минимумом в корне array[0..size-1]."""
+    value = array[root]
+
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and array[child + 1] < array[child]:
+            child += 1
+        if array[child] >= value:
+            break
+        array[root] = array[child]
+        root = child
+
+    array[root] = value
+
+
+def quickselect(arr: List[int], k: int) -> int:
+    """
+    k-я порядковая статистика (introselect).
+
+    Отрезок, содержащий позицию k, сужается разбиением Хоара, как
+    в intro_sort, но рекурсия идет только в одну часть. При превышении
+    глубины 2·log n оставшийся отрезок сортируется кучей.
+
+    Временная сложность:
+    - Худший случай: O(n log n)
+    - Средний случай: O(n)
+
+    Пространственная сложность: O(n) (работа на копии)
+
+    Args:
+        arr: Массив.
+        k: Номер элемента в отсортированном порядке (с нуля).
+
+    Returns:
+        Элемент, который стоял бы на позиции k после сортировки.
+    """
+    if not 0 <= k < len(arr):
+        raise IndexError("Selection index out of range")
+
+    array = arr.copy()
+    _select_range(array, 0, len(array) - 1, k)
+    return array[k]
+
+
+def _select_range(array: List[int], lo: int, hi: int, k: int) -> None:
+    """
+    Перестановка array[lo..hi] на месте так, что array[k] - k-й элемент,
+    слева от него не больше, справа - не меньше.
+    """
+    depth = 2 * max(1, hi - lo + 1).bit_length()
+
+    while hi - lo + 1 > INSERTION_SORT_CUTOFF:
+        if depth == 0:
+            _heap_sort_range(array, lo, hi)
+            return
+        depth -= 1
+
+        split = _hoare_partition(array, lo, hi)
+        if k <= split:
+            hi = split
+        else:
+            lo = split + 1
+
+    _insertion_sort_range(array, lo, hi)
+
+
+def partial_sort(arr: List[int], k: int) -> List[int]:
+    """
+    Частичная сортировка: первые k элементов результата - k наименьших
+    в порядке возрастания, остальные - в произвольном порядке.
+
+    Выборкой (_select_range) наименьшие k элементов собираются
+    в начале массива, затем сортируется только эта часть.
+
+    Временная сложность: O(n + k log k) в среднем
+    Пространственная сложность: O(n) (работа на копии)
+    """
+    array = arr.copy()
+    n = len(array)
+    k = min(max(k, 0), n)
+
+    if 0 < k < n:
+        _select_range(array, 0, n - 1, k - 1)
+    if k > 1:
+        _intro_sort_range(array, 0, k - 1, 2 * (k.bit_length() - 1))
+
+    return array
+
+
+INTEGER_KEY_ALGORITHMS = {'counting_sort', 'radix_sort', 'integer_sort'}
+
+
+def argsort(
+    arr: Sequence[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    algorithm: str = 'tim_sort'
+) -> typed_array:
+    """
+    Перестановка индексов, упорядочивающая arr (decorate-sort-undecorate).
+
+    Ключи вычисляются один раз, сортируются пары (ключ, индекс),
+    а сами записи не перемещаются. Индекс в паре разрешает равенство
+    ключей, поэтому результат устойчив при любом алгоритме, и сортировку
+    по нескольким столбцам можно собрать из argsort по каждому, начиная
+    с младшего:
+
+        order = argsort(rows, key=lambda r: r.minor)
+        by_major = argsort([rows[i] for i in order],
+                           key=lambda r: r.major)
+        order = array('q', (order[i] for i in by_major))
+
+    Для INTEGER_KEY_ALGORITHMS ключи должны быть целыми: пара кодируется
+    числом (ключ - min) * n + индекс. Для counting_sort это разумно
+    только при небольшом (max - min + 1) * n.
+
+    Временная сложность: как у выбранного алгоритма
+    Пространственная сложность: O(n) (ключи и индексы)
+
+    Args:
+        arr: Последовательность записей.
+        key: Функция ключа (по умолчанию - сама запись).
+        algorithm: Имя алгоритма из SORTING_ALGORITHMS.
+
+    Returns:
+        array('q') индексов: arr[result[0]], arr[result[1]], ...
+        идут в порядке возрастания ключей.
+    """
+    if algorithm not in SORTING_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    n = len(arr)
+    keys = [key(x) for x in arr] if key is not None else list(arr)
+    sort_func = SORTING_ALGORITHMS[algorithm]
+
+    if n <= 1:
+        return typed_array('q', range(n))
+
+    if algorithm in INTEGER_KEY_ALGORITHMS:
+        lo = min(keys)
+        encoded = sort_func([(k - lo) * n + i for i, k in enumerate(keys)])
+        return typed_array('q', (code % n for code in encoded))
+
+    decorated = sort_func([(k, i) for i, k in enumerate(keys)])
+    return typed_array('q', (i for _, i in decorated))
+
+
+def apply_permutation(
+    arr: MutableSequence[Any], permutation: Sequence[int]
+) -> None:
+    """
+    Перестановка arr на месте: arr[i] = исходный arr[permutation[i]].
+
+    Перестановка обходится по циклам, каждая запись перемещается
+    один раз. Пройденные позиции отмечаются в bytearray, сама
+    permutation не изменяется.
+
+    Временная сложность: O(n)
+    Пространственная сложность: O(n) бит-флагов (по байту на элемент)
+    """
+    n = len(arr)
+    if len(permutation) != n:
+        raise ValueError("Permutation length does not match sequence")
+
+    visited = bytearray(n)
+    for start in range(n):
+        if visited[start]:
+            continue
+
+        saved = arr[start]
+        j = start
+        while True:
+            visited[j] = 1
+            k = permutation[j]
+            if k == start:
+                arr[j] = saved
+                break
+            if visited[k]:
+                raise ValueError("Invalid permutation")
+            arr[j] = arr[k]
+            j = k
+
+
 def is_sorted(arr: List[int]) -> bool:
     """Проверяет, отсортирован ли массив."""
     return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
@@ -153,5 +1197,149 @@ SORTING_ALGORITHMS = {
     'selection_sort': selection_sort,
     'insertion_sort': insertion_sort,
     'merge_sort': merge_sort,
-    'quick_sort': quick_sort
+    'quick_sort': quick_sort,
+    'intro_sort': intro_sort,
+    'bottom_up_merge_sort': bottom_up_merge_sort,
+    'tim_sort': tim_sort,
+    'counting_sort': counting_sort,
+    'radix_sort': radix_sort,
+    'integer_sort': integer_sort
 }
+
+
+STABLE_ALGORITHMS = {
+    'bubble_sort', 'insertion_sort', 'merge_sort', 'bottom_up_merge_sort',
+    'tim_sort', 'counting_sort', 'radix_sort', 'integer_sort'
+}
+
+
+def sort_buffer(
+    data: Any, algorithm: str = 'intro_sort', inplace: bool = False
+) -> Any:
+    """
+    Сортировка списка, array.array, memoryview или массива NumPy.
+
+    Всегда выполняется запрошенный алгоритм:
+    - counting_sort, radix_sort и integer_sort на целочисленных
+      буферах (при установленном NumPy) работают векторизованно
+      поверх той же памяти (NUMPY_BUFFER_ALGORITHMS);
+    - intro_sort, insertion_sort и tim_sort сортируют сам буфер
+      на месте;
+    - остальные алгоритмы сортируют временный список и записывают
+      результат обратно в буфер.
+    При inplace=True сортируется буфер вызывающего кода без копии.
+
+    Args:
+        data: Сортируемые данные.
+        algorithm: Название алгоритма из SORTING_ALGORITHMS.
+        inplace: Сортировать сам буфер вместо копии.
+
+    Returns:
+        Отсортированный буфер (при inplace=True - сам data),
+        того же типа, что и data.
+    """
+    if algorithm not in SORTING_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    if isinstance(data, memoryview) and data.readonly and inplace:
+        raise TypeError("Cannot sort a read-only memoryview in place")
+
+    if not inplace:
+        data = _copy_buffer(data)
+
+    if len(data) > 1:
+        view = None
+        if algorithm in NUMPY_BUFFER_ALGORITHMS:
+            view = _numpy_view(data)
+        if view is not None:
+            _sort_numpy_inplace(view, algorithm)
+        else:
+            _sort_sequence_inplace(data, algorithm)
+
+    return data
+
+
+# Алгоритмы, которые sort_buffer выполняет векторизованно
+# на целочисленных буферах.
+NUMPY_BUFFER_ALGORITHMS = {'counting_sort', 'radix_sort', 'integer_sort'}
+
+
+def _copy_buffer(data: Any) -> Any:
+    """Копия буфера того же типа."""
+    if isinstance(data, memoryview):
+        return memoryview(bytearray(data.tobytes())).cast(data.format)
+    if hasattr(data, 'copy'):
+        return data.copy()
+    return data[:]
+
+
+def _numpy_view(data: Any) -> Any:
+    """
+    Представление NumPy поверх памяти буфера без копирования.
+
+    Returns:
+        Одномерный целочисленный ndarray или None, если NumPy
+        не установлен или буфер не подходит (например, список).
+    """
+    if isinstance(data, list) or not _numpy_available():
+        return None
+
+    import numpy as np
+
+    view = data if isinstance(data, np.ndarray) else np.asarray(
+        memoryview(data)
+    )
+    if view.ndim != 1 or view.dtype.kind not in 'iu':
+        return None
+    return view
+
+
+def _sort_numpy_inplace(view: Any, algorithm: str) -> None:
+    """
+    Векторизованная сортировка целочисленного ndarray на месте
+    (алгоритмы из NUMPY_BUFFER_ALGORITHMS).
+
+    Значения переводятся в смещения от минимума в uint64: вычитание
+    по модулю 2^64 дает точную разность для любого целого типа, в том
+    числе узкого (int8/int16) и uint64 со значениями от 2^63, а
+    обратное сложение и приведение к исходному типу восстанавливают
+    значения.
+    """
+    import numpy as np
+
+    lo = view.min().astype(np.uint64)
+    keys = view.astype(np.uint64) - lo
+    key_range = int(keys.max())
+
+    if algorithm == 'counting_sort' or (
+            algorithm == 'integer_sort' and
+            key_range < COUNTING_SORT_MAX_RANGE):
+        counts = np.bincount(keys.astype(np.intp))
+        keys = np.repeat(np.arange(len(counts), dtype=np.uint64), counts)
+    else:
+        for shift in range(0, key_range.bit_length(), RADIX_BITS):
+            digits = (
+                (keys >> np.uint64(shift)) & np.uint64(RADIX_MASK)
+            ).astype(np.uint8)
+            keys = keys[np.argsort(digits, kind='stable')]
+
+    view[:] = (keys + lo).astype(view.dtype)
+
+
+def _sort_sequence_inplace(data: Any, algorithm: str) -> None:
+    """Сортировка изменяемой последовательности на месте."""
+    n = len(data)
+
+    if algorithm == 'intro_sort':
+        _intro_sort_range(data, 0, n - 1, 2 * (n.bit_length() - 1))
+    elif algorithm == 'insertion_sort':
+        _insertion_sort_range(data, 0, n - 1)
+    elif algorithm == 'tim_sort':
+        _TimSort(data).sort()
+    else:
+        result = SORTING_ALGORITHMS[algorithm](list(data))
+        if isinstance(data, list):
+            data[:] = result
+        else:
+            for i, value in enumerate(result):
+                data[i] = value
@@ -0,0 +1,193 @@
+"""Модуль сортировок строк и байтовых строк.
+
+Сортировки сравнением многократно сравнивают общие префиксы ключей.
+Поразрядные сортировки этого модуля просматривают каждый символ
+ключа в основном один раз: на глубине d ключи распределяются
+по символу с номером d, а отрезки с одинаковым символом
+сортируются дальше начиная с символа d + 1.
+"""
+
+import os
+from typing import Callable, List, Sequence, TypeVar
+
+StringKey = TypeVar('StringKey', str, bytes)
+
+STRING_INSERTION_CUTOFF = 16
+BYTE_RADIX = 256
+
+
+def _char_function(
+    items: Sequence[StringKey]
+) -> Callable[[StringKey, int], int]:
+    """
+    Функция символа ключа на глубине d: код символа или -1,
+    если ключ короче d + 1 (конец строки меньше любого символа).
+    """
+    if items and isinstance(items[0], (bytes, bytearray)):
+        def char_at(key: bytes, d: int) -> int:
+            return key[d] if d < len(key) else -1
+    else:
+        def char_at(key: str, d: int) -> int:
+            return ord(key[d]) if d < len(key) else -1
+    return char_at
+
+
+def _insertion_sort_strings(
+    array: List[StringKey], lo: int, hi: int
+) -> None:
+    """
+    Сортировка вставками отрезка array[lo..hi].
+
+    На коротких отрезках сравнение строк целиком (memcmp в CPython)
+    быстрее дальнейшего распределения по символам.
+    """
+    for i in range(lo + 1, hi + 1):
+        key = array[i]
+        j = i - 1
+
+        while j >= lo and array[j] > key:
+            array[j + 1] = array[j]
+            j -= 1
+
+        array[j + 1] = key
+
+
+def _skip_common_prefix(
+    array: List[StringKey], lo: int, hi: int, d: int
+) -> int:
+    """
+    Глубина, с которой ключи array[lo..hi] начинают различаться.
+
+    Вызывается, когда у всех ключей отрезка совпал очередной символ:
+    тогда общий префикс, скорее всего, длинный. Он равен общему
+    префиксу минимального и максимального ключей, а min и max
+    вычисляются сравнением строк целиком, без разбора по символам.
+    """
+    segment = array[lo:hi + 1]
+    prefix = os.path.commonprefix([min(segment), max(segment)])
+    return max(d, len(prefix))
+
+
+def multikey_quicksort(arr: List[StringKey]) -> List[StringKey]:
+    """
+    Многоключевая быстрая сортировка (three-way radix quicksort).
+
+    Отрезок разбивается на три части по символу d опорного ключа:
+    меньше, равно и больше. Части «меньше» и «больше» сортируются
+    по тому же символу, а часть «равно» - по следующему, поэтому
+    общий префикс не сравнивается повторно. Короткие отрезки
+    досортировываются вставками.
+
+    Временная сложность: O(n log n + L) в среднем,
+    где L - суммарная длина различающих префиксов.
+    Пространственная сложность: O(n) (работа на копии)
+    """
+    array = arr.copy()
+    char_at = _char_function(array)
+    stack = [(0, len(array) - 1, 0)]
+
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo + 1 <= STRING_INSERTION_CUTOFF:
+            _insertion_sort_strings(array, lo, hi)
+            continue
+
+        mid = (lo + hi) // 2
+        a, b, c = (char_at(array[lo], d), char_at(array[mid], d),
+                   char_at(array[hi], d))
+        pivot = max(min(a, b), min(max(a, b), c))
+
+        lt, gt, i = lo, hi, lo
+        while i <= gt:
+            code = char_at(array[i], d)
+            if code < pivot:
+                array[lt], array[i] = array[i], array[lt]
+                lt += 1
+                i += 1
+            elif code > pivot:
+                array[i], array[gt] = array[gt], array[i]
+                gt -= 1
+            else:
+                i += 1
+
+        # array[lo..lt-1] < pivot = array[lt..gt] < array[gt+1..hi]
+        if lt == lo and gt == hi:
+            if pivot >= 0:
+                stack.append(
+                    (lo, hi, _skip_common_prefix(array, lo, hi, d + 1))
+                )
+            continue
+
+        stack.append((lo, lt - 1, d))
+        stack.append((gt + 1, hi, d))
+        if pivot >= 0:
+            stack.append((lt, gt, d + 1))
+
+    return array
+
+
+def msd_radix_sort(arr: List[StringKey]) -> List[StringKey]:
+    """
+    Поразрядная сортировка строк, начиная со старшего символа (MSD).
+
+    На каждом отрезке ключи распределяются подсчетом по символу d
+    во вспомогательный буфер; закончившиеся ключи идут первыми.
+    Алфавит - байты (256 символов). Строки str с символами за
+    пределами Latin-1 сортируются по кодировке UTF-8, которая
+    сохраняет порядок кодовых точек.
+
+    Временная сложность: O(L + n·R/cutoff), где L - суммарная длина
+    различающих префиксов, R - размер алфавита.
+    Пространственная сложность: O(n + R·глубина)
+    """
+    if arr and isinstance(arr[0], str) and any(
+            max(s, default='\0') > '\xff' for s in arr):
+        encoded = msd_radix_sort(
+            [s.encode('utf-8', 'surrogatepass') for s in arr]
+        )
+        return [s.decode('utf-8', 'surrogatepass') for s in encoded]
+
+    array = arr.copy()
+    aux = [None] * len(array)
+    char_at = _char_function(array)
+    stack = [(0, len(array) - 1, 0)]
+
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo + 1 <= STRING_INSERTION_CUTOFF:
+            _insertion_sort_strings(array, lo, hi)
+            continue
+
+        # count[c + 2] - количество ключей с символом c (c = -1 - конец).
+        count = [0] * (BYTE_RADIX + 2)
+        for i in range(lo, hi + 1):
+            count[char_at(array[i], d) + 2] += 1
+
+        first = char_at(array[lo], d)
+        if first >= 0 and count[first + 2] == hi - lo + 1:
+            stack.append((lo, hi, _skip_common_prefix(array, lo, hi, d + 1)))
+            continue
+
+        for r in range(BYTE_RADIX + 1):
+            count[r + 1] += count[r]
+
+        for i in range(lo, hi + 1):
+            code = char_at(array[i], d) + 1
+            aux[count[code]] = array[i]
+            count[code] += 1
+        array[lo:hi + 1] = aux[:hi - lo + 1]
+
+        # Теперь ключи с символом r занимают
+        # lo + count[r]..lo + count[r + 1] - 1, а закончившиеся ключи -
+        # lo..lo + count[0] - 1 и уже стоят на своих местах.
+        for r in range(BYTE_RADIX):
+            if count[r + 1] - count[r] > 1:
+                stack.append((lo + count[r], lo + count[r + 1] - 1, d + 1))
+
+    return array
+
+
+STRING_SORTING_ALGORITHMS = {
+    'multikey_quicksort': multikey_quicksort,
+    'msd_radix_sort': msd_radix_sort,
+}
@@ -1,5 +1,5 @@
 """Реализация хеш-таблицы с методом цепочек."""
-from typing import Any, List, Optional, Tuple
+from typing import Any, Iterator, List, Optional, Tuple
 
 
 class HashTableChaining:
@@ -22,6 +22,8 @@ class HashTableChaining:
         self.max_load_factor: float = max_load_factor
         self.table: List[List[Tuple[str, Any]]] = [[] for _ in range(size)]
         self.hash_func_name: str = hash_func
+        self._version: int = 0
+        self._resize_epoch: int = 0
 
         from hash_functions import get_hash_function
         self.hash_func = get_hash_function(hash_func)
@@ -40,6 +42,7 @@ class HashTableChaining:
             new_size += 1
 
         new_table = [[] for _ in range(new_size)]
+        self._resize_epoch += 1
 
         old_table = self.table
         self.table = new_table
@@ -94,6 +97,7 @@ class HashTableChaining:
 
         bucket.append((key, value))
         self.count += 1
+        self._version += 1
         self._resize()
 
     def search(self, key: str) -> Optional[Any]:
@@ -139,6 +143,7 @@ class HashTableChaining:
             if k == key:
                 del bucket[i]
                 self.count -= 1
+                self._version += 1
                 return True
         return False
 
@@ -157,6 +162,82 @@ class HashTableChaining:
         """Установка значения по ключу."""
         self.insert(key, value)
 
+    def __len__(self) -> int:
+        """Количество элементов в таблице."""
+        return self.count
+
+    def _iter_entries(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Ленивый обход пар (ключ, значение).
+
+        Если таблица изменяется во время обхода, следующий шаг
+        генератора выбрасывает RuntimeError, как у dict.
+        """
+        version = self._version
+        for bucket in self.table:
+            for entry in bucket:
+                yield entry
+                if self._version != version:
+                    raise RuntimeError(
+                        'Hash table changed size during iteration'
+                    )
+
+    def keys(self) -> Iterator[str]:
+        """Ленивый обход ключей."""
+        for key, _ in self._iter_entries():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Ленивый обход значений."""
+        for _, value in self._iter_entries():
+            yield value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Ленивый обход пар (ключ, значение)."""
+        return self._iter_entries()
+
+    def __iter__(self) -> Iterator[str]:
+        """Обход ключей таблицы."""
+        return self.keys()
+
+    def scan(
+        self, cursor: int = 0, count: int = 10
+    ) -> Tuple[int, List[Tuple[str, Any]]]:
+        """
+        Порционный обход в стиле Redis SCAN.
+
+        Между вызовами таблицу можно изменять. Элементы, присутствовавшие
+        в таблице в течение всего обхода, будут возвращены хотя бы
+        один раз; если между вызовами произошло расширение таблицы,
+        обход начинается заново, поэтому возможны повторы.
+
+        Args:
+            cursor: Курсор из предыдущего вызова (0 - начать обход).
+            count: Желаемое количество элементов в порции, положительное:
+                при count <= 0 курсор не продвигался бы.
+
+        Returns:
+            Новый курсор (0 - обход завершен) и порция пар.
+        """
+        if count <= 0:
+            raise ValueError('Count must be positive')
+        epoch, index = divmod(cursor, 1 << 32)
+        if epoch != self._resize_epoch:
+            index = 0
+
+        batch: List[Tuple[str, Any]] = []
+        visited = 0
+        while index < self.size and len(batch) < count:
+            batch.extend(self.table[index])
+            index += 1
+            visited += 1
+            if visited >= count * 10:
+                break
+
+        if index >= self.size:
+            return 0, batch
+        return (self._resize_epoch << 32) | index, batch
+
     def get_collision_stats(self) -> dict:
         """Статистика коллизий."""
         collisions = 0
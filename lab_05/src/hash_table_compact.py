@@ -0,0 +1,322 @@
+"""Реализация компактной хеш-таблицы с сохранением порядка вставки."""
+from array import array
+from typing import Any, Iterator, List, Optional, Tuple
+
+from hash_functions import polynomial_hash
+
+MERSENNE_61 = (1 << 61) - 1
+
+
+class HashTableCompact:
+    """
+    Компактная хеш-таблица (как dict в CPython 3.6+).
+
+    Данные разделены на два массива:
+    - разреженный индекс: небольшие целые числа (номер записи, EMPTY
+      или DUMMY), по которому ведется открытая адресация;
+    - плотный массив записей (хеш, ключ, значение) в порядке вставки.
+
+    Обход идет только по плотному массиву, поэтому его стоимость
+    зависит от количества элементов, а не от размера индекса.
+    При расширении перестраивается только индекс по сохраненным
+    хешам: ключи повторно не хешируются.
+    """
+
+    EMPTY = -1
+    DUMMY = -2
+    DELETED = object()
+
+    def __init__(
+        self, size: int = 8, max_load_factor: float = 2 / 3
+    ) -> None:
+        """
+        Инициализация хеш-таблицы.
+
+        Args:
+            size: Начальный размер индекса (округляется до степени 2).
+            max_load_factor: Максимальная доля занятых ячеек индекса.
+        """
+        self.max_load_factor: float = max_load_factor
+        self.count: int = 0
+        self.size: int = self._round_size(size)
+        self.indices: array = self._new_index(self.size)
+        self.entry_hashes: List[int] = []
+        self.entry_keys: List[Any] = []
+        self.entry_values: List[Any] = []
+        self._version: int = 0
+        self._resize_epoch: int = 0
+
+    @staticmethod
+    def _round_size(size: int) -> int:
+        """Ближайшая степень двойки, не меньшая size (минимум 8)."""
+        result = 8
+        while result < size:
+            result <<= 1
+        return result
+
+    @staticmethod
+    def _new_index(size: int) -> array:
+        """
+        Пустой индекс с минимально достаточным типом ячейки.
+
+        Номера записей меньше size, поэтому для таблиц до 128 ячеек
+        хватает одного байта на ячейку, до 32768 - двух.
+        """
+        if size <= 1 << 7:
+            typecode = 'b'
+        elif size <= 1 << 15:
+            typecode = 'h'
+        elif size <= 1 << 31:
+            typecode = 'i'
+        else:
+            typecode = 'q'
+        return array(typecode, [HashTableCompact.EMPTY]) * size
+
+    @staticmethod
+    def _full_hash(key: str) -> int:
+        """Полный хеш ключа, сохраняемый в записи."""
+        return polynomial_hash(key, MERSENNE_61)
+
+    def _lookup(self, key: str, key_hash: int) -> Tuple[int, int]:
+        """
+        Поиск ключа в индексе линейным пробированием.
+
+        Returns:
+            Пара (ячейка индекса, номер записи). Если ключ не найден,
+            номер записи равен EMPTY, а ячейка - первая свободная
+            (DUMMY или EMPTY) на пути пробирования.
+        """
+        mask = self.size - 1
+        slot = key_hash & mask
+        free_slot = -1
+
+        while True:
+            entry = self.indices[slot]
+            if entry == self.EMPTY:
+                return (slot if free_slot < 0 else free_slot), self.EMPTY
+            if entry == self.DUMMY:
+                if free_slot < 0:
+                    free_slot = slot
+            elif (self.entry_hashes[entry] == key_hash and
+                    self.entry_keys[entry] == key):
+                return slot, entry
+            slot = (slot + 1) & mask
+
+    def _rebuild_index(self, new_size: int) -> None:
+        """
+        Удаление пустых записей и перестроение индекса.
+
+        Используются сохраненные хеши, сами ключи не хешируются.
+        """
+        if len(self.entry_keys) != self.count:
+            live = [
+                i for i, key in enumerate(self.entry_keys)
+                if key is not self.DELETED
+            ]
+            self.entry_hashes = [self.entry_hashes[i] for i in live]
+            self.entry_keys = [self.entry_keys[i] for i in live]
+            self.entry_values = [self.entry_values[i] for i in live]
+
+        self.size = new_size
+        self.indices = self._new_index(new_size)
+        self._resize_epoch += 1
+        mask = new_size - 1
+
+        for entry, key_hash in enumerate(self.entry_hashes):
+            slot = key_hash & mask
+            while self.indices[slot] != self.EMPTY:
+                slot = (slot + 1) & mask
+            self.indices[slot] = entry
+
+    def _resize(self) -> None:
+        """Расширение индекса при превышении коэффициента заполнения."""
+        if len(self.entry_keys) < self.size * self.max_load_factor:
+            return
+        self._rebuild_index(self._round_size(self.count * 3))
+
+    @property
+    def load_factor(self) -> float:
+        """Коэффициент заполнения таблицы."""
+        return self.count / self.size
+
+    def insert(self, key: str, value: Any) -> None:
+        """
+        Вставка элемента в таблицу.
+
+        Args:
+            key: Ключ.
+            value: Значение.
+
+        Time Complexity:
+            Средний случай: O(1 / (1 - α)).
+            Худший случай: O(n).
+        """
+        key_hash = self._full_hash(key)
+        slot, entry = self._lookup(key, key_hash)
+
+        if entry != self.EMPTY:
+            self.entry_values[entry] = value
+            return
+
+        self.indices[slot] = len(self.entry_keys)
+        self.entry_hashes.append(key_hash)
+        self.entry_keys.append(key)
+        self.entry_values.append(value)
+        self.count += 1
+        self._version += 1
+        self._resize()
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск элемента по ключу.
+
+        Args:
+            key: Ключ для поиска.
+
+        Returns:
+            Значение или None, если ключ не найден.
+
+        Time Complexity:
+            Средний случай: O(1 / (1 - α)).
+            Худший случай: O(n).
+        """
+        _, entry = self._lookup(key, self._full_hash(key))
+        if entry == self.EMPTY:
+            return None
+        return self.entry_values[entry]
+
+    def delete(self, key: str) -> bool:
+        """
+        Удаление элемента по ключу.
+
+        Запись в плотном массиве помечается удаленной, а ячейка
+        индекса - DUMMY. Когда удаленных записей становится больше,
+        чем живых, массив уплотняется.
+
+        Args:
+            key: Ключ для удаления.
+
+        Returns:
+            True если элемент удален, False если не найден.
+
+        Time Complexity:
+            Средний случай: O(1 / (1 - α)).
+            Худший случай: O(n).
+        """
+        slot, entry = self._lookup(key, self._full_hash(key))
+        if entry == self.EMPTY:
+            return False
+
+        self.indices[slot] = self.DUMMY
+        self.entry_keys[entry] = self.DELETED
+        self.entry_values[entry] = None
+        self.count -= 1
+        self._version += 1
+
+        if len(self.entry_keys) - self.count > self.count:
+            self._rebuild_index(self._round_size(self.count * 3))
+
+        return True
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Пары (ключ, значение) в порядке вставки.
+
+        Если таблица изменяется во время обхода, следующий шаг
+        генератора выбрасывает RuntimeError, как у dict.
+        """
+        version = self._version
+        for key, value in zip(self.entry_keys, self.entry_values):
+            if key is self.DELETED:
+                continue
+            yield key, value
+            if self._version != version:
+                raise RuntimeError('Hash table changed size during iteration')
+
+    def keys(self) -> Iterator[str]:
+        """Ключи в порядке вставки."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Значения в порядке вставки ключей."""
+        for _, value in self.items():
+            yield value
+
+    def scan(
+        self, cursor: int = 0, count: int = 10
+    ) -> Tuple[int, List[Tuple[str, Any]]]:
+        """
+        Порционный обход в стиле Redis SCAN по плотному массиву.
+
+        Args:
+            cursor: Курсор из предыдущего вызова (0 - начать обход).
+            count: Количество просматриваемых записей, положительное:
+                при count <= 0 курсор не продвигался бы.
+
+        Returns:
+            Новый курсор (0 - обход завершен) и порция пар.
+        """
+        if count <= 0:
+            raise ValueError('Count must be positive')
+        epoch, position = divmod(cursor, 1 << 32)
+        if epoch != self._resize_epoch:
+            position = 0
+
+        end = min(position + count, len(self.entry_keys))
+        batch = [
+            (key, value) for key, value in zip(
+                self.entry_keys[position:end], self.entry_values[position:end]
+            )
+            if key is not self.DELETED
+        ]
+
+        if end >= len(self.entry_keys):
+            return 0, batch
+        return (self._resize_epoch << 32) | end, batch
+
+    def __iter__(self) -> Iterator[str]:
+        """Обход ключей в порядке вставки."""
+        return self.keys()
+
+    def __len__(self) -> int:
+        """Количество элементов в таблице."""
+        return self.count
+
+    def __contains__(self, key: str) -> bool:
+        """Проверка наличия ключа в таблице."""
+        return self.search(key) is not None
+
+    def __getitem__(self, key: str) -> Any:
+        """Получение значения по ключу."""
+        value = self.search(key)
+        if value is None:
+            raise KeyError(f'Key "{key}" not found')
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Установка значения по ключу."""
+        self.insert(key, value)
+
+    def get_collision_stats(self) -> dict:
+        """Статистика коллизий и расхода памяти."""
+        total_probes = 0
+        mask = self.size - 1
+
+        for entry, key in enumerate(self.entry_keys):
+            if key is self.DELETED:
+                continue
+            slot = self.entry_hashes[entry] & mask
+            probes = 1
+            while self.indices[slot] != entry:
+                slot = (slot + 1) & mask
+                probes += 1
+            total_probes += probes
+
+        return {
+            'avg_probes': total_probes / self.count if self.count else 0,
+            'load_factor': self.load_factor,
+            'index_bytes': self.indices.itemsize * len(self.indices),
+            'entries': len(self.entry_keys),
+            'deleted_count': len(self.entry_keys) - self.count
+        }
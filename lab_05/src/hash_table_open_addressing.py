@@ -1,5 +1,5 @@
 """Реализация хеш-таблицы с открытой адресацией."""
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 
 from hash_functions import djb2_hash, polynomial_hash
 
@@ -27,6 +27,8 @@ class HashTableOpenAddressing:
         self.max_load_factor: float = max_load_factor
         self.method: str = method
         self.table: List[Optional[Any]] = [None] * size
+        self._version: int = 0
+        self._resize_epoch: int = 0
 
     def _hash1(self, key: str) -> int:
         """Первая хеш-функция."""
@@ -68,6 +70,7 @@ class HashTableOpenAddressing:
             new_size += 1
 
         old_table = self.table
+        self._resize_epoch += 1
 
         self.table = [None] * new_size
         self.size = new_size
@@ -80,32 +83,42 @@ class HashTableOpenAddressing:
                 self._insert_direct(key, value)
 
     def _insert_direct(self, key: str, value: Any) -> None:
-        """Прямая вставка без проверки ресайза."""
+        """
+        Прямая вставка без проверки ресайза.
+
+        Первая удаленная ячейка запоминается, но проба продолжается
+        до ключа или пустой ячейки: ключ может лежать дальше в цепочке,
+        и запись в удаленную ячейку продублировала бы его.
+        """
+        first_deleted: Optional[int] = None
         i = 0
         while i < self.size:
             index = self._probe_sequence(key, i)
+            item = self.table[index]
 
-            is_empty_or_deleted = (
-                self.table[index] is None or
-                self.table[index] == self.DELETED
-            )
-            if is_empty_or_deleted:
-                self.table[index] = (key, value)
-                self.count += 1
-                return
+            if item is None:
+                break
 
-            is_same_key = (
-                isinstance(self.table[index], tuple) and
-                len(self.table[index]) == 2 and
-                self.table[index][0] == key
-            )
-            if is_same_key:
+            if item is self.DELETED:
+                if first_deleted is None:
+                    first_deleted = index
+            elif item[0] == key:
                 self.table[index] = (key, value)
                 return
 
             i += 1
-
-        raise RuntimeError('Hash table is full and resize did not happen')
+        else:
+            if first_deleted is None:
+                raise RuntimeError(
+                    'Hash table is full and resize did not happen'
+                )
+
+        if first_deleted is not None:
+            index = first_deleted
+            self.deleted_count -= 1
+        self.table[index] = (key, value)
+        self.count += 1
+        self._version += 1
 
     @staticmethod
     def _is_prime(n: int) -> bool:
@@ -211,6 +224,7 @@ class HashTableOpenAddressing:
                 self.table[index] = self.DELETED
                 self.count -= 1
                 self.deleted_count += 1
+                self._version += 1
 
                 if self.deleted_count > self.count:
                     self._resize()
@@ -236,6 +250,85 @@ class HashTableOpenAddressing:
         """Установка значения по ключу."""
         self.insert(key, value)
 
+    def __len__(self) -> int:
+        """Количество элементов в таблице."""
+        return self.count
+
+    def _iter_entries(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Ленивый обход пар (ключ, значение).
+
+        Если таблица изменяется во время обхода, следующий шаг
+        генератора выбрасывает RuntimeError, как у dict.
+        """
+        version = self._version
+        for item in self.table:
+            if item is None or item is self.DELETED:
+                continue
+            yield item
+            if self._version != version:
+                raise RuntimeError(
+                    'Hash table changed size during iteration'
+                )
+
+    def keys(self) -> Iterator[str]:
+        """Ленивый обход ключей."""
+        for key, _ in self._iter_entries():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Ленивый обход значений."""
+        for _, value in self._iter_entries():
+            yield value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Ленивый обход пар (ключ, значение)."""
+        return self._iter_entries()
+
+    def __iter__(self) -> Iterator[str]:
+        """Обход ключей таблицы."""
+        return self.keys()
+
+    def scan(
+        self, cursor: int = 0, count: int = 10
+    ) -> Tuple[int, List[Tuple[str, Any]]]:
+        """
+        Порционный обход в стиле Redis SCAN.
+
+        Между вызовами таблицу можно изменять. Элементы, присутствовавшие
+        в таблице в течение всего обхода, будут возвращены хотя бы
+        один раз; если между вызовами произошло расширение таблицы,
+        обход начинается заново, поэтому возможны повторы.
+
+        Args:
+            cursor: Курсор из предыдущего вызова (0 - начать обход).
+            count: Желаемое количество элементов в порции, положительное:
+                при count <= 0 курсор не продвигался бы.
+
+        Returns:
+            Новый курсор (0 - обход завершен) и порция пар.
+        """
+        if count <= 0:
+            raise ValueError('Count must be positive')
+        epoch, index = divmod(cursor, 1 << 32)
+        if epoch != self._resize_epoch:
+            index = 0
+
+        batch: List[Tuple[str, Any]] = []
+        visited = 0
+        while index < self.size and len(batch) < count:
+            item = self.table[index]
+            if item is not None and item is not self.DELETED:
+                batch.append(item)
+            index += 1
+            visited += 1
+            if visited >= count * 10:
+                break
+
+        if index >= self.size:
+            return 0, batch
+        return (self._resize_epoch << 32) | index, batch
+
     def get_collision_stats(self) -> dict:
         """Статистика коллизий."""
         total_probes = 0
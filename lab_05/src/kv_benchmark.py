@@ -0,0 +1,301 @@
+"""Асинхронный клиент и генератор нагрузки для key-value сервера."""
+import argparse
+import asyncio
+import multiprocessing
+import random
+import string
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from kv_server import (
+    HEADER, OP_DEL, OP_GET, OP_MGET, OP_SET, STATUS_ERROR, STATUS_OK,
+    KeyValueServer, create_table, encode_frame, pack_keys, pack_set,
+    unpack_values
+)
+
+
+class KeyValueClient:
+    """Клиент key-value сервера с поддержкой конвейера запросов."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(
+        cls, host: str = '127.0.0.1', port: int = 7070,
+        unix_path: Optional[str] = None
+    ) -> 'KeyValueClient':
+        """Подключение к серверу по TCP или через Unix-сокет."""
+        if unix_path is not None:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def close(self) -> None:
+        """Закрытие соединения."""
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def _read_response(self) -> Tuple[int, bytes]:
+        """Чтение одного кадра ответа."""
+        header = await self.reader.readexactly(HEADER.size)
+        status, length = HEADER.unpack(header)
+        payload = await self.reader.readexactly(length) if length else b''
+        if status == STATUS_ERROR:
+            raise RuntimeError(payload.decode('utf-8'))
+        return status, payload
+
+    async def pipeline(
+        self, frames: List[bytes]
+    ) -> List[Tuple[int, bytes]]:
+        """
+        Отправка пачки запросов без ожидания ответов.
+
+        Args:
+            frames: Закодированные кадры запросов.
+
+        Returns:
+            Пары (статус, тело) в порядке отправки запросов.
+        """
+        self.writer.write(b''.join(frames))
+        await self.writer.drain()
+        return [await self._read_response() for _ in frames]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Получение значения по ключу."""
+        (status, payload), = await self.pipeline(
+            [encode_frame(OP_GET, key.encode('utf-8'))]
+        )
+        return payload if status == STATUS_OK else None
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Установка значения по ключу."""
+        await self.pipeline([encode_frame(OP_SET, pack_set(key, value))])
+
+    async def delete(self, key: str) -> bool:
+        """Удаление ключа."""
+        (status, _), = await self.pipeline(
+            [encode_frame(OP_DEL, key.encode('utf-8'))]
+        )
+        return status == STATUS_OK
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Получение значений нескольких ключей одним запросом."""
+        (_, payload), = await self.pipeline(
+            [encode_frame(OP_MGET, pack_keys(keys))]
+        )
+        return unpack_values(payload)
+
+
+def random_keys(
+    count: int, rng: random.Random, length: int = 10
+) -> List[str]:
+    """Генерация списка случайных строковых ключей."""
+    chars = string.ascii_letters + string.digits
+    return [''.join(rng.choices(chars, k=length)) for _ in range(count)]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Перцентиль по отсортированной выборке (ближайший ранг)."""
+    if not sorted_values:
+        return 0.0
+    rank = int(round(q / 100 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+
+async def _client_worker(
+    client: KeyValueClient, keys: List[str], num_requests: int,
+    pipeline_depth: int, read_ratio: float, mget_size: int,
+    latencies: List[float], rng: random.Random
+) -> None:
+    """Отправка запросов одним клиентом пачками по pipeline_depth."""
+    value = b'x' * 32
+    sent = 0
+    while sent < num_requests:
+        batch = min(pipeline_depth, num_requests - sent)
+        frames = []
+        for _ in range(batch):
+            roll = rng.random()
+            if mget_size > 1 and roll < 0.1:
+                frames.append(encode_frame(
+                    OP_MGET, pack_keys(rng.sample(keys, mget_size))
+                ))
+            elif roll < read_ratio:
+                key = rng.choice(keys)
+                frames.append(encode_frame(OP_GET, key.encode('utf-8')))
+            elif roll < read_ratio + (1 - read_ratio) / 2:
+                key = rng.choice(keys)
+                frames.append(encode_frame(OP_SET, pack_set(key, value)))
+            else:
+                key = rng.choice(keys)
+                frames.append(encode_frame(OP_DEL, key.encode('utf-8')))
+
+        start = time.perf_counter()
+        await client.pipeline(frames)
+        elapsed = time.perf_counter() - start
+
+        # Задержка каждого запроса в пачке равна времени ожидания
+        # всей пачки: ответ на последний запрос приходит последним.
+        latencies.extend([elapsed] * batch)
+        sent += batch
+
+
+async def run_load(
+    host: str = '127.0.0.1', port: int = 7070,
+    unix_path: Optional[str] = None, num_clients: int = 8,
+    requests_per_client: int = 10000, pipeline_depth: int = 16,
+    num_keys: int = 10000, read_ratio: float = 0.8, mget_size: int = 8,
+    seed: int = 42
+) -> Dict[str, Any]:
+    """
+    Генерация нагрузки на сервер.
+
+    Args:
+        host: Адрес сервера.
+        port: Порт сервера.
+        unix_path: Путь к Unix-сокету (вместо TCP).
+        num_clients: Количество параллельных соединений.
+        requests_per_client: Количество запросов на соединение.
+        pipeline_depth: Количество запросов в одной пачке.
+        num_keys: Размер множества ключей.
+        read_ratio: Доля чтений среди запросов.
+        mget_size: Количество ключей в MGET (1 - без MGET).
+        seed: Зерно генератора случайных чисел.
+
+    Returns:
+        Словарь с пропускной способностью и перцентилями задержки.
+    """
+    rng = random.Random(seed)
+    keys = random_keys(num_keys, rng)
+
+    clients = [
+        await KeyValueClient.connect(host, port, unix_path)
+        for _ in range(num_clients)
+    ]
+
+    value = b'x' * 32
+    for start in range(0, num_keys, 256):
+        await clients[0].pipeline([
+            encode_frame(OP_SET, pack_set(key, value))
+            for key in keys[start:start + 256]
+        ])
+
+    latencies: List[float] = []
+    start_time = time.perf_counter()
+    await asyncio.gather(*(
+        _client_worker(
+            client, keys, requests_per_client, pipeline_depth,
+            read_ratio, mget_size, latencies,
+            random.Random(rng.random())
+        )
+        for client in clients
+    ))
+    total_time = time.perf_counter() - start_time
+
+    for client in clients:
+        await client.close()
+
+    latencies.sort()
+    total_requests = num_clients * requests_per_client
+    return {
+        'requests': total_requests,
+        'seconds': total_time,
+        'throughput': total_requests / total_time if total_time else 0.0,
+        'p50_us': percentile(latencies, 50) * 1e6,
+        'p90_us': percentile(latencies, 90) * 1e6,
+        'p99_us': percentile(latencies, 99) * 1e6,
+        'max_us': latencies[-1] * 1e6 if latencies else 0.0,
+    }
+
+
+def _serve_in_process(
+    table_type: str, method: str, host: str, port: int,
+    unix_path: Optional[str], ready: Any
+) -> None:
+    """Точка входа дочернего процесса с сервером."""
+    async def serve() -> None:
+        server = KeyValueServer(create_table(table_type, method=method))
+        aio_server = await server.start(host, port, unix_path)
+        ready.send(aio_server.sockets[0].getsockname())
+        async with aio_server:
+            await aio_server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def print_load_report(label: str, report: Dict[str, Any]) -> None:
+    """Вывод результатов нагрузочного теста."""
+    print(
+        f'{label:<28} {report["throughput"]:>12.0f} req/s  '
+        f'p50 {report["p50_us"]:>9.1f} мкс  '
+        f'p90 {report["p90_us"]:>9.1f} мкс  '
+        f'p99 {report["p99_us"]:>9.1f} мкс'
+    )
+
+
+def main() -> None:
+    """Запуск сервера в отдельном процессе и нагрузочного теста."""
+    parser = argparse.ArgumentParser(
+        description='Нагрузочный тест key-value сервера'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--unix', default=None, help='Путь к Unix-сокету')
+    parser.add_argument(
+        '--connect', action='store_true',
+        help='Подключиться к уже запущенному серверу'
+    )
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=10000)
+    parser.add_argument('--keys', type=int, default=10000)
+    parser.add_argument('--read-ratio', type=float, default=0.8)
+    parser.add_argument('--mget-size', type=int, default=8)
+    parser.add_argument(
+        '--pipeline', type=int, nargs='+', default=[1, 16, 64]
+    )
+    args = parser.parse_args()
+
+    configurations = [('chaining', 'linear'), ('open', 'linear'),
+                      ('open', 'double')]
+    if args.connect:
+        configurations = [('external', '')]
+
+    for table_type, method in configurations:
+        process = None
+        host, port = args.host, args.port
+        if not args.connect:
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve_in_process,
+                args=(table_type, method, args.host, args.port,
+                      args.unix, child_conn),
+                daemon=True
+            )
+            process.start()
+            address = parent_conn.recv()
+            if args.unix is None:
+                host, port = address[0], address[1]
+
+        print(f'\nТаблица: {table_type} {method}')
+        try:
+            for depth in args.pipeline:
+                report = asyncio.run(run_load(
+                    host, port, args.unix, args.clients, args.requests,
+                    depth, args.keys, args.read_ratio, args.mget_size
+                ))
+                print_load_report(f'pipeline={depth}', report)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+"""Асинхронный key-value сервер поверх хеш-таблиц.
+
+Протокол двоичный. Каждый запрос - заголовок из кода операции (1 байт)
+и длины тела (4 байта, big-endian), за которым следует тело. Ответ
+устроен так же, только вместо кода операции передается статус.
+Запросы одного соединения обрабатываются строго по порядку, поэтому
+клиент может отправлять их пачкой, не дожидаясь ответов (pipelining).
+"""
+import argparse
+import asyncio
+import struct
+from typing import List, Optional, Tuple, Union
+
+from hash_table_chaining import HashTableChaining
+from hash_table_open_addressing import HashTableOpenAddressing
+
+OP_GET = 1
+OP_SET = 2
+OP_DEL = 3
+OP_MGET = 4
+
+STATUS_OK = 0
+STATUS_NOT_FOUND = 1
+STATUS_ERROR = 2
+
+HEADER = struct.Struct('!BI')
+LENGTH = struct.Struct('!I')
+
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+HashTable = Union[HashTableChaining, HashTableOpenAddressing]
+
+
+class ProtocolError(Exception):
+    """Ошибка разбора кадра протокола."""
+
+
+def encode_frame(code: int, payload: bytes = b'') -> bytes:
+    """
+    Кодирование кадра протокола.
+
+    Args:
+        code: Код операции (для запроса) или статус (для ответа).
+        payload: Тело кадра.
+
+    Returns:
+        Кадр, готовый к отправке.
+    """
+    return HEADER.pack(code, len(payload)) + payload
+
+
+def pack_keys(keys: List[str]) -> bytes:
+    """Упаковка списка ключей: количество, затем (длина, ключ)."""
+    parts = [LENGTH.pack(len(keys))]
+    for key in keys:
+        raw = key.encode('utf-8')
+        parts.append(LENGTH.pack(len(raw)))
+        parts.append(raw)
+    return b''.join(parts)
+
+
+def unpack_keys(payload: bytes) -> List[str]:
+    """Распаковка списка ключей, упакованного pack_keys."""
+    if len(payload) < LENGTH.size:
+        raise ProtocolError('Truncated key list')
+    (count,) = LENGTH.unpack_from(payload, 0)
+    offset = LENGTH.size
+    keys = []
+    for _ in range(count):
+        if offset + LENGTH.size > len(payload):
+            raise ProtocolError('Truncated key list')
+        (length,) = LENGTH.unpack_from(payload, offset)
+        offset += LENGTH.size
+        if offset + length > len(payload):
+            raise ProtocolError('Truncated key list')
+        keys.append(payload[offset:offset + length].decode('utf-8'))
+        offset += length
+    return keys
+
+
+def pack_set(key: str, value: bytes) -> bytes:
+    """Упаковка тела SET: длина ключа, ключ, значение."""
+    raw = key.encode('utf-8')
+    return LENGTH.pack(len(raw)) + raw + value
+
+
+def unpack_set(payload: bytes) -> Tuple[str, bytes]:
+    """Распаковка тела SET."""
+    if len(payload) < LENGTH.size:
+        raise ProtocolError('Truncated SET payload')
+    (length,) = LENGTH.unpack_from(payload, 0)
+    end = LENGTH.size + length
+    if end > len(payload):
+        raise ProtocolError('Truncated SET payload')
+    return payload[LENGTH.size:end].decode('utf-8'), payload[end:]
+
+
+def pack_values(values: List[Optional[bytes]]) -> bytes:
+    """
+    Упаковка ответа MGET.
+
+    Для каждого ключа передается флаг наличия (1 байт), длина
+    и значение. Отсутствующие ключи кодируются флагом 0 и нулевой длиной.
+    """
+    parts = [LENGTH.pack(len(values))]
+    for value in values:
+        if value is None:
+            parts.append(b'\x00' + LENGTH.pack(0))
+        else:
+            parts.append(b'\x01' + LENGTH.pack(len(value)))
+            parts.append(value)
+    return b''.join(parts)
+
+
+def unpack_values(payload: bytes) -> List[Optional[bytes]]:
+    """Распаковка ответа MGET, упакованного pack_values."""
+    (count,) = LENGTH.unpack_from(payload, 0)
+    offset = LENGTH.size
+    values: List[Optional[bytes]] = []
+    for _ in range(count):
+        found = payload[offset]
+        (length,) = LENGTH.unpack_from(payload, offset + 1)
+        offset += 1 + LENGTH.size
+        if found:
+            values.append(payload[offset:offset + length])
+        else:
+            values.append(None)
+        offset += length
+    return values
+
+
+def create_table(
+    table_type: str = 'chaining', hash_func: str = 'polynomial',
+    method: str = 'linear', size: int = 101
+) -> HashTable:
+    """
+    Фабрика хранилища для сервера.
+
+    Args:
+        table_type: 'chaining' или 'open'.
+        hash_func: Хеш-функция для метода цепочек.
+        method: Метод проб для открытой адресации.
+        size: Начальный размер таблицы.
+
+    Returns:
+        Пустая хеш-таблица.
+    """
+    if table_type == 'chaining':
+        return HashTableChaining(size=size, hash_func=hash_func)
+    if table_type == 'open':
+        return HashTableOpenAddressing(
+            size=size, method=method, max_load_factor=0.75
+        )
+    raise ValueError(f'Unknown table type: {table_type}')
+
+
+class KeyValueServer:
+    """Key-value сервер, хранящий данные в хеш-таблице."""
+
+    def __init__(self, table: HashTable) -> None:
+        """
+        Инициализация сервера.
+
+        Args:
+            table: Хеш-таблица, в которой хранятся значения (bytes).
+        """
+        self.table: HashTable = table
+        self.requests_served: int = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def execute(self, opcode: int, payload: bytes) -> bytes:
+        """
+        Выполнение одного запроса.
+
+        Операции над таблицей синхронные и выполняются в потоке
+        цикла событий, поэтому дополнительная синхронизация не нужна.
+
+        Args:
+            opcode: Код операции.
+            payload: Тело запроса.
+
+        Returns:
+            Закодированный кадр ответа.
+        """
+        self.requests_served += 1
+        try:
+            if opcode == OP_GET:
+                value = self.table.search(payload.decode('utf-8'))
+                if value is None:
+                    return encode_frame(STATUS_NOT_FOUND)
+                return encode_frame(STATUS_OK, value)
+
+            if opcode == OP_SET:
+                key, value = unpack_set(payload)
+                self.table.insert(key, value)
+                return encode_frame(STATUS_OK)
+
+            if opcode == OP_DEL:
+                if self.table.delete(payload.decode('utf-8')):
+                    return encode_frame(STATUS_OK)
+                return encode_frame(STATUS_NOT_FOUND)
+
+            if opcode == OP_MGET:
+                keys = unpack_keys(payload)
+                values = [self.table.search(key) for key in keys]
+                return encode_frame(STATUS_OK, pack_values(values))
+
+            return encode_frame(
+                STATUS_ERROR, f'Unknown opcode: {opcode}'.encode('utf-8')
+            )
+        except (ProtocolError, UnicodeDecodeError, RuntimeError) as e:
+            return encode_frame(STATUS_ERROR, str(e).encode('utf-8'))
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Обработка соединения: чтение кадров и запись ответов по порядку."""
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+
+                opcode, length = HEADER.unpack(header)
+                if length > MAX_FRAME_SIZE:
+                    writer.write(encode_frame(
+                        STATUS_ERROR, b'Frame too large'
+                    ))
+                    break
+
+                payload = await reader.readexactly(length) if length else b''
+                writer.write(self.execute(opcode, payload))
+
+                # drain() ждет только при переполнении буфера записи,
+                # поэтому ответы на конвейер запросов уходят пачкой.
+                await writer.drain()
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionResetError:
+                pass
+
+    async def start(
+        self, host: str = '127.0.0.1', port: int = 7070,
+        unix_path: Optional[str] = None
+    ) -> asyncio.AbstractServer:
+        """
+        Запуск сервера на TCP-порту или Unix-сокете.
+
+        Args:
+            host: Адрес для TCP.
+            port: Порт для TCP (0 - выбрать свободный).
+            unix_path: Путь к Unix-сокету; если задан, TCP не используется.
+
+        Returns:
+            Запущенный asyncio-сервер.
+        """
+        if unix_path is not None:
+            self._server = await asyncio.start_unix_server(
+                self.handle_client, path=unix_path
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self.handle_client, host=host, port=port
+            )
+        return self._server
+
+    async def serve_forever(
+        self, host: str = '127.0.0.1', port: int = 7070,
+        unix_path: Optional[str] = None
+    ) -> None:
+        """Запуск сервера и обслуживание клиентов до остановки."""
+        server = await self.start(host, port, unix_path)
+        async with server:
+            await server.serve_forever()
+
+
+def main() -> None:
+    """Запуск сервера из командной строки."""
+    parser = argparse.ArgumentParser(
+        description='Key-value сервер поверх хеш-таблиц lab_05'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7070)
+    parser.add_argument('--unix', default=None, help='Путь к Unix-сокету')
+    parser.add_argument(
+        '--table', choices=['chaining', 'open'], default='chaining'
+    )
+    parser.add_argument('--hash-func', default='polynomial')
+    parser.add_argument(
+        '--method', choices=['linear', 'double'], default='linear'
+    )
+    args = parser.parse_args()
+
+    table = create_table(args.table, args.hash_func, args.method)
+    server = KeyValueServer(table)
+
+    where = args.unix if args.unix else f'{args.host}:{args.port}'
+    print(f'Key-value server ({args.table}) listening on {where}')
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,29 @@
-"""Проведение экспериментов и визуализация для хеш-таблиц."""
+"""Проведение экспериментов и визуализация для хеш-таблиц.
+
+matplotlib импортируется только в функциях отрисовки, которые
+выполняются в процессе render_figure; запуск, печатающий только
+таблицы, не тратит время на его загрузку.
+"""
+import argparse
+import os
 import random
 import string
+import sys
 import time
+from collections import defaultdict
+from statistics import fmean
 from typing import Any, Dict, List
 
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-
 from hash_table_chaining import HashTableChaining
+from hash_table_compact import HashTableCompact
 from hash_table_open_addressing import HashTableOpenAddressing
 from hash_functions import polynomial_hash, djb2_hash
 
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'
+))
+from render import render_figure, wait_for_renders  # noqa: E402
+
 
 def system_info() -> None:
     """Вывод информации о системе."""
@@ -68,6 +80,8 @@ def measure_performance(
                     size=initial_size, hash_func=hash_func,
                     max_load_factor=max_lf
                 )
+            elif table_type == 'compact':
+                table = HashTableCompact(size=initial_size)
             else:
                 table = HashTableOpenAddressing(
                     size=initial_size, method=method,
@@ -118,13 +132,13 @@ def measure_performance(
                     successful_deletes += 1
 
             results['insert_times'].append(
-                np.mean(insert_times) * 1e6 if insert_times else 0
+                fmean(insert_times) * 1e6 if insert_times else 0
             )
             results['search_times'].append(
-                np.mean(search_times) * 1e6 if search_times else 0
+                fmean(search_times) * 1e6 if search_times else 0
             )
             results['delete_times'].append(
-                np.mean(delete_times) * 1e6 if delete_times else 0
+                fmean(delete_times) * 1e6 if delete_times else 0
             )
 
             success_msg = (
@@ -143,6 +157,48 @@ def measure_performance(
     return results
 
 
+def measure_iteration(
+    num_keys: int = 1000, capacity: int = 100003, repeats: int = 20
+) -> Dict[str, float]:
+    """
+    Время полного обхода таблицы при низком коэффициенте заполнения.
+
+    Для открытой адресации обход идет по всем ячейкам таблицы,
+    для компактной - только по плотному массиву записей.
+
+    Returns:
+        Словарь {название: время одного обхода в микросекундах}.
+    """
+    keys = [generate_random_string() for _ in range(num_keys)]
+
+    open_table = HashTableOpenAddressing(size=capacity)
+    compact_table = HashTableCompact(size=capacity)
+    for i, key in enumerate(keys):
+        open_table.insert(key, i)
+        compact_table.insert(key, i)
+
+    def iterate_open() -> int:
+        return sum(1 for _ in open_table.items())
+
+    def iterate_compact() -> int:
+        return sum(1 for _ in compact_table.items())
+
+    results = {}
+    for label, func in [('open (items())', iterate_open),
+                        ('compact (items())', iterate_compact)]:
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            func()
+        elapsed = time.perf_counter() - start_time
+        results[label] = elapsed / repeats * 1e6
+
+    print(f'\nОбход {num_keys} ключей, размер таблицы {capacity}:')
+    for label, elapsed in results.items():
+        print(f'  {label}: {elapsed:.1f} мкс')
+
+    return results
+
+
 def calculate_probe_index(
     key: str, table_size: int, method: str, i: int
 ) -> int:
@@ -250,8 +306,16 @@ def run_collision_test(num_keys: int = 500) -> List[Dict[str, Any]]:
     return results
 
 
-def plot_performance_comparison():
-    """Построение графиков производительности."""
+def plot_performance_comparison(show: bool = False):
+    """
+    Замеры производительности и построение графиков.
+
+    Графики отрисовываются в фоне в performance_comparison.png
+    (см. render_figure), замеры возвращаются сразу.
+
+    Args:
+        show: Показать окно с графиками (при наличии дисплея).
+    """
     load_factors = [0.1, 0.3, 0.5, 0.7, 0.9]
 
     configurations = [
@@ -259,7 +323,8 @@ def plot_performance_comparison():
         ('chaining', 'polynomial', 'linear', 'Метод цепочек (polynomial)'),
         ('chaining', 'djb2', 'linear', 'Метод цепочек (djb2)'),
         ('open', 'polynomial', 'linear', 'Открытая адресация (linear)'),
-        ('open', 'polynomial', 'double', 'Открытая адресация (double)')
+        ('open', 'polynomial', 'double', 'Открытая адресация (double)'),
+        ('compact', 'polynomial', 'linear', 'Компактная таблица')
     ]
 
     all_results = {}
@@ -272,6 +337,20 @@ def plot_performance_comparison():
         )
         all_results[label] = results
 
+    render_figure(
+        'performance_comparison.png', _draw_performance_comparison,
+        load_factors, all_results, show=show
+    )
+
+    return all_results
+
+
+def _draw_performance_comparison(
+    load_factors: List[float], all_results: Dict[str, Dict[str, Any]]
+):
+    """Отрисовка графиков plot_performance_comparison."""
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(1, 3, figsize=(20, 6))
 
     colors = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6']
@@ -317,30 +396,38 @@ def plot_performance_comparison():
     axes[2].grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig('performance_comparison.png', dpi=300, bbox_inches='tight')
-    plt.show()
 
-    return all_results
 
+def visualize_histograms(results: List[Dict[str, Any]], show: bool = False):
+    """
+    Построение гистограмм коллизий.
+
+    Гистограммы отрисовываются в фоне в collisions_comparison.png.
+
+    Args:
+        results: Результаты run_collision_test.
+        show: Показать окно с гистограммами (при наличии дисплея).
+    """
+    render_figure(
+        'collisions_comparison.png', _draw_histograms, results, show=show
+    )
 
-def visualize_histograms(results: List[Dict[str, Any]]):
-    """Построение гистограмм коллизий."""
-    df = pd.DataFrame(results)
+
+def _draw_histograms(results: List[Dict[str, Any]]):
+    """Отрисовка гистограмм visualize_histograms."""
+    import matplotlib.pyplot as plt
 
     plt.style.use('seaborn-v0_8')
     colors = {'simple': '#ff6b6b', 'polynomial': '#4ecdc4', 'djb2': '#45b7d1'}
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
 
-    chain_data = df[df['method'] == 'chaining']
-    if not chain_data.empty:
-        collisions_by_hash = chain_data.groupby('hash_function')[
-            'total_collisions'
-        ].mean()
-        colors_list = [colors.get(h, 'gray') for h in collisions_by_hash.index]
+    collisions_by_hash = average_collisions(results, 'chaining')
+    if collisions_by_hash:
+        colors_list = [colors.get(h, 'gray') for h in collisions_by_hash]
 
         bars1 = ax1.bar(
-            collisions_by_hash.index, collisions_by_hash.values,
+            list(collisions_by_hash), list(collisions_by_hash.values()),
             color=colors_list, alpha=0.8, edgecolor='black'
         )
         ax1.set_title(
@@ -355,20 +442,17 @@ def visualize_histograms(results: List[Dict[str, Any]]):
             height = bar.get_height()
             ax1.text(
                 bar.get_x() + bar.get_width() / 2,
-                height + max(collisions_by_hash.values) * 0.01,
+                height + max(collisions_by_hash.values()) * 0.01,
                 f'{int(height)}', ha='center', va='bottom',
                 fontweight='bold'
             )
 
-    open_data = df[df['method'] == 'open_linear']
-    if not open_data.empty:
-        collisions_by_hash = open_data.groupby('hash_function')[
-            'total_collisions'
-        ].mean()
-        colors_list = [colors.get(h, 'gray') for h in collisions_by_hash.index]
+    collisions_by_hash = average_collisions(results, 'open_linear')
+    if collisions_by_hash:
+        colors_list = [colors.get(h, 'gray') for h in collisions_by_hash]
 
         bars2 = ax2.bar(
-            collisions_by_hash.index, collisions_by_hash.values,
+            list(collisions_by_hash), list(collisions_by_hash.values()),
             color=colors_list, alpha=0.8, edgecolor='black'
         )
         ax2.set_title(
@@ -383,14 +467,29 @@ def visualize_histograms(results: List[Dict[str, Any]]):
             height = bar.get_height()
             ax2.text(
                 bar.get_x() + bar.get_width() / 2,
-                height + max(collisions_by_hash.values) * 0.01,
+                height + max(collisions_by_hash.values()) * 0.01,
                 f'{int(height)}', ha='center', va='bottom',
                 fontweight='bold'
             )
 
     plt.tight_layout()
-    plt.savefig('collisions_comparison.png', dpi=300, bbox_inches='tight')
-    plt.show()
+
+
+def average_collisions(
+    results: List[Dict[str, Any]], method: str
+) -> Dict[str, float]:
+    """
+    Среднее число коллизий по хеш-функциям для метода method.
+
+    Returns:
+        Словарь хеш-функция -> среднее total_collisions,
+        упорядоченный по имени хеш-функции.
+    """
+    collisions = defaultdict(list)
+    for row in results:
+        if row['method'] == method:
+            collisions[row['hash_function']].append(row['total_collisions'])
+    return {name: fmean(collisions[name]) for name in sorted(collisions)}
 
 
 def print_comprehensive_analysis(
@@ -407,7 +506,8 @@ def print_comprehensive_analysis(
         best_avg_time = float('inf')
 
         for method_name, results in performance_results.items():
-            avg_time = np.mean(results[operation])
+            times = results[operation]
+            avg_time = fmean(times) if times else 0
             if 0 < avg_time < best_avg_time:
                 best_avg_time = avg_time
                 best_method = method_name
@@ -420,48 +520,52 @@ def print_comprehensive_analysis(
     print('\nАнализ коллизий:')
     print('-' * 50)
 
-    df = pd.DataFrame(collision_results)
-
     for method in ['chaining', 'open_linear']:
         method_name = ('Метод цепочек' if method == 'chaining'
                        else 'Открытая адресация')
-        method_data = df[df['method'] == method]
+        method_data = average_collisions(collision_results, method)
 
-        if not method_data.empty:
+        if method_data:
             print(f'\n{method_name}:')
             for hash_func in ['simple', 'polynomial', 'djb2']:
-                func_data = method_data[
-                    method_data['hash_function'] == hash_func
-                ]
-                if not func_data.empty:
-                    avg_collisions = func_data['total_collisions'].mean()
+                if hash_func in method_data:
+                    avg_collisions = method_data[hash_func]
                     print(f'  - {hash_func}: {avg_collisions:.0f} коллизий')
 
     print('\nАнализ хеш-функций:')
     print('-' * 50)
-    chain_data = df[df['method'] == 'chaining']
-    if not chain_data.empty:
-        hash_collisions = chain_data.groupby('hash_function')[
-            'total_collisions'
-        ].mean()
-        best_hash = hash_collisions.idxmin()
-        worst_hash = hash_collisions.idxmax()
+    hash_collisions = average_collisions(collision_results, 'chaining')
+    if hash_collisions:
+        best_hash = min(hash_collisions, key=hash_collisions.get)
+        worst_hash = max(hash_collisions, key=hash_collisions.get)
         print(f'Лучшая: {best_hash} (наименьшее количество коллизий)')
         print(f'Худшая: {worst_hash} (наибольшее количество коллизий)')
 
 
 def main():
     """Основная функция запуска анализа."""
+    parser = argparse.ArgumentParser(
+        description='Анализ производительности хеш-таблиц'
+    )
+    parser.add_argument(
+        '--show', action='store_true',
+        help='Показать графики в окне (иначе только сохранить в файлы)'
+    )
+    args = parser.parse_args()
+
     system_info()
 
-    performance_results = plot_performance_comparison()
+    performance_results = plot_performance_comparison(show=args.show)
 
     collision_results = run_collision_test()
 
-    visualize_histograms(collision_results)
+    visualize_histograms(collision_results, show=args.show)
+
+    measure_iteration()
 
     print_comprehensive_analysis(performance_results, collision_results)
 
+    wait_for_renders()
     print('\nРезультаты сохранены в файлах:')
     print('performance_comparison.png (графики производительности)')
     print('collisions_comparison.png (гистограммы коллизий)')
@@ -0,0 +1,340 @@
+"""Вероятностные структуры данных: Count-Min Sketch и HyperLogLog.
+
+Независимые хеш-функции строятся из polynomial_hash и djb2_hash:
+для каждого ключа считаются два базовых хеша по модулю простого
+Мерсенна 2^61 - 1, а i-я функция получается двойным хешированием
+h1 + i * h2 с последующим перемешиванием (splitmix64) и зерном.
+Счетчики хранятся в массивах NumPy, пакетные обновления векторизованы.
+"""
+import argparse
+import math
+import random
+import string
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from hash_functions import djb2_hash, polynomial_hash
+
+MERSENNE_61 = (1 << 61) - 1
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def base_hashes(keys: Iterable[str], seed: int = 0) -> np.ndarray:
+    """
+    Базовые хеши ключей.
+
+    Args:
+        keys: Строковые ключи (любой итерируемый объект, в том числе
+            генератор: ключи перебираются один раз).
+        seed: Зерно; меняет основание полиномиального хеша.
+
+    Returns:
+        Массив формы (2, n) из uint64: polynomial_hash и djb2_hash.
+    """
+    keys = list(keys)
+    base = 31 + 2 * seed
+    h1 = [polynomial_hash(key, MERSENNE_61, base) for key in keys]
+    h2 = [djb2_hash(key, MERSENNE_61) for key in keys]
+    return np.array([h1, h2], dtype=np.uint64).reshape(2, len(h1))
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Векторизованный финализатор splitmix64 (арифметика по модулю 2^64)."""
+    x = x + _GOLDEN
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+def derived_hashes(
+    hashes: np.ndarray, count: int, seed: int = 0
+) -> np.ndarray:
+    """
+    Семейство из count независимых 64-битных хешей.
+
+    Args:
+        hashes: Результат base_hashes.
+        count: Количество функций.
+        seed: Зерно семейства.
+
+    Returns:
+        Массив формы (count, n) из uint64.
+    """
+    h1, h2 = hashes[0], hashes[1] | np.uint64(1)
+    index = np.arange(count, dtype=np.uint64)[:, None]
+    with np.errstate(over='ignore'):
+        combined = h1[None, :] + index * h2[None, :]
+        return _splitmix64(combined ^ np.uint64(seed))
+
+
+class CountMinSketch:
+    """Count-Min Sketch для приближенной оценки частот."""
+
+    def __init__(self, width: int = 2048, depth: int = 5, seed: int = 0):
+        """
+        Инициализация скетча.
+
+        Оценка частоты превышает истинную не более чем на
+        e / width * N с вероятностью 1 - exp(-depth).
+
+        Args:
+            width: Количество счетчиков в строке.
+            depth: Количество строк (хеш-функций).
+            seed: Зерно семейства хеш-функций.
+        """
+        self.width: int = width
+        self.depth: int = depth
+        self.seed: int = seed
+        self.total: int = 0
+        self.counters: np.ndarray = np.zeros((depth, width), dtype=np.int64)
+        self._rows = np.arange(depth)[:, None]
+
+    @classmethod
+    def from_error(
+        cls, epsilon: float, delta: float, seed: int = 0
+    ) -> 'CountMinSketch':
+        """Скетч с погрешностью epsilon * N и вероятностью ошибки delta."""
+        width = int(math.ceil(math.e / epsilon))
+        depth = int(math.ceil(math.log(1 / delta)))
+        return cls(width, depth, seed)
+
+    def _columns(self, keys: Sequence[str]) -> np.ndarray:
+        """Индексы счетчиков формы (depth, n)."""
+        hashes = derived_hashes(
+            base_hashes(keys, self.seed), self.depth, self.seed
+        )
+        return (hashes % np.uint64(self.width)).astype(np.intp)
+
+    def add(self, key: str, count: int = 1) -> None:
+        """Увеличение частоты одного ключа."""
+        self.add_batch([key], count)
+
+    def add_batch(self, keys: Sequence[str], count: int = 1) -> None:
+        """
+        Пакетное обновление.
+
+        Args:
+            keys: Ключи (повторы допускаются).
+            count: Приращение для каждого ключа.
+        """
+        if len(keys) == 0:
+            return
+        columns = self._columns(keys)
+        rows = np.broadcast_to(self._rows, columns.shape)
+        np.add.at(self.counters, (rows, columns), count)
+        self.total += count * len(keys)
+
+    def estimate(self, key: str) -> int:
+        """Оценка частоты ключа (не меньше истинной)."""
+        return int(self.estimate_batch([key])[0])
+
+    def estimate_batch(self, keys: Sequence[str]) -> np.ndarray:
+        """Оценки частот для набора ключей."""
+        columns = self._columns(keys)
+        return self.counters[self._rows, columns].min(axis=0)
+
+    def merge(self, other: 'CountMinSketch') -> None:
+        """
+        Слияние со скетчем, построенным по другой части потока.
+
+        Скетчи должны иметь одинаковые размеры и зерно.
+        """
+        if (self.width, self.depth, self.seed) != (
+                other.width, other.depth, other.seed):
+            raise ValueError('Cannot merge sketches with different parameters')
+        self.counters += other.counters
+        self.total += other.total
+
+    @property
+    def memory_bytes(self) -> int:
+        """Объем памяти под счетчики."""
+        return self.counters.nbytes
+
+
+class HyperLogLog:
+    """HyperLogLog для приближенной оценки количества различных ключей."""
+
+    RANK_BITS = 50
+
+    def __init__(self, precision: int = 12, seed: int = 0):
+        """
+        Инициализация счетчика.
+
+        Относительная погрешность около 1.04 / sqrt(2^precision).
+
+        Args:
+            precision: Число бит индекса регистра (от 4 до 16).
+            seed: Зерно семейства хеш-функций.
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError('Precision must be between 4 and 16')
+
+        self.precision: int = precision
+        self.seed: int = seed
+        self.num_registers: int = 1 << precision
+        self.registers: np.ndarray = np.zeros(
+            self.num_registers, dtype=np.uint8
+        )
+
+    def _alpha(self) -> float:
+        """Поправочный коэффициент для m регистров."""
+        m = self.num_registers
+        if m == 16:
+            return 0.673
+        if m == 32:
+            return 0.697
+        if m == 64:
+            return 0.709
+        return 0.7213 / (1 + 1.079 / m)
+
+    def add(self, key: str) -> None:
+        """Добавление одного ключа."""
+        self.add_batch([key])
+
+    def add_batch(self, keys: Sequence[str]) -> None:
+        """
+        Пакетное добавление ключей.
+
+        Младшие precision бит хеша выбирают регистр, в него
+        записывается позиция первой единицы в следующих RANK_BITS битах.
+        """
+        if len(keys) == 0:
+            return
+        hashes = derived_hashes(base_hashes(keys, self.seed), 1, self.seed)[0]
+        index = (hashes & np.uint64(self.num_registers - 1)).astype(np.intp)
+        rest = (hashes >> np.uint64(self.precision)) & np.uint64(
+            (1 << self.RANK_BITS) - 1
+        )
+        # frexp дает bit_length без потери точности: rest < 2^53.
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (self.RANK_BITS - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self) -> int:
+        """Оценка количества различных ключей."""
+        m = self.num_registers
+        estimate = self._alpha() * m * m / np.sum(
+            np.ldexp(1.0, -self.registers.astype(np.int64))
+        )
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Слияние со счетчиком другой части потока (поэлементный максимум)."""
+        if (self.precision, self.seed) != (other.precision, other.seed):
+            raise ValueError('Cannot merge sketches with different parameters')
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Объем памяти под регистры."""
+        return self.registers.nbytes
+
+
+def generate_zipf_stream(
+    num_items: int, num_unique: int, exponent: float = 1.1, seed: int = 0
+) -> List[str]:
+    """Поток ключей с распределением Ципфа (частые и редкие ключи)."""
+    rng = random.Random(seed)
+    chars = string.ascii_letters + string.digits
+    vocabulary = [
+        ''.join(rng.choices(chars, k=10)) for _ in range(num_unique)
+    ]
+    weights = [1 / (rank + 1) ** exponent for rank in range(num_unique)]
+    return rng.choices(vocabulary, weights=weights, k=num_items)
+
+
+def benchmark_accuracy(
+    num_items: int = 200000, num_unique: int = 50000, seed: int = 0
+) -> Dict[str, List[Dict[str, float]]]:
+    """
+    Точность скетчей в зависимости от объема памяти.
+
+    Args:
+        num_items: Длина потока.
+        num_unique: Количество различных ключей.
+        seed: Зерно генерации потока.
+
+    Returns:
+        Словарь с результатами для 'count_min' и 'hyperloglog'.
+    """
+    stream = generate_zipf_stream(num_items, num_unique, seed=seed)
+
+    exact: Dict[str, int] = {}
+    for key in stream:
+        exact[key] = exact.get(key, 0) + 1
+    true_unique = len(exact)
+    sample = list(exact)[:2000]
+    true_counts = np.array([exact[key] for key in sample])
+
+    results: Dict[str, List[Dict[str, float]]] = {
+        'count_min': [], 'hyperloglog': []
+    }
+
+    for width in [256, 1024, 4096, 16384]:
+        sketch = CountMinSketch(width=width, depth=4, seed=seed)
+        half = len(stream) // 2
+        left = CountMinSketch(width=width, depth=4, seed=seed)
+        left.add_batch(stream[:half])
+        sketch.add_batch(stream[half:])
+        sketch.merge(left)
+
+        errors = sketch.estimate_batch(sample) - true_counts
+        results['count_min'].append({
+            'memory_bytes': sketch.memory_bytes,
+            'mean_abs_error': float(np.mean(errors)),
+            'max_abs_error': float(np.max(errors)),
+            'error_bound': math.e / width * num_items,
+        })
+
+    for precision in [6, 8, 10, 12, 14]:
+        hll = HyperLogLog(precision=precision, seed=seed)
+        hll.add_batch(stream)
+        estimate = hll.count()
+        results['hyperloglog'].append({
+            'memory_bytes': hll.memory_bytes,
+            'estimate': estimate,
+            'relative_error': abs(estimate - true_unique) / true_unique,
+            'expected_error': 1.04 / math.sqrt(1 << precision),
+        })
+
+    return results
+
+
+def main() -> None:
+    """Запуск бенчмарка точности скетчей."""
+    parser = argparse.ArgumentParser(
+        description='Точность Count-Min Sketch и HyperLogLog'
+    )
+    parser.add_argument('--items', type=int, default=200000)
+    parser.add_argument('--unique', type=int, default=50000)
+    args = parser.parse_args()
+
+    results = benchmark_accuracy(args.items, args.unique)
+
+    print('\nCount-Min Sketch (depth=4):')
+    print(f'{"Память (Б)":>12} {"Ср. ошибка":>12} '
+          f'{"Макс. ошибка":>14} {"Граница e/w*N":>14}')
+    for row in results['count_min']:
+        print(f'{row["memory_bytes"]:>12} {row["mean_abs_error"]:>12.1f} '
+              f'{row["max_abs_error"]:>14.0f} {row["error_bound"]:>14.1f}')
+
+    print('\nHyperLogLog:')
+    print(f'{"Память (Б)":>12} {"Оценка":>10} '
+          f'{"Отн. ошибка":>12} {"Ожидаемая":>10}')
+    for row in results['hyperloglog']:
+        print(f'{row["memory_bytes"]:>12} {row["estimate"]:>10} '
+              f'{row["relative_error"]:>12.4f} '
+              f'{row["expected_error"]:>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
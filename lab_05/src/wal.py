@@ -0,0 +1,452 @@
+"""Журнал упреждающей записи (WAL) для хеш-таблиц.
+
+Каждая операция insert/delete сначала дописывается в журнал и только
+потом применяется к таблице. При открытии журнал проигрывается заново,
+поэтому после сбоя теряются только изменения, не дошедшие до fsync.
+
+Формат записи: длина тела (4 байта), CRC32 тела (4 байта), тело.
+Тело: код операции (1 байт), длина ключа (4 байта), ключ в UTF-8,
+значение, сериализованное pickle (только для вставки).
+"""
+import argparse
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from hash_table_chaining import HashTableChaining
+from hash_table_open_addressing import HashTableOpenAddressing
+
+OP_INSERT = 1
+OP_DELETE = 2
+
+RECORD_HEADER = struct.Struct('!II')
+KEY_HEADER = struct.Struct('!BI')
+
+DURABILITY_LEVELS = ('op', 'batch', 'periodic')
+
+HashTable = Union[HashTableChaining, HashTableOpenAddressing]
+
+
+def encode_record(op: int, key: str, value: Any = None) -> bytes:
+    """
+    Кодирование одной записи журнала.
+
+    Args:
+        op: Код операции (OP_INSERT или OP_DELETE).
+        key: Ключ.
+        value: Значение (для вставки).
+
+    Returns:
+        Запись с заголовком и контрольной суммой.
+    """
+    raw_key = key.encode('utf-8')
+    body = KEY_HEADER.pack(op, len(raw_key)) + raw_key
+    if op == OP_INSERT:
+        body += pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def read_records(path: str) -> Tuple[List[Tuple[int, str, Any]], int]:
+    """
+    Чтение всех целых записей журнала.
+
+    Чтение останавливается на первой оборванной или поврежденной
+    записи: это хвост, не дописанный до сбоя.
+
+    Args:
+        path: Путь к файлу журнала.
+
+    Returns:
+        Список (операция, ключ, значение) и смещение конца последней
+        корректной записи.
+    """
+    records: List[Tuple[int, str, Any]] = []
+    if not os.path.exists(path):
+        return records, 0
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    offset = 0
+    while offset + RECORD_HEADER.size <= len(data):
+        length, crc = RECORD_HEADER.unpack_from(data, offset)
+        start = offset + RECORD_HEADER.size
+        body = data[start:start + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            break
+
+        op, key_length = KEY_HEADER.unpack_from(body, 0)
+        key_end = KEY_HEADER.size + key_length
+        key = body[KEY_HEADER.size:key_end].decode('utf-8')
+        value = pickle.loads(body[key_end:]) if op == OP_INSERT else None
+        records.append((op, key, value))
+        offset = start + length
+
+    return records, offset
+
+
+class WriteAheadLog:
+    """Журнал только на дозапись с групповым fsync."""
+
+    def __init__(
+        self, path: str, durability: str = 'batch', batch_size: int = 64,
+        interval: float = 0.05
+    ) -> None:
+        """
+        Открытие журнала на дозапись.
+
+        Args:
+            path: Путь к файлу журнала.
+            durability: Уровень надежности:
+                'op' - операция возвращается после fsync ее записи;
+                'batch' - fsync раз в batch_size записей;
+                'periodic' - fsync фоновым потоком раз в interval секунд.
+            batch_size: Размер группы для режима 'batch'.
+            interval: Период fsync для режима 'periodic'.
+        """
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f'Unknown durability level: {durability}')
+
+        self.path: str = path
+        self.durability: str = durability
+        self.batch_size: int = batch_size
+        self.interval: float = interval
+        self.fsync_count: int = 0
+
+        self._file = open(path, 'ab')
+        self._buffer: List[bytes] = []
+        self._appended_seq: int = 0
+        self._durable_seq: int = 0
+        self._syncing: bool = False
+        self._sync_error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._synced = threading.Condition(self._lock)
+        self._closed: bool = False
+
+        self._flusher: Optional[threading.Thread] = None
+        if durability == 'periodic':
+            self._flusher = threading.Thread(
+                target=self._periodic_sync, daemon=True
+            )
+            self._flusher.start()
+
+    def append(self, record: bytes) -> int:
+        """
+        Добавление записи в буфер журнала без ожидания fsync.
+
+        Returns:
+            Порядковый номер записи для последующего commit().
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Write-ahead log is closed')
+            if self._sync_error is not None:
+                raise self._sync_error
+            self._buffer.append(record)
+            self._appended_seq += 1
+            return self._appended_seq
+
+    def commit(self, seq: int) -> None:
+        """
+        Подтверждение записи seq согласно уровню надежности.
+
+        В режиме 'op' вызов ждет, пока запись не окажется на диске.
+        Если fsync уже выполняется другим потоком, запись попадает
+        в следующую группу: один fsync подтверждает сразу все записи,
+        накопившиеся за время предыдущего (group commit).
+        """
+        with self._lock:
+            if self.durability == 'op':
+                self._wait_durable(seq)
+            elif (self.durability == 'batch' and
+                    seq - self._durable_seq >= self.batch_size):
+                self._wait_durable(seq)
+
+    def _wait_durable(self, seq: int) -> None:
+        """
+        Ожидание fsync записи seq; вызывается под блокировкой.
+
+        Raises:
+            OSError: Если запись или fsync журнала завершились ошибкой
+                (в этом или другом потоке).
+        """
+        while self._durable_seq < seq:
+            if self._sync_error is not None:
+                raise self._sync_error
+            if self._syncing:
+                self._synced.wait()
+                continue
+            self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        """
+        Запись буфера и fsync; вызывается под блокировкой.
+
+        На время fsync блокировка отпускается, чтобы другие потоки
+        могли продолжать добавлять записи в следующую группу.
+
+        После ошибки записи или fsync неизвестно, какие записи дошли
+        до диска, поэтому ошибка запоминается: ожидающие потоки
+        пробуждаются и получают ее, как и все последующие вызовы.
+        """
+        if not self._buffer:
+            return
+
+        data = b''.join(self._buffer)
+        target = self._appended_seq
+        self._buffer = []
+        self._syncing = True
+
+        error: Optional[BaseException] = None
+        self._lock.release()
+        try:
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except BaseException as exc:
+            error = exc
+        self._lock.acquire()
+        self._syncing = False
+        self._synced.notify_all()
+
+        if error is not None:
+            self._sync_error = error
+            raise error
+
+        self.fsync_count += 1
+        self._durable_seq = target
+
+    def sync(self) -> None:
+        """Принудительный fsync всех добавленных записей."""
+        with self._lock:
+            self._wait_durable(self._appended_seq)
+
+    def _periodic_sync(self) -> None:
+        """Фоновый поток режима 'periodic'."""
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if self._closed or self._sync_error is not None:
+                    return
+                if not self._syncing:
+                    try:
+                        self._sync_locked()
+                    except Exception:
+                        # Ошибка сохранена в _sync_error и будет
+                        # выброшена в потоках, использующих журнал.
+                        return
+
+    def truncate(self) -> None:
+        """Очистка журнала (например, после сохранения снимка таблицы)."""
+        with self._lock:
+            self._wait_durable(self._appended_seq)
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Сброс буфера на диск и закрытие файла."""
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._wait_durable(self._appended_seq)
+            finally:
+                self._closed = True
+                self._file.close()
+
+        if self._flusher is not None:
+            self._flusher.join()
+
+
+class DurableHashTable:
+    """Хеш-таблица, изменения которой защищены журналом."""
+
+    def __init__(
+        self, path: str, table: Optional[HashTable] = None,
+        durability: str = 'batch', batch_size: int = 64,
+        interval: float = 0.05
+    ) -> None:
+        """
+        Открытие таблицы с проигрыванием журнала.
+
+        Запись в журнал и изменение таблицы выполняются под общей
+        блокировкой, поэтому порядок записей совпадает с порядком
+        применения. Ожидание fsync происходит уже вне ее.
+
+        Args:
+            path: Путь к файлу журнала.
+            table: Хеш-таблица для хранения данных (по умолчанию
+                HashTableChaining).
+            durability: Уровень надежности журнала.
+            batch_size: Размер группы для режима 'batch'.
+            interval: Период fsync для режима 'periodic'.
+        """
+        self.table: HashTable = (
+            table if table is not None else HashTableChaining()
+        )
+        self.replayed: int = self._replay(path)
+        self.wal = WriteAheadLog(path, durability, batch_size, interval)
+        self._apply_lock = threading.Lock()
+
+    def _replay(self, path: str) -> int:
+        """
+        Проигрывание журнала в таблицу.
+
+        Оборванный хвост журнала отрезается, чтобы новые записи
+        не оказались после поврежденной.
+
+        Returns:
+            Количество примененных записей.
+        """
+        records, valid_end = read_records(path)
+        for op, key, value in records:
+            if op == OP_INSERT:
+                self.table.insert(key, value)
+            else:
+                self.table.delete(key)
+
+        if os.path.exists(path) and os.path.getsize(path) > valid_end:
+            with open(path, 'r+b') as f:
+                f.truncate(valid_end)
+
+        return len(records)
+
+    def insert(self, key: str, value: Any) -> None:
+        """Вставка с записью в журнал."""
+        record = encode_record(OP_INSERT, key, value)
+        with self._apply_lock:
+            seq = self.wal.append(record)
+            self.table.insert(key, value)
+        self.wal.commit(seq)
+
+    def delete(self, key: str) -> bool:
+        """Удаление с записью в журнал."""
+        record = encode_record(OP_DELETE, key)
+        with self._apply_lock:
+            seq = self.wal.append(record)
+            deleted = self.table.delete(key)
+        self.wal.commit(seq)
+        return deleted
+
+    def search(self, key: str) -> Optional[Any]:
+        """Поиск (журнал не затрагивается)."""
+        return self.table.search(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Проверка наличия ключа в таблице."""
+        return key in self.table
+
+    def __getitem__(self, key: str) -> Any:
+        """Получение значения по ключу."""
+        return self.table[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Установка значения по ключу."""
+        self.insert(key, value)
+
+    def sync(self) -> None:
+        """Принудительный fsync журнала."""
+        self.wal.sync()
+
+    def close(self) -> None:
+        """Закрытие журнала."""
+        self.wal.close()
+
+
+def benchmark_durability(
+    num_operations: int = 2000, num_threads: int = 1,
+    batch_size: int = 64, interval: float = 0.05
+) -> Dict[str, Dict[str, float]]:
+    """
+    Пропускная способность изменений для каждого уровня надежности.
+
+    Args:
+        num_operations: Количество операций на поток.
+        num_threads: Количество пишущих потоков.
+        batch_size: Размер группы для режима 'batch'.
+        interval: Период fsync для режима 'periodic'.
+
+    Returns:
+        Словарь {уровень: {'ops_per_sec', 'fsyncs'}}.
+    """
+    results = {}
+    keys = [f'key_{i}' for i in range(num_operations)]
+
+    for durability in DURABILITY_LEVELS:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'table.wal')
+            table = DurableHashTable(
+                path, durability=durability, batch_size=batch_size,
+                interval=interval
+            )
+
+            def worker(thread_id: int) -> None:
+                for i, key in enumerate(keys):
+                    full_key = f'{thread_id}_{key}'
+                    if i % 4 == 3:
+                        table.delete(full_key)
+                    else:
+                        table.insert(full_key, f'value_{i}')
+
+            threads = [
+                threading.Thread(target=worker, args=(t,))
+                for t in range(num_threads)
+            ]
+            start_time = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            table.sync()
+            elapsed = time.perf_counter() - start_time
+            fsyncs = table.wal.fsync_count
+            table.close()
+
+            reopened = DurableHashTable(path)
+            if reopened.replayed != num_operations * num_threads:
+                raise RuntimeError(
+                    f'Replay mismatch for {durability}: '
+                    f'{reopened.replayed} records'
+                )
+            reopened.close()
+
+        results[durability] = {
+            'ops_per_sec': num_operations * num_threads / elapsed,
+            'fsyncs': fsyncs,
+        }
+
+    return results
+
+
+def main() -> None:
+    """Запуск бенчмарка уровней надежности."""
+    parser = argparse.ArgumentParser(
+        description='Пропускная способность WAL по уровням надежности'
+    )
+    parser.add_argument('--operations', type=int, default=2000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--interval', type=float, default=0.05)
+    args = parser.parse_args()
+
+    for num_threads in args.threads:
+        print(f'\nПотоков: {num_threads}')
+        print(f'{"Уровень":<10} {"Операций/с":>12} {"fsync":>8}')
+        results = benchmark_durability(
+            args.operations, num_threads, args.batch_size, args.interval
+        )
+        for durability, stats in results.items():
+            print(
+                f'{durability:<10} {stats["ops_per_sec"]:>12.0f} '
+                f'{stats["fsyncs"]:>8}'
+            )
+
+
+if __name__ == '__main__':
+    main()
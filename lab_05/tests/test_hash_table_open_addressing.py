@@ -0,0 +1,44 @@
+"""Проверка хеш-таблицы с открытой адресацией против dict."""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'src'
+))
+
+from hash_table_open_addressing import HashTableOpenAddressing  # noqa: E402
+
+
+@pytest.mark.parametrize('method', ['linear', 'double'])
+@pytest.mark.parametrize('seed', range(5))
+def test_random_insert_delete_matches_dict(method, seed):
+    """Случайные вставки и удаления: len, items и scan совпадают с dict."""
+    rng = random.Random(seed)
+    table = HashTableOpenAddressing(method=method)
+    reference = {}
+
+    for step in range(3000):
+        key = f'key{rng.randrange(200)}'
+        if rng.random() < 0.5:
+            table.insert(key, step)
+            reference[key] = step
+        else:
+            assert table.delete(key) == (key in reference)
+            reference.pop(key, None)
+
+    assert len(table) == len(reference)
+    assert dict(table.items()) == reference
+    assert sorted(table.keys()) == sorted(reference)
+
+    scanned = {}
+    cursor = 0
+    while True:
+        cursor, batch = table.scan(cursor, 7)
+        scanned.update(batch)
+        if cursor == 0:
+            break
+    assert scanned == reference